@@ -2,6 +2,7 @@ from flask import Flask
 from config import Config
 from pymysql import connect
 from .extensions import *
+from .json_provider import FastJSONProvider
 from .models import *
 from .routes.hr_routes import hr_bp, candidate_bp  
 from .routes.js_routes import js_bp 
@@ -9,6 +10,8 @@ from .routes.cv_routes import cv_bp
 from .routes.auth_routes import auth_bp
 from .routes.astra_routes import astra_bp
 from app.database.seed.seed_all import seed_all  
+from app.database.benchmarks import bench_candidate_lists
+from app.database.backfill import backfill_job_features, purge_analysis_cache
 from .routes.experience import experience_bp
 from .routes.skills import skills_bp
 from .routes.hr_routes import candidate_bp
@@ -16,6 +19,7 @@ from .routes.hr_routes import candidate_bp
 
 def create_app():
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     # app.config.from_object(Config) 
     # cors.init_app(app) # Mengaktifkan CORS untuk semua rute
     # CORS(app, resources={r"/api/*": {"origins": "http://localhost:3000"}})
@@ -26,7 +30,8 @@ def create_app():
         r"/api/*": {
             "origins": "http://localhost:3000",
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization", "Accept"],
+            "allow_headers": ["Content-Type", "Authorization", "Accept", "If-None-Match", "If-Modified-Since"],
+            "expose_headers": ["X-Next-Cursor", "ETag", "Last-Modified", "Content-Disposition"],
             # "supports_credentials": True
         }
     })
@@ -38,6 +43,7 @@ def create_app():
     migrate.init_app(app, db)
     jwt.init_app(app)
     bcrypt.init_app(app)
+    compress.init_app(app)
 
     app.register_blueprint(candidate_bp)
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
@@ -50,6 +56,9 @@ def create_app():
     
 
     app.cli.add_command(seed_all)
+    app.cli.add_command(bench_candidate_lists)
+    app.cli.add_command(backfill_job_features)
+    app.cli.add_command(purge_analysis_cache)
 
     return app
 
@@ -0,0 +1,190 @@
+import gzip
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # brotli opsional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard opsional
+    zstandard = None
+
+
+DEFAULT_MIMETYPES = [
+    "application/json",
+    "application/x-ndjson",
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "text/css",
+    "application/javascript",
+]
+
+
+def _gzip(data, level):
+    return gzip.compress(data, compresslevel=level)
+
+
+def _brotli(data, level):
+    # Level brotli 0-11; level 4-5 sebanding dengan gzip 6 dari sisi CPU
+    return brotli.compress(data, quality=min(level, 11))
+
+
+def _zstd(data, level):
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def available_encoders():
+    """Encoder yang bisa dipakai di environment ini: {content-encoding: fn(data, level)}."""
+    encoders = {"gzip": _gzip}
+    if brotli is not None:
+        encoders["br"] = _brotli
+    if zstandard is not None:
+        encoders["zstd"] = _zstd
+    return encoders
+
+
+class Compress:
+    """
+    Kompresi response (gzip, opsional brotli / zstd) sebagai after_request hook.
+    Dipasang di create_app lewat compress.init_app(app).
+
+    Response tidak dikompres kalau:
+    - ukurannya di bawah COMPRESS_MIN_SIZE,
+    - mimetype tidak ada di COMPRESS_MIMETYPES (PDF, gambar, dll sudah terkompres),
+    - response streaming / direct passthrough (export, send_file),
+    - sudah punya Content-Encoding, atau client tidak mengirim Accept-Encoding yang cocok.
+    """
+
+    def __init__(self, app=None):
+        self.encoders = available_encoders()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("COMPRESS_ENABLED", True)
+        app.config.setdefault("COMPRESS_MIN_SIZE", 1024)
+        app.config.setdefault("COMPRESS_MIMETYPES", DEFAULT_MIMETYPES)
+        app.config.setdefault("COMPRESS_ALGORITHMS", ["br", "zstd", "gzip"])
+        app.config.setdefault("COMPRESS_LEVELS", {"br": 4, "zstd": 3, "gzip": 6})
+
+        if app.config["COMPRESS_ENABLED"]:
+            app.after_request(self.after_request)
+
+    def choose_encoding(self, config):
+        """Algoritma pertama di COMPRESS_ALGORITHMS yang tersedia dan diterima client."""
+        accepted = request.accept_encodings
+        for name in config["COMPRESS_ALGORITHMS"]:
+            if name in self.encoders and accepted.quality(name) > 0:
+                return name
+        return None
+
+    def should_compress(self, response, config):
+        if request.method == "HEAD":
+            return False
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+        if response.is_streamed or response.direct_passthrough:
+            return False
+        if "Content-Encoding" in response.headers:
+            return False
+        if response.mimetype not in config["COMPRESS_MIMETYPES"]:
+            return False
+        length = response.calculate_content_length()
+        return length is not None and length >= config["COMPRESS_MIN_SIZE"]
+
+    def after_request(self, response):
+        from flask import current_app
+
+        config = current_app.config
+        if not self.should_compress(response, config):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = self.choose_encoding(config)
+        if encoding is None:
+            return response
+
+        level = config["COMPRESS_LEVELS"].get(encoding, 6)
+        compressed = self.encoders[encoding](response.get_data(), level)
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        response.headers["Content-Length"] = str(len(compressed))
+
+        # Representasi terkompres bukan byte-identik -> ETag jadi weak
+        etag, is_weak = response.get_etag()
+        if etag and not is_weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+def _benchmark():
+    """
+    python -m app.compression
+    Ukuran payload + waktu kompresi + estimasi waktu transfer untuk response tipikal.
+    """
+    import base64
+    import glob
+    import json
+    import os
+    import time
+
+    candidates = [
+        {
+            "id": f"3f6c2b1e-0000-4000-8000-{i:012d}",
+            "job_id": "9a1d7c44-1111-4000-8000-000000000001",
+            "original_filename": f"CV_Candidate_{i}.pdf",
+            "name": f"Candidate {i}",
+            "email": f"candidate{i}@example.com",
+            "phone": "+62812345678",
+            "match_score": round((i * 37) % 10000 / 100, 2),
+            "status": "passed_filter",
+            "rejection_reason": None,
+            "gpa": 3.45,
+            "total_experience": i % 12,
+            "uploaded_at": "2026-10-19T10:00:00",
+            "skills": ["Python", "SQL", "Apache Spark", "Airflow", "Docker"][: 2 + i % 4],
+        }
+        for i in range(500)
+    ]
+    search_results = [
+        {**c, "university": "S1 Teknik Informatika, Universitas Indonesia", "experience": [
+            "Data Engineer at PT Contoh (2021-2024)", "Data Analyst at PT Lain (2019-2021)"]}
+        for c in candidates[:200]
+    ]
+    payloads = {
+        "ranked list (50 rows)": json.dumps(candidates[:50]).encode(),
+        "ranked list (500 rows)": json.dumps(candidates).encode(),
+        "search results (200 rows)": json.dumps(search_results).encode(),
+    }
+
+    pdfs = glob.glob(os.path.join(os.path.dirname(__file__), "..", "test_cvs", "*.pdf"))
+    if pdfs:
+        with open(pdfs[0], "rb") as f:
+            pdf_b64 = base64.b64encode(f.read()).decode()
+        payloads["generate_custom (base64 PDF)"] = json.dumps(
+            {"status": "success", "pdf_base64": pdf_b64}
+        ).encode()
+
+    levels = {"br": 4, "zstd": 3, "gzip": 6}
+    bandwidth_bytes_per_ms = 10 * 1_000_000 / 8 / 1000  # 10 Mbit/s
+    encoders = available_encoders()
+
+    print(f"{'payload':<32} {'enc':<6} {'bytes':>10} {'ratio':>7} {'cpu ms':>8} {'total ms @10Mbps':>17}")
+    for label, data in payloads.items():
+        print(f"{label:<32} {'none':<6} {len(data):>10} {1.0:>7.2f} {0.0:>8.2f} "
+              f"{len(data) / bandwidth_bytes_per_ms:>17.1f}")
+        for name, fn in encoders.items():
+            started = time.perf_counter()
+            for _ in range(5):
+                out = fn(data, levels[name])
+            cpu_ms = (time.perf_counter() - started) * 1000 / 5
+            total_ms = cpu_ms + len(out) / bandwidth_bytes_per_ms
+            print(f"{'':<32} {name:<6} {len(out):>10} {len(data) / len(out):>7.2f} {cpu_ms:>8.2f} {total_ms:>17.1f}")
+
+
+if __name__ == "__main__":
+    _benchmark()
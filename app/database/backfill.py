@@ -0,0 +1,32 @@
+import click
+from flask.cli import with_appcontext
+
+from app.extensions import db
+from app.models import Job
+from app.services.job_features import is_fresh, refresh_job_features
+from app.services.analysis_cache import purge_expired
+
+
+@click.command("backfill-job-features")
+@click.option("--force", is_flag=True, help="Hitung ulang juga job yang fiturnya masih up-to-date.")
+@with_appcontext
+def backfill_job_features(force):
+    """Hitung dan simpan Job.jd_features (keywords, skills, education level) untuk job lama."""
+    updated = skipped = 0
+    for job in Job.query.order_by(Job.created_at).all():
+        if not force and is_fresh(job):
+            skipped += 1
+            continue
+        refresh_job_features(job, commit=False)
+        updated += 1
+        click.echo(f"   🔧 {job.job_title}: {len(job.jd_features['skills'])} skill, "
+                   f"{len(job.jd_features['keywords'])} keyword")
+    db.session.commit()
+    click.echo(f"✅ {updated} job diperbarui, {skipped} sudah up-to-date.")
+
+
+@click.command("purge-analysis-cache")
+@with_appcontext
+def purge_analysis_cache():
+    """Hapus hasil analisis Astra di analysis_cache yang sudah kedaluwarsa."""
+    click.echo(f"🧹 {purge_expired()} entry analysis_cache kedaluwarsa dihapus.")
@@ -0,0 +1,103 @@
+import json
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+import click
+from flask.cli import with_appcontext
+
+from app.extensions import db
+from app.models import Candidate, Job, User
+import app.databases as databases
+
+
+def _measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed_ms, peak / (1024 * 1024)
+
+
+def _seed_synthetic_job(n_candidates):
+    """Job + n kandidat sintetis di dalam transaksi yang nanti di-rollback."""
+    hr_user = User.query.filter_by(role="hr").first()
+    if not hr_user:
+        raise click.ClickException("Butuh minimal satu user HR (jalankan `flask seed-all` dulu).")
+
+    job = Job(hr_user_id=hr_user.id, job_title="[bench] Data Engineer")
+    db.session.add(job)
+    db.session.flush()
+
+    long_text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "job_id": job.id,
+            "original_filename": f"cv_{i}.pdf",
+            "name": f"Candidate {i}",
+            "email": f"candidate{i}@example.com",
+            "match_score": round((i * 37) % 10000 / 100, 2),
+            "gpa": 3.0,
+            "total_experience": i % 12,
+            "status": "passed_filter",
+            "education": "S1 Computer Science " + long_text,
+            "experience": json.dumps([f"Data Engineer at Company {i} (2020-2024)", long_text]),
+            "scoring_reason": long_text,
+            "uploaded_at": now - timedelta(seconds=i),
+        }
+        for i in range(n_candidates)
+    ]
+    db.session.execute(Candidate.__table__.insert(), rows)
+    db.session.flush()
+    return job.id
+
+
+@click.command("bench-candidate-lists")
+@click.option("--candidates", default=50000, show_default=True, help="Jumlah kandidat sintetis.")
+@click.option("--page-size", default=50, show_default=True)
+@with_appcontext
+def bench_candidate_lists(candidates, page_size):
+    """Bandingkan memory & latency list kandidat: full ORM entity vs lean projection."""
+    click.echo(f"⏱️  Seeding {candidates} kandidat sintetis (akan di-rollback)...")
+    job_id = _seed_synthetic_job(candidates)
+
+    try:
+        def full_orm():
+            db.session.expire_all()
+            rows = (
+                Candidate.query.filter_by(job_id=job_id, status="passed_filter")
+                .order_by(Candidate.match_score.desc())
+                .all()
+            )
+            return [databases.candidate_to_dict(c) for c in rows]
+
+        def lean_projection():
+            db.session.expire_all()
+            rows = (
+                db.session.query(*databases.CANDIDATE_LIST_COLUMNS)
+                .filter(Candidate.job_id == job_id, Candidate.status == "passed_filter")
+                .order_by(Candidate.match_score.desc())
+                .all()
+            )
+            skills = databases.get_skill_names_for_candidates([r.id for r in rows])
+            return [databases.candidate_row_to_dict(r, skills.get(r.id, [])) for r in rows]
+
+        def lean_page():
+            db.session.expire_all()
+            return databases.get_candidates_page_for_job(job_id, limit=page_size)
+
+        for label, fn in [
+            (f"full ORM, semua {candidates} baris", full_orm),
+            (f"lean projection, semua {candidates} baris", lean_projection),
+            (f"lean projection, 1 halaman ({page_size})", lean_page),
+        ]:
+            _, elapsed_ms, peak_mb = _measure(fn)
+            click.echo(f"   {label:<45} {elapsed_ms:>10.1f} ms   peak {peak_mb:>8.1f} MiB")
+    finally:
+        db.session.rollback()
+        click.echo("🧹 Data sintetis di-rollback.")
@@ -1,5 +1,7 @@
 from app.extensions import db
 from app.models import Skill
+from app.services.skill_dictionary import skill_key
+from app.services.skill_matcher import invalidate_vocabulary
 import uuid
 
 def seed():
@@ -79,14 +81,17 @@ def seed():
     ]
     count = 0
     for skill_name in skills:
-        existing = Skill.query.filter_by(skill_name=skill_name).first()
+        key = skill_key(skill_name)
+        existing = Skill.query.filter_by(normalized_key=key).first()
         if not existing:
             db.session.add(Skill(
                 id=str(uuid.uuid4()),
-                skill_name=skill_name
+                skill_name=skill_name,
+                normalized_key=key
             ))
             count += 1
 
     db.session.commit()
+    invalidate_vocabulary()
     print(f"✅ Seeded {count} new skills successfully!")
 
@@ -1,13 +1,117 @@
 from app.extensions import db
-from app.models import Job, Candidate, GeneratedCV, Skill, CandidateSkill, CV, Analysis, User
+from app.models import Job, Candidate, GeneratedCV, Skill, CandidateSkill, CV, Analysis, User, CandidateExperience
+from app.services.experience_parser import parse_experience_entry
+from app.services.skill_dictionary import SKILL_DICTIONARY
+from app.services.talent_search import SEARCH_CACHE
+from app.services.semantic_search import CANDIDATE_INDEX
+from app.services.leaderboard import LEADERBOARDS
+from app.services.term_stats import TERM_STATS
+from app.services.pagination import encode_cursor, decode_cursor
+from app.services.cache import LRUCache, MISSING
+from sqlalchemy import and_, or_, func, case
+from sqlalchemy.orm import joinedload
+from config import Config
+from datetime import datetime
+from decimal import Decimal
 import json
 
-def get_all_jobs():
-    """Ambil semua data pekerjaan, diubah ke dict."""
-    jobs = Job.query.order_by(Job.created_at.desc()).all()
-    return [job_to_dict(j) for j in jobs]
+# Hasil get_all_jobs di-cache sebentar; di-clear oleh invalidate_job_caches()
+JOB_LIST_CACHE = LRUCache(max_entries=4, ttl_seconds=Config.JOB_LIST_CACHE_TTL, name="job_list")
 
 
+def get_all_jobs(include_stats=False):
+    """
+    Ambil semua data pekerjaan, diubah ke dict.
+    include_stats=True -> tiap job ikut membawa statistik kandidat
+    (total, passed, rejected, avg/max match_score) dari SATU grouped LEFT JOIN.
+    """
+    cache_key = ("jobs", bool(include_stats))
+    cached = JOB_LIST_CACHE.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    if not include_stats:
+        jobs = Job.query.order_by(Job.created_at.desc()).all()
+        result = [job_to_dict(j) for j in jobs]
+    else:
+        rows = (
+            db.session.query(
+                Job,
+                func.count(Candidate.id).label("total"),
+                func.coalesce(func.sum(case((Candidate.status == "passed_filter", 1), else_=0)), 0).label("passed"),
+                func.coalesce(func.sum(case((Candidate.status == "rejected", 1), else_=0)), 0).label("rejected"),
+                func.avg(Candidate.match_score).label("avg_score"),
+                func.max(Candidate.match_score).label("max_score"),
+            )
+            .outerjoin(Candidate, Candidate.job_id == Job.id)
+            .group_by(Job.id)
+            .order_by(Job.created_at.desc())
+            .all()
+        )
+        result = []
+        for job, total, passed, rejected, avg_score, max_score in rows:
+            job_dict = job_to_dict(job)
+            job_dict["stats"] = {
+                "total_candidates": int(total),
+                "passed": int(passed),
+                "rejected": int(rejected),
+                "pass_rate": round(int(passed) / int(total) * 100, 2) if total else 0.0,
+                "avg_match_score": round(float(avg_score), 2) if avg_score is not None else None,
+                "max_match_score": float(max_score) if max_score is not None else None,
+            }
+            result.append(job_dict)
+
+    JOB_LIST_CACHE.set(cache_key, result)
+    return result
+
+
+def invalidate_job_caches():
+    """Dipanggil setelah job dibuat / diubah, atau kandidatnya berubah."""
+    JOB_LIST_CACHE.clear()
+
+
+
+def get_jobs_version():
+    """
+    Version stamp murah untuk daftar job (tanpa load semua baris):
+    jumlah job, perubahan terakhir, dan total candidates_version.
+    Return (etag_parts, last_modified).
+    """
+    count, last_created, last_updated, candidates_version = db.session.query(
+        func.count(Job.id),
+        func.max(Job.created_at),
+        func.max(Job.updated_at),
+        func.coalesce(func.sum(Job.candidates_version), 0),
+    ).one()
+
+    last_modified = max([d for d in (last_created, last_updated) if d is not None], default=None)
+    return (count, last_modified, int(candidates_version)), last_modified
+
+
+def get_job_candidates_version(job_id):
+    """Return (candidates_version, candidates_updated_at) sebuah job lewat lookup primary key."""
+    row = (
+        db.session.query(Job.candidates_version, Job.candidates_updated_at, Job.created_at)
+        .filter(Job.id == job_id)
+        .first()
+    )
+    if not row:
+        return 0, None
+    return row.candidates_version or 0, row.candidates_updated_at or row.created_at
+
+
+def bump_job_candidates_version(job_id):
+    """Naikkan candidates_version -> ETag daftar kandidat job ini berubah."""
+    try:
+        Job.query.filter_by(id=job_id).update({
+            Job.candidates_version: Job.candidates_version + 1,
+            Job.candidates_updated_at: datetime.utcnow(),
+        }, synchronize_session=False)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Database error in bump_job_candidates_version: {e}")
+
 
 def get_job_by_id(job_id):
     """
@@ -19,18 +123,134 @@ def get_job_by_id(job_id):
     return job # Mengembalikan objek, bukan job_to_dict(job)
 
 
-def get_all_candidates_for_job(job_id, filters={}):
+def _ranked_candidates_query(job_id, filters=None):
     """
-    Ambil semua kandidat untuk satu job yang statusnya 'passed_filter'.
-    [FIX] Menghapus filter GPA lama, karena filter itu terjadi di route
-    dan kolom 'structured_profile_json' sudah tidak ada.
+    Query kandidat 'passed_filter' untuk satu job (index ix_candidates_job_status_score).
+
+    Filter dijalankan di SQL:
+    - min_gpa           -> gpa >= x
+    - total_experience  -> total_experience >= x
+    - skills            -> "React,Python": kandidat harus punya SEMUA skill (EXISTS per skill)
+    Nilai filter yang tidak valid -> ValueError. Return None jika ada skill yang tidak dikenal.
     """
+    filters = filters or {}
     query = Candidate.query.filter_by(job_id=job_id, status='passed_filter')
-    
-    candidates = query.order_by(Candidate.match_score.desc()).all()
+
+    if filters.get('min_gpa'):
+        query = query.filter(Candidate.gpa >= float(filters['min_gpa']))
+
+    if filters.get('total_experience'):
+        query = query.filter(Candidate.total_experience >= int(filters['total_experience']))
+
+    if filters.get('skills'):
+        for skill_name in [s.strip() for s in filters['skills'].split(',') if s.strip()]:
+            skill_ids = SKILL_DICTIONARY.match_ids(skill_name)
+            if not skill_ids:
+                return None
+            query = query.filter(
+                db.session.query(CandidateSkill.id)
+                .filter(
+                    CandidateSkill.candidate_id == Candidate.id,
+                    CandidateSkill.skill_id.in_(skill_ids),
+                )
+                .exists()
+            )
+
+    return query
+
+
+def _keyset_after(column, last_value, last_id):
+    """
+    Kondisi "sesudah (last_value, last_id)" untuk ORDER BY column DESC, id DESC.
+    NULL dianggap paling kecil (posisi terakhir di urutan DESC pada MySQL).
+    """
+    if last_value is None:
+        return and_(column.is_(None), Candidate.id < last_id)
+    return or_(
+        column < last_value,
+        column.is_(None),
+        and_(column == last_value, Candidate.id < last_id),
+    )
+
+
+def get_all_candidates_for_job(job_id, filters=None):
+    """Ambil semua kandidat yang lolos filter untuk satu job, terurut match_score."""
+    query = _ranked_candidates_query(job_id, filters)
+    if query is None:
+        return []
+
+    candidates = query.order_by(Candidate.match_score.desc(), Candidate.id.desc()).all()
     return [candidate_to_dict(c) for c in candidates]
 
 
+def get_candidates_page_for_job(job_id, filters=None, limit=50, cursor=None):
+    """
+    Satu halaman ranked list (keyset pagination pada (match_score, id)).
+    Return (list kandidat, next_cursor atau None).
+    """
+    query = _ranked_candidates_query(job_id, filters)
+    if query is None:
+        return [], None
+
+    if cursor:
+        last = decode_cursor(cursor, required_keys=("match_score", "id"))
+        match_score = Decimal(last["match_score"]) if last["match_score"] is not None else None
+        query = query.filter(_keyset_after(Candidate.match_score, match_score, last["id"]))
+
+    # Projection: hanya kolom ringan, tanpa ORM entity / identity map
+    rows = (
+        query.with_entities(*CANDIDATE_LIST_COLUMNS)
+        .order_by(Candidate.match_score.desc(), Candidate.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor({"match_score": last.match_score, "id": last.id})
+
+    skills = get_skill_names_for_candidates([r.id for r in rows])
+    return [candidate_row_to_dict(r, skills.get(r.id, [])) for r in rows], next_cursor
+
+
+def get_candidates_page(limit=50, cursor=None):
+    """
+    Semua kandidat lintas job, terbaru dulu (keyset pagination pada (uploaded_at, id)).
+    Return (list kandidat, next_cursor atau None).
+    """
+    query = db.session.query(
+        Candidate.id, Candidate.name, Candidate.email,
+        Candidate.match_score, Candidate.status, Candidate.uploaded_at,
+    )
+    if cursor:
+        last = decode_cursor(cursor, required_keys=("uploaded_at", "id"))
+        uploaded_at = datetime.fromisoformat(last["uploaded_at"]) if last["uploaded_at"] else None
+        query = query.filter(_keyset_after(Candidate.uploaded_at, uploaded_at, last["id"]))
+
+    rows = (
+        query.order_by(Candidate.uploaded_at.desc(), Candidate.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor({"uploaded_at": last.uploaded_at, "id": last.id})
+
+    return [{
+        'id': r.id,
+        'name': r.name,
+        'email': r.email,
+        'match_score': float(r.match_score) if r.match_score is not None else None,
+        'status': r.status,
+        'uploaded_at': r.uploaded_at.isoformat() if r.uploaded_at else None
+    } for r in rows], next_cursor
+
+
 
 
 def save_generated_cv(original_cv_id: int, data: dict) -> int:
@@ -198,6 +418,64 @@ def job_to_dict(job: Job):
     }
 
 
+# Kolom yang dibutuhkan list kandidat. Kolom Text besar (experience, education,
+# scoring_reason) sengaja tidak ikut -> hanya di-load oleh endpoint detail.
+CANDIDATE_LIST_COLUMNS = (
+    Candidate.id,
+    Candidate.job_id,
+    Candidate.original_filename,
+    Candidate.name,
+    Candidate.email,
+    Candidate.phone,
+    Candidate.match_score,
+    Candidate.status,
+    Candidate.rejection_reason,
+    Candidate.gpa,
+    Candidate.total_experience,
+    Candidate.scoring_stage,
+    Candidate.skill_match_ratio,
+    Candidate.uploaded_at,
+)
+
+
+def get_skill_names_for_candidates(candidate_ids):
+    """Satu query untuk skill semua kandidat di satu halaman -> {candidate_id: [skill_name]}."""
+    skills = {}
+    if not candidate_ids:
+        return skills
+
+    rows = (
+        db.session.query(CandidateSkill.candidate_id, Skill.skill_name)
+        .join(Skill, Skill.id == CandidateSkill.skill_id)
+        .filter(CandidateSkill.candidate_id.in_(candidate_ids))
+        .all()
+    )
+    for candidate_id, skill_name in rows:
+        skills.setdefault(candidate_id, []).append(skill_name)
+    return skills
+
+
+def candidate_row_to_dict(row, skills=None):
+    """Versi ringan candidate_to_dict untuk hasil projection CANDIDATE_LIST_COLUMNS."""
+    return {
+        "id": row.id,
+        "job_id": row.job_id,
+        "original_filename": row.original_filename,
+        "name": row.name,
+        "email": row.email,
+        "phone": row.phone,
+        "match_score": float(row.match_score) if row.match_score is not None else 0.0,
+        "status": row.status,
+        "rejection_reason": row.rejection_reason,
+        "gpa": float(row.gpa) if row.gpa is not None else None,
+        "total_experience": row.total_experience,
+        "scoring_stage": row.scoring_stage,
+        "skill_match_ratio": float(row.skill_match_ratio) if row.skill_match_ratio is not None else None,
+        "uploaded_at": row.uploaded_at.isoformat() if row.uploaded_at else None,
+        "skills": skills or [],
+    }
+
+
 # Di databases.py
 
 def candidate_to_dict(c: Candidate):
@@ -232,33 +510,79 @@ def candidate_to_dict(c: Candidate):
         "skills": skills_list,
         "experience": experience_list,
         "total_experience": c.total_experience,
-        "scoring_reason": c.scoring_reason
+        "scoring_reason": c.scoring_reason,
+        "scoring_stage": c.scoring_stage,
+        "skill_match_ratio": float(c.skill_match_ratio) if c.skill_match_ratio is not None else None
     }
     
+# Detail kandidat sering dibuka bolak-balik oleh recruiter -> TTL cache kecil
+CANDIDATE_DETAIL_CACHE = LRUCache(
+    max_entries=Config.CANDIDATE_DETAIL_CACHE_MAX_ENTRIES,
+    ttl_seconds=Config.CANDIDATE_DETAIL_CACHE_TTL,
+    name="candidate_detail",
+)
+
+
+def get_candidate_by_id(candidate_id):
+    """
+    Detail lengkap satu kandidat: data kandidat, skills, experience terstruktur
+    dan scoring_reason. Skills + experiences di-load dalam SATU query (LEFT OUTER JOIN),
+    tanpa lazy load. Return None jika kandidat tidak ada.
+    """
+    cached = CANDIDATE_DETAIL_CACHE.get(candidate_id)
+    if cached is not MISSING:
+        return cached
+
+    candidate = (
+        Candidate.query
+        .options(
+            joinedload(Candidate.candidate_skills).joinedload(CandidateSkill.skill),
+            joinedload(Candidate.experiences),
+        )
+        .filter(Candidate.id == candidate_id)
+        .first()
+    )
+    if not candidate:
+        return None
+
+    detail = candidate_to_dict(candidate)
+    detail["uploaded_at"] = candidate.uploaded_at.isoformat() if candidate.uploaded_at else None
+    detail["skill_details"] = sorted(
+        (
+            {"id": cs.skill.id, "name": cs.skill.skill_name, "category": "General"}
+            for cs in candidate.candidate_skills if cs.skill
+        ),
+        key=lambda s: (s["name"] or "").lower(),
+    )
+    detail["experience_entries"] = [
+        {
+            "title": exp.title,
+            "company": exp.company,
+            "start_date": exp.start_date.isoformat() if exp.start_date else None,
+            "end_date": exp.end_date.isoformat() if exp.end_date else None,
+        }
+        # Terbaru dulu, yang masih bekerja (end_date NULL) paling atas
+        for exp in sorted(
+            candidate.experiences,
+            key=lambda e: (e.end_date is None, e.end_date or e.start_date or datetime.min.date()),
+            reverse=True,
+        )
+    ]
+
+    CANDIDATE_DETAIL_CACHE.set(candidate_id, detail)
+    return detail
+
+
 #  SKILLS
 def get_or_create_skill(skill_name):
-    """Fungsi helper untuk mencari skill atau membuatnya jika belum ada."""
-    if not skill_name:
+    """
+    Fungsi helper untuk mencari skill kanonik (termasuk alias, mis. "NodeJS" -> "Node.js")
+    atau membuatnya jika belum ada.
+    """
+    skill_id = SKILL_DICTIONARY.get_or_create(skill_name)
+    if not skill_id:
         return None
-        
-    skill_name_clean = skill_name.strip().title()
-    
-    # PERBAIKAN: Gunakan 'skill_name', bukan 'name'
-    skill = Skill.query.filter_by(skill_name=skill_name_clean).first()
-    
-    if skill:
-        return skill
-    else:
-        try:
-            # PERBAIKAN: Gunakan 'skill_name', bukan 'name'
-            skill = Skill(skill_name=skill_name_clean)
-            db.session.add(skill)
-            db.session.commit()
-            return skill
-        except Exception as e:
-            db.session.rollback()
-            print(f"Error get_or_create_skill: {e}")
-            return Skill.query.filter_by(skill_name=skill_name_clean).first()
+    return db.session.get(Skill, skill_id)
 
 # SAVE CANDIDATE
 def save_candidate(job_id, data):
@@ -288,36 +612,140 @@ def save_candidate(job_id, data):
         gpa=data.get('gpa'),
         total_experience=data.get('total_experience'),
         scoring_reason=data.get('scoring_reason'),
+        scoring_stage=data.get('scoring_stage'),
+        skill_match_ratio=data.get('skill_match_ratio'),
         experience=experience_json_string 
     )
+
+    # Versi ternormalisasi dari experience -> tabel candidate_experiences (untuk role search)
+    for entry in experience_list or []:
+        parsed = parse_experience_entry(str(entry)) if entry else None
+        if parsed and parsed["title"]:
+            new_candidate.experiences.append(CandidateExperience(**parsed))
     
+    # Skill kanonik di-resolve dulu: get_or_create bisa commit / rollback session sendiri,
+    # jadi tidak boleh berjalan saat kandidat baru masih pending di session
+    skill_ids = []
+    for skill_name in skill_strings or []:
+        skill_id = SKILL_DICTIONARY.get_or_create(skill_name)
+        if skill_id and skill_id not in skill_ids:
+            skill_ids.append(skill_id)
+
     try:
-        # Simpan kandidat dulu agar dapat ID
+        # Kandidat + link skills (satu link per skill kanonik) dalam satu commit
         db.session.add(new_candidate)
+        db.session.flush()
+        for skill_id in skill_ids:
+            db.session.add(CandidateSkill(candidate_id=new_candidate.id, skill_id=skill_id))
         db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Database error in save_candidate: {e}")
+        return None
 
-        # 3. Proses skills (setelah kandidat punya ID)
-        if skill_strings:
-            for skill_name in skill_strings:
-                skill_obj = get_or_create_skill(skill_name) 
-                if skill_obj:
-                    # PERBAIKAN: Buat objek relasi CandidateSkill
-                    new_link = CandidateSkill(
-                        candidate_id=new_candidate.id, 
-                        skill_id=skill_obj.id
-                    )
-                    db.session.add(new_link)
-            
-            # Commit lagi untuk menyimpan link skills
-            db.session.commit()
+    # Mulai sini kandidat sudah tersimpan: index / cache turunan yang gagal hanya dicatat,
+    # tidak membuat save dilaporkan gagal
+    candidate_id = new_candidate.id
+
+    # Teks CV -> korpus TF-IDF incremental job ini (local_score, lihat services.term_stats).
+    # Kandidat lolos filter tanpa skor -> match_score sementara = local_score (stage "local").
+    if data.get('cv_text'):
+        def apply_local_score():
+            local_score = TERM_STATS.add_document(job_id, candidate_id, data['cv_text'])
+            if local_score is not None and new_candidate.status == 'passed_filter' and new_candidate.match_score is None:
+                new_candidate.match_score = local_score
+                new_candidate.scoring_stage = 'local'
+                db.session.commit()
+        _after_save(candidate_id, "local score", apply_local_score)
+
+    _after_save(candidate_id, "candidates version", bump_job_candidates_version, job_id)
+    _after_save(candidate_id, "cache invalidation", invalidate_candidate_caches, candidate_id)
+    _after_save(
+        candidate_id, "leaderboard", LEADERBOARDS.on_candidate_saved,
+        job_id, candidate_id, new_candidate.status, new_candidate.match_score,
+    )
+    # Nama skill kanonik (sama dengan yang di-index build()), bukan string mentah dari parser
+    def index_candidate():
+        skill_names = dict(
+            db.session.query(Skill.id, Skill.skill_name).filter(Skill.id.in_(skill_ids)).all()
+        ) if skill_ids else {}
+        CANDIDATE_INDEX.add_candidate(
+            candidate_id, job_id, experience_json_string,
+            [skill_names[skill_id] for skill_id in skill_ids if skill_names.get(skill_id)],
+            new_candidate.education,
+        )
+    _after_save(candidate_id, "semantic index", index_candidate)
+    return candidate_id
+
+
+def _after_save(candidate_id, label, hook, *args):
+    """Jalankan satu hook turunan setelah kandidat tersimpan; error dicatat, bukan dilempar."""
+    try:
+        hook(*args)
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ save_candidate: {label} gagal untuk kandidat {candidate_id}: {e}")
 
-        return new_candidate.id
     
+def update_candidate_status(candidate_id, status, rejection_reason=None):
+    """Ubah status kandidat (processing / passed_filter / rejected)."""
+    candidate = Candidate.query.get(candidate_id)
+    if not candidate:
+        return None
+
+    try:
+        candidate.status = status
+        if status == 'rejected':
+            candidate.rejection_reason = rejection_reason
+        else:
+            candidate.rejection_reason = None
+        db.session.commit()
     except Exception as e:
         db.session.rollback()
-        print(f"Database error in save_candidate: {e}")
+        print(f"Database error in update_candidate_status: {e}")
         return None
-    
+
+    bump_job_candidates_version(candidate.job_id)
+    invalidate_candidate_caches(candidate.id)
+    LEADERBOARDS.on_candidate_saved(candidate.job_id, candidate.id, candidate.status, candidate.match_score)
+    return candidate_to_dict(candidate)
+
+
+def update_candidate_score(candidate_id, score, scoring_reason=None, scoring_stage=None):
+    """Ganti match_score kandidat (mis. hasil tahap LLM cascade scoring)."""
+    candidate = Candidate.query.get(candidate_id)
+    if not candidate:
+        return None
+
+    try:
+        candidate.match_score = score
+        candidate.scoring_reason = scoring_reason
+        candidate.scoring_stage = scoring_stage
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Database error in update_candidate_score: {e}")
+        return None
+
+    bump_job_candidates_version(candidate.job_id)
+    invalidate_candidate_caches(candidate.id)
+    LEADERBOARDS.on_candidate_saved(candidate.job_id, candidate.id, candidate.status, candidate.match_score)
+    return candidate_to_dict(candidate)
+
+
+def invalidate_candidate_caches(candidate_id=None):
+    """
+    Dipanggil setiap kali data kandidat berubah (save / status).
+    Bump generation agar hasil yang sudah di-cache tidak dipakai lagi.
+    Detail kandidat hanya di-invalidate untuk kandidat yang berubah.
+    """
+    SEARCH_CACHE.bump_generation()
+    invalidate_job_caches()
+    if candidate_id is None:
+        CANDIDATE_DETAIL_CACHE.clear()
+    else:
+        CANDIDATE_DETAIL_CACHE.invalidate(candidate_id)
+
 # simpan kandidat dari bulk upload
 # def save_candidate(job_id, data):
 #     """Simpan data kandidat ke database."""
@@ -4,6 +4,8 @@ from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
 from flask_cors import CORS
 
+from app.compression import Compress
+
 cors = CORS()
 
 db = SQLAlchemy()
@@ -13,3 +15,6 @@ migrate = Migrate()
 jwt = JWTManager()
 
 bcrypt = Bcrypt()
+
+# kompresi response (gzip / brotli / zstd)
+compress = Compress()
@@ -0,0 +1,162 @@
+import itertools
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson opsional, fallback ke json standar
+    orjson = None
+
+
+def _default(obj):
+    """Tipe yang sering keluar dari SQLAlchemy: Numeric (match_score, gpa), DateTime (uploaded_at)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider Flask berbasis orjson (jika ter-install).
+    Dipasang di create_app: app.json = FastJSONProvider(app).
+    """
+
+    # Urutan key tidak dipakai frontend, sorting hanya menambah CPU
+    sort_keys = False
+
+    def _orjson_options(self, pretty=False):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps_bytes(self, obj, pretty=False) -> bytes:
+        if orjson is None:
+            return json.dumps(
+                obj, default=_default, ensure_ascii=False, sort_keys=self.sort_keys,
+                indent=2 if pretty else None,
+            ).encode("utf-8")
+        return orjson.dumps(obj, default=_default, option=self._orjson_options(pretty))
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            kwargs.setdefault("default", _default)
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self.dumps_bytes(obj, pretty=pretty), mimetype=self.mimetype)
+
+
+_NO_ROWS = object()
+
+
+def _encode(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, ensure_ascii=False).encode("utf-8")
+
+
+def _iter_json_items(rows, chunk_size):
+    """Baris ter-encode dipisah koma, di-flush hanya di batas baris (tanpa kurung array)."""
+    buffer = bytearray()
+    first = True
+    try:
+        for row in rows:
+            if not first:
+                buffer += b","
+            buffer += _encode(row)
+            first = False
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+    except Exception:
+        # Baris yang sudah ter-encode tetap dikirim sebelum error diteruskan ke pemanggil
+        if buffer:
+            yield bytes(buffer)
+        raise
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_json_array(rows, chunk_size=64 * 1024):
+    """
+    Encode iterable baris menjadi JSON array secara bertahap.
+    Baris di-encode satu per satu dan dikirim per chunk (~64 KiB),
+    jadi memory tidak bergantung pada jumlah baris.
+    """
+    yield b"["
+    yield from _iter_json_items(rows, chunk_size)
+    yield b"]"
+
+
+def iter_ndjson(rows, chunk_size=64 * 1024):
+    """Sama seperti iter_json_array, tapi satu objek JSON per baris (NDJSON)."""
+    buffer = bytearray()
+    for row in rows:
+        buffer += _encode(row)
+        buffer += b"\n"
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def stream_json_array(rows, status=200, envelope=None, key="data"):
+    """
+    Response JSON streaming untuk endpoint list.
+
+    - envelope=None           -> body: [row, row, ...]
+    - envelope={"status": ..} -> body: {"<key>": [row, row, ...], "status": ..}
+
+    rows sebaiknya generator yang membaca langsung dari cursor DB (Query.yield_per).
+    Baris pertama diambil sebelum Response dibuat, jadi error saat query dieksekusi
+    masih dilempar di try/except pemanggil (-> response error biasa). Error setelah
+    header terkirim: dengan envelope, array ditutup dan envelope diakhiri
+    "status": "error" + "message"; tanpa envelope stream diputus (JSON tidak valid).
+    """
+    rows = iter(rows)
+    first = next(rows, _NO_ROWS)
+    if first is not _NO_ROWS:
+        rows = itertools.chain([first], rows)
+
+    def generate():
+        if envelope is None:
+            yield from iter_json_array(rows)
+            return
+
+        tail = dict(envelope)
+        yield b"{" + _encode(key) + b":["
+        try:
+            yield from _iter_json_items(rows, 64 * 1024)
+        except Exception as e:
+            print(f"⚠️ stream_json_array: error setelah response dimulai: {e}")
+            tail.update(status="error", message=str(e))
+        # '{"status":"success"}' -> ',"status":"success"}'
+        encoded = _encode(tail)
+        yield b"]" + (b"," + encoded[1:] if len(encoded) > 2 else b"}")
+
+    return Response(stream_with_context(generate()), status=status, mimetype="application/json")
@@ -6,7 +6,14 @@ from .cv import CV
 from .analysis import Analysis
 from .generated_cv import GeneratedCV
 from .skill import Skill
+from .skill_alias import SkillAlias
 from .candidate_skill import CandidateSkill
+from .candidate_experience import CandidateExperience
+from .job_leaderboard import JobLeaderboardEntry
+from .job_term_stats import JobTermStats
+from .job_term import JobTerm
+from .candidate_document import CandidateDocument
+from .analysis_cache import AnalysisCacheEntry
 
 # Export semua models
 __all__ = [
@@ -17,5 +24,12 @@ __all__ = [
     'Analysis',
     'GeneratedCV',
     'Skill',
-    'CandidateSkill'
+    'SkillAlias',
+    'CandidateSkill',
+    'CandidateExperience',
+    'JobLeaderboardEntry',
+    'JobTermStats',
+    'JobTerm',
+    'CandidateDocument',
+    'AnalysisCacheEntry'
 ]
@@ -0,0 +1,22 @@
+from app.extensions import db
+from datetime import datetime
+
+class AnalysisCacheEntry(db.Model):
+    """
+    Hasil AstraScoringService.analyze_cv yang bisa dipakai ulang (services.analysis_cache).
+    Key = hash(teks CV, JD, judul job, model, versi prompt); CV & JD yang sama tidak dianalisis ulang.
+    """
+    __tablename__ = "analysis_cache"
+
+    cache_key = db.Column(db.String(64), primary_key=True)
+    cv_text_hash = db.Column(db.String(64), nullable=False, index=True)
+    jd_hash = db.Column(db.String(64), nullable=False)
+    job_title = db.Column(db.String(255))
+    model = db.Column(db.String(100), nullable=False)
+    prompt_version = db.Column(db.String(50), nullable=False)
+    # Return value analyze_cv (skor_akhir, ai_analysis, job_info, engine)
+    result = db.Column(db.JSON, nullable=False)
+    hit_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_hit_at = db.Column(db.DateTime, nullable=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
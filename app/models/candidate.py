@@ -5,6 +5,12 @@ import uuid
 
 class Candidate(db.Model):
     __tablename__ = "candidates"
+    __table_args__ = (
+        # Ranked list per job: WHERE job_id = ? AND status = ? ORDER BY match_score DESC
+        db.Index("ix_candidates_job_status_score", "job_id", "status", "match_score"),
+        # Global list: ORDER BY uploaded_at DESC, id DESC
+        db.Index("ix_candidates_uploaded_at", "uploaded_at"),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     job_id = db.Column(db.String(36), db.ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
@@ -24,7 +30,13 @@ class Candidate(db.Model):
     status = db.Column(db.Enum("processing", "passed_filter", "rejected", name="candidate_status"), default="processing")
     rejection_reason = db.Column(db.String(255))
     scoring_reason = db.Column(db.Text, nullable=True)
+    # Tahap cascade scoring yang menghasilkan match_score: "local" (TF-IDF) atau "llm" (Gemini)
+    scoring_stage = db.Column(db.String(20), nullable=True)
+    # Persentase skill job (Job.jd_features["skills"]) yang ditemukan di teks CV, lihat services.skill_matcher
+    skill_match_ratio = db.Column(db.Numeric(5, 2), nullable=True)
 
     job = db.relationship("Job", back_populates="candidates")
     candidate_skills = db.relationship("CandidateSkill", back_populates="candidate")
+    experiences = db.relationship("CandidateExperience", back_populates="candidate", cascade="all, delete-orphan")
+    document = db.relationship("CandidateDocument", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
 
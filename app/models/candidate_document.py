@@ -0,0 +1,18 @@
+from app.extensions import db
+from sqlalchemy.dialects import mysql
+from datetime import datetime
+
+class CandidateDocument(db.Model):
+    """Teks CV hasil ekstraksi + term counts, supaya skor bisa dihitung ulang tanpa parsing PDF lagi."""
+    __tablename__ = "candidate_documents"
+
+    candidate_id = db.Column(db.String(36), db.ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    job_id = db.Column(db.String(36), db.ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    text = db.Column(db.Text().with_variant(mysql.MEDIUMTEXT(), "mysql"))
+    text_hash = db.Column(db.String(40), index=True)
+    # {term: frekuensi di CV}, hasil analyzer yang sama dengan TfidfVectorizer
+    term_counts = db.Column(db.JSON)
+    local_score = db.Column(db.Numeric(5, 2))
+    scored_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    candidate = db.relationship("Candidate", back_populates="document")
@@ -0,0 +1,16 @@
+from app.extensions import db
+import uuid
+
+class CandidateExperience(db.Model):
+    __tablename__ = "candidate_experiences"
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    candidate_id = db.Column(db.String(36), db.ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True)
+    title = db.Column(db.String(255))
+    # lowercase, tanpa tanda baca & kata seniority -> dipakai untuk role search / autocomplete
+    normalized_title = db.Column(db.String(255), index=True)
+    company = db.Column(db.String(255))
+    start_date = db.Column(db.Date, nullable=True)
+    end_date = db.Column(db.Date, nullable=True)  # NULL = masih bekerja (present)
+
+    candidate = db.relationship("Candidate", back_populates="experiences")
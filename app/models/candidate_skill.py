@@ -3,6 +3,9 @@ import uuid
 
 class CandidateSkill(db.Model):
     __tablename__ = "candidate_skills"
+    __table_args__ = (
+        db.UniqueConstraint("candidate_id", "skill_id", name="uq_candidate_skills_candidate_skill"),
+    )
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     candidate_id = db.Column(db.String(36), db.ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
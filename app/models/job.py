@@ -15,7 +15,16 @@ class Job(db.Model):
     max_experience = db.Column(db.Integer)
     degree_requirements = db.Column(db.String(100))
     requirements_json = db.Column(db.JSON)
+    # Fitur JD yang sudah dihitung (keywords, skills, education level), lihat services.job_features
+    jd_features = db.Column(db.JSON, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Version stamp daftar kandidat, dinaikkan setiap save_candidate / perubahan status.
+    # Dipakai sebagai ETag untuk /api/hr/jobs/<id>/candidates.
+    candidates_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    candidates_updated_at = db.Column(db.DateTime, nullable=True)
 
     hr_user = db.relationship("User", back_populates="jobs")
-    candidates = db.relationship("Candidate", back_populates="job", cascade="all, delete-orphan")
\ No newline at end of file
+    candidates = db.relationship("Candidate", back_populates="job", cascade="all, delete-orphan")
+    term_stats = db.relationship("JobTermStats", back_populates="job", uselist=False, cascade="all, delete-orphan")
\ No newline at end of file
@@ -0,0 +1,18 @@
+from app.extensions import db
+from datetime import datetime
+import uuid
+
+class JobLeaderboardEntry(db.Model):
+    """Snapshot top-N kandidat per job (diisi oleh services.leaderboard)."""
+    __tablename__ = "job_leaderboard_entries"
+    __table_args__ = (
+        db.UniqueConstraint("job_id", "candidate_id", name="uq_job_leaderboard_job_candidate"),
+        db.Index("ix_job_leaderboard_job_rank", "job_id", "rank"),
+    )
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    job_id = db.Column(db.String(36), db.ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    candidate_id = db.Column(db.String(36), db.ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
+    rank = db.Column(db.Integer, nullable=False)
+    match_score = db.Column(db.Numeric(5, 2))
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
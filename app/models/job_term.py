@@ -0,0 +1,12 @@
+from app.extensions import db
+
+class JobTerm(db.Model):
+    """Vocabulary + document frequency satu job: satu baris per (job, term)."""
+    __tablename__ = "job_terms"
+
+    job_id = db.Column(db.String(36), db.ForeignKey("job_term_stats.job_id", ondelete="CASCADE"), primary_key=True)
+    # collation biner: "resume" dan "résumé" tetap term yang berbeda
+    term = db.Column(db.String(100, collation="utf8mb4_bin"), primary_key=True)
+    doc_frequency = db.Column(db.Integer, nullable=False, default=0)
+
+    stats = db.relationship("JobTermStats", back_populates="terms")
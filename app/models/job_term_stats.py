@@ -0,0 +1,22 @@
+from app.extensions import db
+from datetime import datetime
+
+class JobTermStats(db.Model):
+    """
+    Statistik korpus per job untuk scoring TF-IDF incremental (services.term_stats).
+    JD dihitung sebagai dokumen pertama, setiap CV baru menambah doc_count.
+    Document frequency per term ada di tabel job_terms (JobTerm).
+    """
+    __tablename__ = "job_term_stats"
+
+    job_id = db.Column(db.String(36), db.ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    doc_count = db.Column(db.Integer, nullable=False, default=0)
+    # Hash teks JD saat statistik dibangun -> reset kalau JD berubah
+    job_text_hash = db.Column(db.String(40))
+    # IDF term-term JD saat re-normalisasi terakhir, pembanding untuk drift
+    idf_snapshot = db.Column(db.JSON, nullable=True)
+    normalized_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    job = db.relationship("Job", back_populates="term_stats")
+    terms = db.relationship("JobTerm", back_populates="stats", cascade="all, delete-orphan", passive_deletes=True)
@@ -6,5 +6,8 @@ class Skill(db.Model):
 
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     skill_name = db.Column(db.String(255))
+    # key kanonik (lihat skill_dictionary.skill_key), unik -> "Node.js" / "NodeJS" / "node js" satu baris
+    normalized_key = db.Column(db.String(255), unique=True, index=True)
 
-    candidate_skills = db.relationship("CandidateSkill", back_populates="skill")
\ No newline at end of file
+    candidate_skills = db.relationship("CandidateSkill", back_populates="skill")
+    aliases = db.relationship("SkillAlias", back_populates="skill", cascade="all, delete-orphan")
@@ -0,0 +1,11 @@
+from app.extensions import db
+import uuid
+
+class SkillAlias(db.Model):
+    __tablename__ = "skill_aliases"
+
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    alias_key = db.Column(db.String(255), unique=True, index=True, nullable=False)
+    skill_id = db.Column(db.String(36), db.ForeignKey("skills.id", ondelete="CASCADE"), nullable=False)
+
+    skill = db.relationship("Skill", back_populates="aliases")
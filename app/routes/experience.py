@@ -1,8 +1,9 @@
 # backend-cv-analyzer/app/routes/experience.py
 from flask import Blueprint, request, jsonify
-from app.models import Candidate
+from app.models import CandidateExperience
 from app.extensions import db
-from sqlalchemy import func, distinct
+from app.services.experience_parser import normalize_title, escape_like
+from sqlalchemy import func
 
 experience_bp = Blueprint('experience', __name__)
 
@@ -14,31 +15,29 @@ def autocomplete_experience():
         return jsonify({'data': []})
     
     try:
-        # Cari job titles/experience yang mengandung query (case insensitive)
+        # Prefix lookup ke index candidate_experiences.normalized_title
+        prefix = normalize_title(query) or query
         experiences = (
             db.session.query(
-                distinct(func.lower(Candidate.experience)).label('experience')
+                CandidateExperience.normalized_title,
+                func.min(CandidateExperience.title).label('title')
             )
-            .filter(func.lower(Candidate.experience).like(f"%{query}%"))
+            .filter(CandidateExperience.normalized_title.like(f"{escape_like(prefix)}%"))
+            .group_by(CandidateExperience.normalized_title)
+            .order_by(CandidateExperience.normalized_title)
             .limit(10)
             .all()
         )
         
-        # Extract job titles dari experience field
         results = []
         for exp in experiences:
-            if exp.experience:
-                # Coba extract job title dari experience string
-                experience_text = exp.experience.lower()
-                if query in experience_text:
-                    # Ambil bagian yang relevan (sekitar query)
-                    results.append({
-                        "id": len(results),  # Simple ID
-                        "name": exp.experience[:100]  # Batasi panjang
-                    })
+            results.append({
+                "id": len(results),  # Simple ID
+                "name": exp.title
+            })
         
         return jsonify({'data': results})
         
     except Exception as e:
         print(f"Error in autocomplete_experience: {e}")
-        return jsonify({'data': []})
\ No newline at end of file
+        return jsonify({'data': []})
@@ -1,6 +1,6 @@
 # filename: backend-cv-analyzer/app/routes/hr_routes.py
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from werkzeug.utils import secure_filename
 from flask_jwt_extended import (
     jwt_required,
@@ -18,7 +18,19 @@ from app.services.ai_analyzer import parse_candidate_info, calculate_match_score
 from app.models import Candidate, CandidateSkill, Skill
 from app.extensions import db
 import app.databases as databases
-from app.services.talent_search import search_candidates
+from app.services.talent_search import search_candidates, search_candidates_with_facets, search_cache_stats
+from app.services.semantic_search import semantic_search, CANDIDATE_INDEX
+from app.services.pagination import page_size
+from app.services.leaderboard import LEADERBOARDS
+from app.services.http_cache import make_etag, conditional_response
+from app.services.candidate_export import EXPORT_FORMATS, export_stream
+from app.json_provider import stream_json_array
+from app.services.cascade_scoring import start_llm_stage
+from app.services.job_features import get_job_features, education_rank, refresh_job_features
+from app.services.rescoring import start_rescore, get_progress
+from app.services.llm_budget import budget_stats
+from app.services.skill_matcher import match_job_skills
+from config import Config
 
 candidate_bp = Blueprint('candidate', __name__, url_prefix='/api/candidates')
 hr_bp = Blueprint('hr_api', __name__, url_prefix='/api/hr')
@@ -89,16 +101,20 @@ def get_candidate_skills(candidate_id):
 
 @candidate_bp.route('/', methods=['GET'])
 def get_all_candidates():
+    """
+    Semua kandidat, terbaru dulu. Keyset pagination: ?limit=50&cursor=<X-Next-Cursor sebelumnya>.
+    Cursor halaman berikutnya dikirim lewat header X-Next-Cursor (kosong = halaman terakhir).
+    """
     try:
-        candidates = Candidate.query.all()
-        return jsonify([{
-            'id': candidate.id,
-            'name': candidate.name,
-            'email': candidate.email,
-            'match_score': candidate.match_score,
-            'status': candidate.status,
-            'uploaded_at': candidate.uploaded_at.isoformat() if candidate.uploaded_at else None
-        } for candidate in candidates])
+        limit = page_size(request.args.get('limit'))
+        candidates, next_cursor = databases.get_candidates_page(limit, request.args.get('cursor'))
+
+        response = jsonify(candidates)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 # ensure every single endpoint's request have jwt
@@ -140,31 +156,15 @@ def upload_and_process_cvs(job_id):
     job_requirements = {"min_gpa": job.min_gpa, "min_experience": job.min_experience, "degree_requirements": job.degree_requirements}
     job_description = job.job_description or ""
 
-    job_title_lower = (
-        job.job_title.lower()
-    )  # Ambil judul pekerjaan, cth: "it data engineer - taf"
-    selected_skills_list = []
-
-    # Pilih list skill berdasarkan kata kunci di judul pekerjaan
-    if "data engineer" in job_title_lower:
-        selected_skills_list = DATA_ENGINEER_SKILLS
-        print(
-            f"[DEBUG] Memakai skill list: DATA_ENGINEER_SKILLS untuk job '{job.job_title}'"
-        )
-
-    elif "business analyst" in job_title_lower:
-        selected_skills_list = BUSINESS_ANALYST_SKILLS
-        print(
-            f"[DEBUG] Memakai skill list: BUSINESS_ANALYST_SKILLS untuk job '{job.job_title}'"
-        )
-
-    else:
-        # Fallback jika judul pekerjaan tidak cocok
-        print(f"[WARNING] Tidak ada list skill hardcoded untuk job: {job.job_title}")
-        selected_skills_list = []  # Kosongkan jika tidak ada yg cocok
+    # Fitur JD (skill list, education level) dihitung sekali per job, bukan per CV
+    job_features = get_job_features(job)
+    selected_skills_list = job_features.get("skills", [])
+    if not selected_skills_list:
+        print(f"[WARNING] Tidak ada skill yang dikenali untuk job: {job.job_title}")
 
     # Pastikan semua skill dalam huruf kecil untuk dicocokkan
     required_skills_lower = [skill.lower() for skill in selected_skills_list]
+    required_edu_level = job_features.get("education_level", 0)
 
     report = {"passed_count": 0, "rejected_count": 0, "rejection_details": {}}
 
@@ -202,36 +202,11 @@ def upload_and_process_cvs(job_id):
             if isinstance(exp_raw, int):
                 candidate_experience = exp_raw
             
-            EDUCATION_LEVELS = {"D3": 1, "S1": 2, "S2": 3, "S3": 4}
-            
-            # Tentukan level kandidat (dari parser)
-            candidate_edu_level = 0
-            if edu_raw:
-                edu_upper = edu_raw.upper()
-                if "S3" in edu_upper or "DOCTORATE" in edu_upper or "PHD" in edu_upper: 
-                    candidate_edu_level = EDUCATION_LEVELS["S3"]
-                elif "S2" in edu_upper or "MASTER" in edu_upper or "MAGISTER" in edu_upper: 
-                    candidate_edu_level = EDUCATION_LEVELS["S2"]
-                elif "S1" in edu_upper or "BACHELOR" in edu_upper or "SARJANA" in edu_upper: 
-                    candidate_edu_level = EDUCATION_LEVELS["S1"]
-                elif "D3" in edu_upper or "DIPLOMA" in edu_upper: 
-                    candidate_edu_level = EDUCATION_LEVELS["D3"]
-            
-            # Tentukan level minimum dari lowongan (Job)
-            required_edu_level = 0
-            if job_requirements["degree_requirements"]:
-                req_upper = job_requirements["degree_requirements"].upper()
-                
-                if "S3" in req_upper or "DOCTORATE" in req_upper or "PHD" in req_upper:
-                    required_edu_level = EDUCATION_LEVELS["S3"]
-                elif "S2" in req_upper or "MASTER" in req_upper or "MAGISTER" in req_upper:
-                    required_edu_level = EDUCATION_LEVELS["S2"]
-                elif "S1" in req_upper or "BACHELOR" in req_upper or "SARJANA" in req_upper:
-                    required_edu_level = EDUCATION_LEVELS["S1"]
-                elif "D3" in req_upper or "DIPLOMA" in req_upper:
-                    required_edu_level = EDUCATION_LEVELS["D3"]
-            # ----------------------------------------------------
-            # -----------------------------------------------
+            # Level pendidikan kandidat (0 = tidak dikenali, 1 = D3 ... 4 = S3)
+            candidate_edu_level = education_rank(edu_raw)
+
+            # Skill job di CV: satu pass automaton per CV (alias & variasi tulisan ikut dicocokkan)
+            matched_skills, skill_ratio = match_job_skills(job.id, selected_skills_list, cv_text)
 
             # Filter cek GPA
             if job_requirements["min_gpa"] is not None and (
@@ -253,6 +228,12 @@ def upload_and_process_cvs(job_id):
                 candidate_edu_level < required_edu_level
             ):
                 rejection_reason = f"Education below minimum requirement ({job_requirements['degree_requirements']})"
+
+            # Filter 4: rasio skill job yang ditemukan di CV (0 = nonaktif)
+            elif Config.MIN_SKILL_MATCH_RATIO > 0 and skill_ratio is not None and (
+                skill_ratio < Config.MIN_SKILL_MATCH_RATIO
+            ):
+                rejection_reason = f"Skill match below minimum requirement ({Config.MIN_SKILL_MATCH_RATIO}%)"
             # ----------------------------------------------------
 
             # --- PERBAIKAN LOGIKA PENYIMPANAN ---
@@ -268,8 +249,10 @@ def upload_and_process_cvs(job_id):
                 "education": structured_profile.get("education"),
                 "experience": structured_profile.get("experience"),  
                 "total_experience": structured_profile.get("total_experience"),  
-                "skills": structured_profile.get("skills"),  
-                "scoring_reason": None
+                "skills": _merge_skills(structured_profile.get("skills"), matched_skills),
+                "skill_match_ratio": skill_ratio,
+                "scoring_reason": None,
+                "cv_text": cv_text,
             }
 
             if rejection_reason:
@@ -287,21 +270,10 @@ def upload_and_process_cvs(job_id):
             else:
                 # 3. Tambahkan info jika lolos
                 report["passed_count"] += 1
-                # score = calculate_match_score(cv_text, job_description)
 
-                # candidate_data["status"] = "passed_filter"
-                # candidate_data["score"] = score
-                
-                # Panggil fungsi scoring AI yang baru
-                ai_result = get_ai_match_score(cv_text, job_description) 
-                
-                print(f"--- [DEBUG] Alasan Scoring AI untuk {filename} ---")
-                pprint.pprint(ai_result)
-                print("--------------------------------------------------")
-                
+                # Stage 1 cascade: belum ada skor -> save_candidate mengisi match_score
+                # dengan skor TF-IDF lokal (scoring_stage="local"). LLM hanya untuk shortlist di bawah.
                 candidate_data['status'] = 'passed_filter'
-                candidate_data['score'] = ai_result.get('match_score', 0)
-                candidate_data["scoring_reason"] = ai_result.get("reasoning")
 
                 databases.save_candidate(job_id, candidate_data)  # Kirim data lengkap
 
@@ -314,13 +286,33 @@ def upload_and_process_cvs(job_id):
             if os.path.exists(file_path):
                 os.remove(file_path)
 
+    # Stage 2 cascade: Gemini hanya untuk top N / top persentil per job menurut skor lokal,
+    # di background -> response upload tidak menunggu LLM
+    try:
+        llm_top_n = request.form.get("llm_top_n", type=int)
+        llm_percentile = request.form.get("llm_percentile", type=float)
+        started = start_llm_stage(job.id, top_n=llm_top_n, percentile=llm_percentile)
+        report["llm_stage"] = "started" if started else "queued"
+    except Exception as e:
+        print(f"!!! [CASCADE] Stage LLM gagal dijadwalkan, kandidat tetap memakai skor lokal: {e}")
+        report["llm_stage"] = "failed"
+
     return jsonify(report), 200
 
+def _merge_skills(parsed, matched):
+    """Skill dari parser + skill job hasil matcher, tanpa duplikat (case-insensitive)."""
+    merged, seen = [], set()
+    for skill in list(parsed or []) + list(matched):
+        if isinstance(skill, str) and skill.strip() and skill.strip().lower() not in seen:
+            seen.add(skill.strip().lower())
+            merged.append(skill.strip())
+    return merged
+
 @hr_bp.route('/jobs/<job_id>/candidates', methods=['GET'])
 def get_ranked_candidates(job_id):
     """
     Endpoint untuk mengambil kandidat yang sudah di-ranking untuk sebuah
-    pekerjaan, dengan support untuk filter dinamis.
+    pekerjaan, dengan support untuk filter dinamis dan keyset pagination.
     """
     try:
         # Ambil parameter filter dari URL (e.g., ?min_gpa=3.0&skills=React,Python)
@@ -338,17 +330,107 @@ def get_ranked_candidates(job_id):
         if 'min_exp' in active_filters:
             active_filters['total_experience'] = active_filters.pop('min_exp')
         
-        # Panggil fungsi database dengan filter yang sudah bersih
-        candidates = databases.get_all_candidates_for_job(job_id, active_filters)
-        
-        return jsonify(candidates)
+        # Keyset pagination: ?limit=50&cursor=<X-Next-Cursor sebelumnya>
+        limit = page_size(request.args.get('limit'))
+        cursor = request.args.get('cursor')
+
+        # Conditional GET: kalau candidates_version job belum berubah -> 304,
+        # tanpa query daftar kandidat dan tanpa JSON encoding
+        version, last_modified = databases.get_job_candidates_version(job_id)
+        etag = make_etag("job-candidates", job_id, version, sorted(active_filters.items()), limit, cursor)
+
+        def build():
+            # Panggil fungsi database dengan filter yang sudah bersih
+            candidates, next_cursor = databases.get_candidates_page_for_job(
+                job_id, active_filters, limit=limit, cursor=cursor
+            )
+            response = jsonify(candidates)
+            if next_cursor:
+                response.headers['X-Next-Cursor'] = next_cursor
+            return response
+
+        return conditional_response(etag, last_modified, build)
     
+    except ValueError as e:
+        return jsonify({"error": f"Filter tidak valid: {e}"}), 400
+
     except Exception as e:
         import traceback
         print(f"!!! ERROR in get_ranked_candidates: {e}") 
         traceback.print_exc()
         return jsonify({"error": f"Gagal mengambil data dari database: {e}"}), 500
 
+@hr_bp.route('/jobs/<job_id>/candidates/export', methods=['GET'])
+def export_job_candidates(job_id):
+    """
+    Export semua kandidat satu job: ?format=csv|ndjson|parquet (default csv).
+    Body di-stream langsung dari server-side cursor, jadi download langsung mulai.
+    """
+    fmt = (request.args.get('format') or 'csv').lower()
+    job = Job.query.get(job_id)
+    if not job:
+        return jsonify({"error": "Job tidak ditemukan"}), 404
+
+    try:
+        body = export_stream(job_id, fmt)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    filename = secure_filename(f"{job.job_title or 'job'}_candidates.{fmt}") or f"candidates.{fmt}"
+    return Response(
+        stream_with_context(body),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@hr_bp.route('/jobs/<job_id>/leaderboard', methods=['GET'])
+def get_job_leaderboard(job_id):
+    """Top-K kandidat sebuah job dari leaderboard incremental (?k=10)."""
+    try:
+        k = min(max(request.args.get('k', 10, type=int), 1), 500)
+        top = LEADERBOARDS.top_k(job_id, k)
+
+        names = dict(
+            db.session.query(Candidate.id, Candidate.name)
+            .filter(Candidate.id.in_([candidate_id for candidate_id, _ in top]))
+            .all()
+        ) if top else {}
+
+        return jsonify([{
+            "rank": rank,
+            "candidate_id": candidate_id,
+            "name": names.get(candidate_id),
+            "match_score": score,
+        } for rank, (candidate_id, score) in enumerate(top, start=1)])
+
+    except Exception as e:
+        print(f"!!! ERROR in get_job_leaderboard: {e}")
+        return jsonify({"error": f"Gagal mengambil leaderboard: {e}"}), 500
+
+
+@hr_bp.route('/jobs/<job_id>/candidates/<candidate_id>/rank', methods=['GET'])
+def get_candidate_rank(job_id, candidate_id):
+    """Rank dan percentile satu kandidat di antara kandidat 'passed_filter' sebuah job."""
+    try:
+        board = LEADERBOARDS.get(job_id)
+        rank = board.rank_of(candidate_id)
+        if rank is None:
+            return jsonify({"error": "Candidate not ranked for this job"}), 404
+
+        return jsonify({
+            "candidate_id": candidate_id,
+            "job_id": job_id,
+            "rank": rank,
+            "total": len(board),
+            "percentile": board.percentile_of(candidate_id),
+            "match_score": board.score_of(candidate_id),
+        })
+
+    except Exception as e:
+        print(f"!!! ERROR in get_candidate_rank: {e}")
+        return jsonify({"error": f"Gagal mengambil rank kandidat: {e}"}), 500
+
+
 @hr_bp.route("/candidates/search", methods=["GET"])
 def search_candidates_endpoint():
     try:
@@ -360,16 +442,71 @@ def search_candidates_endpoint():
                 "data": []
             }), 200
 
-        results = search_candidates(keyword)
+        filters = {
+            "status": request.args.get("status"),
+            "job_id": request.args.get("job_id"),
+        }
+        include_facets = request.args.get("facets", "").lower() in ("1", "true", "yes")
+        facets = None
+        if include_facets:
+            results, facets = search_candidates_with_facets(keyword, filters)
+        else:
+            results = search_candidates(keyword, filters)
+
+        response = {
+            "status": "success",
+            "message": f"{len(results)} candidate found with the keyword '{keyword}'",
+        }
+        if include_facets:
+            response["facets"] = facets
+
+        # Hasil bisa ribuan kandidat -> "data" di-encode per chunk, bukan satu body besar
+        # (ranked candidates tidak perlu ini: sudah dipaginasi dengan cursor)
+        return stream_json_array(results, envelope=response)
+
+    except Exception as e:
+        print("ERROR search_candidates:", e)
+        return jsonify({
+            "status": "error",
+            "message": "There has been a mistake finding a candidate",
+            "data": [],
+            "details": str(e)
+        }), 500
+
+@hr_bp.route("/candidates/semantic-search", methods=["GET"])
+def semantic_search_endpoint():
+    """
+    Pencarian semantik (vector index) atas experience, skills dan education kandidat.
+    Contoh: ?q=data engineer&k=20&job_id=<id>
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            return jsonify({
+                "status": "success",
+                "message": "Query not found, no results",
+                "data": []
+            }), 200
+
+        k = min(max(request.args.get("k", 20, type=int), 1), 100)
+        results = semantic_search(query, k=k, job_id=request.args.get("job_id"))
+
+        # Index belum pernah dibangun -> sedang dibangun di background, bukan di request ini
+        if not results and not CANDIDATE_INDEX.is_built and CANDIDATE_INDEX.stats()["building"]:
+            return jsonify({
+                "status": "success",
+                "message": "Semantic index is being built, try again shortly",
+                "data": []
+            }), 200
 
         return jsonify({
             "status": "success",
-            "message": f"{len(results)} candidate found with the keyword '{keyword}'",
+            "message": f"{len(results)} candidate found for '{query}'",
             "data": results
         }), 200
 
     except Exception as e:
-        print("ERROR search_candidates:", e)
+        print("ERROR semantic_search:", e)
         return jsonify({
             "status": "error",
             "message": "There has been a mistake finding a candidate",
@@ -377,20 +514,59 @@ def search_candidates_endpoint():
             "details": str(e)
         }), 500
 
-# Endpoint untuk profil detail (lakukan hal yang sama)
+
+@hr_bp.route("/candidates/search/cache-stats", methods=["GET"])
+def search_cache_stats_endpoint():
+    """Statistik cache talent search (hit rate, jumlah entry, generation)."""
+    return jsonify({"status": "success", "data": search_cache_stats()}), 200
+
+
+@hr_bp.route("/llm/budget-stats", methods=["GET"])
+def llm_budget_stats_endpoint():
+    """Latency budget LLM per endpoint (p95, hedge delay, jumlah hedged / provisional)."""
+    return jsonify({"status": "success", "data": budget_stats()}), 200
+
+
+@hr_bp.route("/candidates/<candidate_id>/status", methods=["PUT"])
+def update_candidate_status_endpoint(candidate_id):
+    data = request.get_json() or {}
+    status = data.get("status")
+    if status not in ("processing", "passed_filter", "rejected"):
+        return jsonify({"error": "Status tidak valid. Pilih: processing, passed_filter, rejected"}), 400
+
+    candidate = databases.update_candidate_status(candidate_id, status, data.get("rejection_reason"))
+    if not candidate:
+        return jsonify({"error": "Candidate not found"}), 404
+
+    return jsonify(candidate), 200
+
+
+# Endpoint untuk profil detail: kandidat + skills + experience + scoring reason sekaligus
 @hr_bp.route("/candidates/<candidate_id>", methods=["GET"])
 def get_candidate_detail(candidate_id):
-    # Di sini Anda akan membuat fungsi databases.get_candidate_by_id(candidate_id)
-    # Untuk sekarang, kita bisa fokus pada daftar ranking dulu.
-    pass
+    try:
+        candidate = databases.get_candidate_by_id(candidate_id)
+        if not candidate:
+            return jsonify({"error": "Candidate not found"}), 404
+        return jsonify(candidate), 200
+    except Exception as e:
+        print(f"!!! ERROR in get_candidate_detail: {e}")
+        return jsonify({"error": f"Gagal mengambil detail kandidat: {e}"}), 500
 
 
 @hr_bp.route("/jobs", methods=["GET"])
 def get_jobs_list():
-    """Endpoint untuk mengambil semua data pekerjaan."""
+    """
+    Endpoint untuk mengambil semua data pekerjaan.
+    ?include_stats=true -> ikut statistik kandidat per job (total, passed, rejected, avg/max score).
+    """
     try:
-        jobs = databases.get_all_jobs()
-        return jsonify(jobs)
+        include_stats = request.args.get("include_stats", "false").lower() == "true"
+        version, last_modified = databases.get_jobs_version()
+        etag = make_etag("jobs", include_stats, *version)
+        return conditional_response(
+            etag, last_modified, lambda: jsonify(databases.get_all_jobs(include_stats=include_stats))
+        )
     except Exception as e:
         return jsonify({"error": "Failed to fetch job list", "details": str(e)}), 500
 
@@ -415,8 +591,12 @@ def create_job():
             requirements_json=data.get("requirements"),
         )
 
+        # Keywords / skills / education level JD dihitung sekali di sini
+        refresh_job_features(job, commit=False)
+
         db.session.add(job)
         db.session.commit()
+        databases.invalidate_job_caches()
 
         return jsonify({"message": "Job created successfully", "job_id": job.id}), 201
 
@@ -425,6 +605,75 @@ def create_job():
         return jsonify({"error": "Failed to create job", "details": str(e)}), 500
 
 
+# Field job yang boleh diubah lewat PUT /jobs/<id>
+JOB_TEXT_FIELDS = {"job_title": "job_title", "job_description": "job_description", "requirements": "requirements_json"}
+JOB_FILTER_FIELDS = {"min_gpa": "min_gpa", "min_experience": "min_experience", "degree_requirements": "degree_requirements"}
+JOB_OTHER_FIELDS = {"job_location": "job_location", "max_experience": "max_experience"}
+
+
+@hr_bp.route("/jobs/<job_id>", methods=["PUT"])
+@jwt_required()
+def update_job(job_id):
+    """
+    Ubah job. Kalau JD / requirement / hard filter berubah, kandidat yang sudah ada
+    di-score ulang di background (202 + progress, lihat GET /jobs/<id>/rescore).
+    """
+    job = databases.get_job_by_id(job_id)
+    if not job:
+        return jsonify({"error": "Job ID not found"}), 404
+
+    data = request.get_json() or {}
+    old_description = job.job_description
+    changed = set()
+    try:
+        for fields in (JOB_TEXT_FIELDS, JOB_FILTER_FIELDS, JOB_OTHER_FIELDS):
+            for key, attr in fields.items():
+                if key in data and data[key] != getattr(job, attr):
+                    setattr(job, attr, data[key])
+                    changed.add(key)
+
+        if changed & (set(JOB_TEXT_FIELDS) | {"degree_requirements"}):
+            refresh_job_features(job, commit=False)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "Failed to update job", "details": str(e)}), 500
+
+    databases.invalidate_job_caches()
+    # Skor TF-IDF hanya bergantung pada job_description (bandingkan nilai, bukan sekadar key terkirim)
+    jd_changed = job.job_description != old_description
+
+    if not changed & (set(JOB_TEXT_FIELDS) | set(JOB_FILTER_FIELDS)):
+        return jsonify({"message": "Job updated", "job_id": job_id, "rescore": None}), 200
+
+    # Run yang sedang berjalan memakai JD / filter lama -> perubahan ini diantrekan sebagai follow-up
+    started, progress = start_rescore(job_id, jd_changed=jd_changed, queue_if_running=True)
+    message = "Job updated, re-scoring started" if started else "Job updated, re-scoring queued after the running one"
+    return jsonify({"message": message, "job_id": job_id, "rescore": progress}), 202
+
+
+@hr_bp.route("/jobs/<job_id>/rescore", methods=["POST"])
+@jwt_required()
+def rescore_job_endpoint(job_id):
+    """Re-score manual. Body {"full": false} -> hanya filter + kandidat yang baru lolos."""
+    if not databases.get_job_by_id(job_id):
+        return jsonify({"error": "Job ID not found"}), 404
+
+    full = (request.get_json(silent=True) or {}).get("full", True)
+    started, progress = start_rescore(job_id, jd_changed=bool(full))
+    if not started:
+        return jsonify({"error": "Re-scoring job ini masih berjalan", "rescore": progress}), 409
+    return jsonify({"message": "Re-scoring started", "rescore": progress}), 202
+
+
+@hr_bp.route("/jobs/<job_id>/rescore", methods=["GET"])
+def get_rescore_progress(job_id):
+    progress = get_progress(job_id)
+    if progress is None:
+        return jsonify({"error": "Belum ada re-scoring untuk job ini"}), 404
+    return jsonify({"status": "success", "data": progress}), 200
+
+
 @hr_bp.route("/test", methods=["GET"])
 def test_connection():
     return jsonify({"status": "success", "message": "Success ✅"}), 200
@@ -3,15 +3,17 @@ from flask import Blueprint, request, jsonify
 from werkzeug.utils import secure_filename
 import os
 import shutil
+import threading
 import uuid
 from datetime import datetime
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.services.cv_parser import extract_text
 from app.services.ai_analyzer import check_ats_friendliness, analyze_keywords
-from app.services.astra_scoring_service import AstraScoringService 
+from app.services.analysis_cache import analyze_cv_cached
 from app.models import CV, Analysis
 from app.extensions import db
+from app.json_provider import stream_json_array
 
 js_bp = Blueprint('jobseeker_api', __name__, url_prefix='/api/jobseeker')
 
@@ -19,6 +21,27 @@ UPLOAD_FOLDER = 'temp_uploads'
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
+# Batas tunggu write-back hasil Gemini yang terlambat sampai baris Analysis ter-commit
+WRITE_BACK_COMMIT_WAIT = 60
+
+
+def _analysis_write_back(analysis_id, committed):
+    """
+    Callback hasil Gemini yang datang setelah deadline: timpa skor & rubrik provisional
+    di baris Analysis. Menunggu request asal selesai commit (committed: threading.Event).
+    """
+    def write_back(result):
+        if not committed.wait(WRITE_BACK_COMMIT_WAIT):
+            return
+        updated = Analysis.query.filter_by(id=analysis_id).update({
+            Analysis.match_score: result.get('skor_akhir', 0),
+            Analysis.phrasing_suggestions_json: result.get('ai_analysis', {}),
+        }, synchronize_session=False)
+        db.session.commit()
+        if updated:
+            print(f"✅ [LLM BUDGET] Analysis {analysis_id} diperbarui dengan hasil Gemini ({result.get('skor_akhir')})")
+    return write_back
+
 @js_bp.route('/analyze', methods=['POST'])
 @jwt_required()
 def analyze_cv():
@@ -29,6 +52,8 @@ def analyze_cv():
     job_description_text = request.form.get('job_description', '') 
     job_title_input = request.form.get('job_title_input', 'Custom Job Position')
     cv_title = request.form.get('cv_title', 'Untitled CV')
+    # "gemini" (default, fallback otomatis ke lokal kalau error) atau "local" (rubrik tanpa LLM)
+    scoring_engine = request.form.get('scoring_engine', 'gemini').lower()
 
     if cv_file.filename == '':
         return jsonify({"error": "File kosong"}), 400
@@ -36,12 +61,18 @@ def analyze_cv():
     if not job_description_text or len(job_description_text) < 10:
         return jsonify({"error": "Harap masukkan deskripsi pekerjaan (Job Description) yang valid."}), 400
 
+    if scoring_engine not in ('gemini', 'local'):
+        return jsonify({"error": "scoring_engine harus 'gemini' atau 'local'"}), 400
+
     current_user_id = get_jwt_identity()
     filename = secure_filename(cv_file.filename)
     
     temp_filename = f"{uuid.uuid4()}_{filename}"
     temp_path = os.path.join(UPLOAD_FOLDER, temp_filename)
 
+    analysis_id = str(uuid.uuid4())
+    committed = threading.Event()
+
     try:
         cv_file.save(temp_path)
         cv_text = extract_text(temp_path)
@@ -49,11 +80,14 @@ def analyze_cv():
         if not cv_text or len(cv_text) < 50:
             raise ValueError("CV kosong atau tidak terbaca (Scan Image/Corrupt).")
 
-        # 1. Gemini Analysis
-        gemini_result = AstraScoringService.analyze_cv_with_gemini(
+        # 1. Rubric Analysis (Gemini / lokal), dari analysis_cache kalau CV + JD sama sudah pernah dianalisis.
+        # Gemini lewat latency budget -> rubrik lokal provisional, hasil Gemini ditulis belakangan.
+        gemini_result, cache_info = analyze_cv_cached(
             cv_text=cv_text, 
             job_desc_text=job_description_text,
-            job_title=job_title_input
+            job_title=job_title_input,
+            engine=scoring_engine,
+            on_late_result=_analysis_write_back(analysis_id, committed)
         )
         
         if gemini_result.get('error'):
@@ -85,11 +119,7 @@ def analyze_cv():
         )
         db.session.add(new_cv)
 
-        # 4. Simpan Analysis (FIX ERROR DISINI)
-        # ==========================================
-        analysis_id = str(uuid.uuid4())  # <--- INI YANG KURANG TADI
-        # ==========================================
-        
+        # 4. Simpan Analysis (analysis_id dibuat di awal supaya write-back Gemini bisa menemukannya)
         full_job_desc_stored = f"{job_title_input}\n\n{job_description_text}"
 
         new_analysis = Analysis(
@@ -99,11 +129,15 @@ def analyze_cv():
             match_score=gemini_result.get('skor_akhir', 0),
             ats_check_result_json=ats_results, 
             keyword_analysis_json=keyword_results, 
-            phrasing_suggestions_json=gemini_result.get('ai_analysis', {}),
+            phrasing_suggestions_json=(
+                {**gemini_result.get('ai_analysis', {}), "provisional": True}
+                if gemini_result.get('provisional') else gemini_result.get('ai_analysis', {})
+            ),
             analyzed_at=datetime.utcnow()
         )
         db.session.add(new_analysis)
         db.session.commit()
+        committed.set()
 
         return jsonify({
             "status": "success",
@@ -111,7 +145,12 @@ def analyze_cv():
             "match_score": gemini_result.get('skor_akhir', 0),
             "gemini_result": gemini_result,
             "keyword_analysis": keyword_results,
-            "job_info": gemini_result.get('job_info', {})
+            "job_info": gemini_result.get('job_info', {}),
+            "scoring_engine": gemini_result.get('engine', scoring_engine),
+            "cache_hit": cache_info["cache_hit"],
+            "cached_at": cache_info["cached_at"],
+            # True -> skor lokal sementara; hasil Gemini menyusul di GET /analysis/<analysis_id>
+            "provisional": bool(gemini_result.get('provisional'))
         }), 200
 
     except Exception as e:
@@ -119,6 +158,8 @@ def analyze_cv():
         print(f"❌ Error Analysis Route: {str(e)}")
         return jsonify({"error": str(e)}), 500
     finally:
+        # Request gagal -> write-back yang menunggu tidak menemukan baris Analysis dan berhenti
+        committed.set()
         if os.path.exists(temp_path):
             os.remove(temp_path)
 
@@ -134,33 +175,40 @@ def get_my_cvs():
             db.func.max(Analysis.analyzed_at).label('latest_analyzed_at')
         ).group_by(Analysis.cv_id).subquery()
 
-        cvs_with_analyses = db.session.query(CV, Analysis).\
+        cvs_with_analyses = db.session.query(
+            CV.id, CV.cv_title, CV.original_filename, CV.uploaded_at,
+            Analysis.id.label('analysis_id'), Analysis.match_score, Analysis.job_description_text
+        ).\
             outerjoin(latest_analysis_sq, CV.id == latest_analysis_sq.c.cv_id).\
             outerjoin(Analysis, db.and_(
                 Analysis.cv_id == latest_analysis_sq.c.cv_id,
                 Analysis.analyzed_at == latest_analysis_sq.c.latest_analyzed_at
             )).\
             filter(CV.user_id == current_user_id).\
-            order_by(CV.uploaded_at.desc()).all()
-
-        result = []
-        for cv, analysis in cvs_with_analyses:
-            job_preview = "Unknown Job"
-            if analysis and analysis.job_description_text:
-                job_preview = analysis.job_description_text.split('\n')[0][:50]
-
-            result.append({
-                "cv_id": cv.id,
-                "cv_title": cv.cv_title,
-                "original_filename": cv.original_filename,
-                "uploaded_at": cv.uploaded_at.isoformat(),
-                "latest_analysis": {
-                    "analysis_id": analysis.id,
-                    "match_score": float(analysis.match_score),
-                    "job_description": job_preview
-                } if analysis else None
-            })
-        return jsonify({"status": "success", "data": result}), 200
+            order_by(CV.uploaded_at.desc()).\
+            yield_per(200)
+
+        def rows():
+            # Dibaca langsung dari cursor DB dan di-encode baris per baris
+            for row in cvs_with_analyses:
+                job_preview = "Unknown Job"
+                if row.analysis_id and row.job_description_text:
+                    job_preview = row.job_description_text.split('\n')[0][:50]
+
+                yield {
+                    "cv_id": row.id,
+                    "cv_title": row.cv_title,
+                    "original_filename": row.original_filename,
+                    "uploaded_at": row.uploaded_at.isoformat() if row.uploaded_at else None,
+                    "latest_analysis": {
+                        "analysis_id": row.analysis_id,
+                        "match_score": float(row.match_score or 0),
+                        "job_description": job_preview
+                    } if row.analysis_id else None
+                }
+
+        # Query dieksekusi (baris pertama) di dalam try ini; error di tengah stream -> "status": "error"
+        return stream_json_array(rows(), envelope={"status": "success"})
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
@@ -179,6 +227,7 @@ def get_analysis_detail(analysis_id):
             "data": {
                 "match_score": float(analysis.match_score),
                 "gemini_result": {"ai_analysis": gemini_data},
+                "provisional": bool(gemini_data.get("provisional")),
                 "keyword_analysis": keyword_data,
                 "ats_friendliness": analysis.ats_check_result_json,
                 "job_description": analysis.job_description_text
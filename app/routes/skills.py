@@ -1,8 +1,10 @@
 # backend-cv-analyzer/app/routes/skills.py
 from flask import Blueprint, request, jsonify
-from app.models import Skill, Candidate
+from app.models import Skill, CandidateExperience
 from app.extensions import db
-from sqlalchemy import func, distinct
+from app.services.experience_parser import normalize_title, escape_like
+from app.services.skill_dictionary import skill_key
+from sqlalchemy import func
 
 skills_bp = Blueprint('skills', __name__)
 
@@ -16,21 +18,27 @@ def autocomplete_skills():
         return jsonify({'data': []})
     
     try:
-        # Cari skill yang mengandung query (case insensitive)
-        skills = (
-            db.session.query(Skill)
-            .filter(func.lower(Skill.skill_name).like(f"%{query}%"))
-            .order_by(Skill.skill_name)
-            .limit(15)
-            .all()
-        )
+        # Cari skill kanonik dengan prefix key yang sama (index normalized_key)
+        skills = []
+        key = skill_key(query)
+        if key:
+            skills = (
+                db.session.query(Skill)
+                .filter(Skill.normalized_key.like(f"{escape_like(key)}%"))
+                .order_by(Skill.skill_name)
+                .limit(15)
+                .all()
+            )
         
-        # Juga cari job titles/roles yang mengandung query
+        # Juga cari job titles/roles (prefix lookup ke index normalized_title)
+        prefix = normalize_title(query) or query
         experiences = (
             db.session.query(
-                distinct(func.lower(Candidate.experience)).label('experience')
+                CandidateExperience.normalized_title,
+                func.min(CandidateExperience.title).label('experience')
             )
-            .filter(func.lower(Candidate.experience).like(f"%{query}%"))
+            .filter(CandidateExperience.normalized_title.like(f"{escape_like(prefix)}%"))
+            .group_by(CandidateExperience.normalized_title)
             .limit(5)
             .all()
         )
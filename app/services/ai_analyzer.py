@@ -7,11 +7,12 @@ import datetime
 from typing import List, Dict, Union
 import spacy
 from spacy.language import Language
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from app.services.cv_sections import compact_cv
+from config import Config
+
 
 try:
     from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
@@ -161,7 +162,7 @@ def parse_candidate_info(cv_text, required_skills=[]):
     
     Berikut adalah teks CV-nya:
     ---
-    {cv_text}
+    {compact_cv(cv_text, Config.CV_PROMPT_TOKEN_BUDGET)}
     ---
     
     JSON Output:
@@ -319,22 +320,18 @@ def calculate_match_score(cv_text, job_desc_text):
     if not cv_text or not job_desc_text:
         return 0.0
     
-    documents = [cv_text, job_desc_text]
-    try:
-        tfidf = TfidfVectorizer(stop_words="english")
-        tfidf_matrix = tfidf.fit_transform(documents)
-        cosine_sim = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-        score = cosine_sim[0][0]
-        return round(score * 100, 2)
-    except ValueError as e:
-        print(f"Error TfidfVectorizer (mungkin CV kosong): {e}")
-        return 0.0
+    # CV job yang sudah diupload diskor dengan IDF korpus job (term_stats.TERM_STATS);
+    # tanpa korpus, IDF dua dokumen tidak bermakna -> cosine term frequency
+    from app.services.term_stats import text_similarity
+    return text_similarity(cv_text, job_desc_text)
 
 # ===============================================
 # 5. AI SEMANTIC MATCH SCORING
 # ===============================================
 
-def get_ai_match_score(cv_text, jd_text):
+def get_ai_match_score(cv_text, jd_text, token_budget=None):
+    """token_budget: batas token teks CV di prompt (None -> Config.CV_PROMPT_TOKEN_BUDGET, 0 -> tanpa batas)."""
+    token_budget = Config.CV_PROMPT_TOKEN_BUDGET if token_budget is None else token_budget
     schema = {
         "match_score": 0,
         "reasoning": "",
@@ -351,7 +348,7 @@ def get_ai_match_score(cv_text, jd_text):
     {json.dumps(schema, indent=2)}
 
     CV:
-    {cv_text}
+    {compact_cv(cv_text, token_budget) if token_budget else cv_text}
 
     JD:
     {jd_text}
@@ -394,11 +391,20 @@ def check_ats_friendliness(text: str):
 # ===============================================
 # 7. KEYWORD ANALYSIS
 # ===============================================
-def analyze_keywords(cv_text: str, jd_text: str):
-    nlp = spacy.load("en_core_web_sm")
-    doc = nlp(jd_text)
-    cv_lower = cv_text.lower()
+_KEYWORD_NLP = None
+
 
+def _keyword_nlp():
+    # spaCy model di-load sekali per proses, bukan setiap request
+    global _KEYWORD_NLP
+    if _KEYWORD_NLP is None:
+        _KEYWORD_NLP = spacy.load("en_core_web_sm")
+    return _KEYWORD_NLP
+
+
+def extract_jd_keywords(jd_text: str):
+    """Kata benda / proper noun JD + skill keyword yang disebut di JD."""
+    doc = _keyword_nlp()(jd_text or "")
     keywords = {
         token.text.lower()
         for token in doc 
@@ -406,7 +412,14 @@ def analyze_keywords(cv_text: str, jd_text: str):
     }
 
     # Add skill keywords
-    keywords.update([s for s in SKILL_KEYWORDS if s in jd_text.lower()])
+    keywords.update([s for s in SKILL_KEYWORDS if s in (jd_text or "").lower()])
+    return sorted(keywords)
+
+
+def analyze_keywords(cv_text: str, jd_text: str, jd_keywords=None):
+    """jd_keywords: keyword JD yang sudah dihitung (Job.jd_features), kalau ada spaCy dilewati."""
+    cv_lower = cv_text.lower()
+    keywords = set(jd_keywords) if jd_keywords is not None else set(extract_jd_keywords(jd_text))
 
     matched = sorted([kw for kw in keywords if kw in cv_lower])
     missing = sorted([kw for kw in keywords if kw not in cv_lower])
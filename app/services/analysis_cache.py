@@ -0,0 +1,133 @@
+# app/services/analysis_cache.py
+"""
+Cache durable hasil analisis rubrik Astra (tabel analysis_cache).
+
+Jobseeker sering menganalisis ulang CV yang sama terhadap JD yang sama; hasilnya
+diambil dari cache selama belum kedaluwarsa (Config.ANALYSIS_CACHE_TTL detik).
+Key mencakup model dan versi prompt, jadi ganti model / prompt otomatis miss.
+Hasil fallback (Gemini gagal -> rubrik lokal) tidak disimpan.
+"""
+import hashlib
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app.extensions import db
+from app.models import AnalysisCacheEntry
+from app.services.astra_scoring_service import AstraScoringService, ASTRA_PROMPT_VERSION, get_best_available_model
+from config import Config
+
+LOCAL_MODEL = "local-rubric"
+
+
+def _digest(text):
+    # Spasi/baris kosong tidak mengubah hasil analisis -> dinormalisasi sebelum di-hash
+    normalized = re.sub(r"\s+", " ", text or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def cache_key_parts(cv_text, job_desc_text, job_title, engine):
+    model = LOCAL_MODEL if engine == "local" else get_best_available_model()
+    # Budget token CV ikut menentukan isi prompt
+    prompt_version = f"{ASTRA_PROMPT_VERSION}:{Config.CV_PROMPT_TOKEN_BUDGET}"
+    return {
+        "cv_text_hash": _digest(cv_text),
+        "jd_hash": _digest(job_desc_text),
+        "job_title": (job_title or "")[:255],
+        "model": model,
+        "prompt_version": prompt_version,
+    }
+
+
+def _cache_key(parts):
+    raw = "\x1f".join([parts["cv_text_hash"], parts["jd_hash"], parts["job_title"], parts["model"], parts["prompt_version"]])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached(parts):
+    """Return (result, created_at) dari cache yang masih berlaku, atau (None, None)."""
+    key = _cache_key(parts)
+    entry = db.session.get(AnalysisCacheEntry, key)
+    now = datetime.utcnow()
+    if entry is None or entry.expires_at <= now:
+        return None, None
+
+    AnalysisCacheEntry.query.filter_by(cache_key=key).update({
+        AnalysisCacheEntry.hit_count: AnalysisCacheEntry.hit_count + 1,
+        AnalysisCacheEntry.last_hit_at: now,
+    }, synchronize_session=False)
+    return entry.result, entry.created_at
+
+
+def store(parts, result, ttl_seconds=None):
+    """Upsert hasil analisis (request paralel dengan key sama tidak bentrok)."""
+    ttl_seconds = Config.ANALYSIS_CACHE_TTL if ttl_seconds is None else ttl_seconds
+    now = datetime.utcnow()
+    values = {
+        **parts,
+        "cache_key": _cache_key(parts),
+        "result": result,
+        "hit_count": 0,
+        "created_at": now,
+        "last_hit_at": None,
+        "expires_at": now + timedelta(seconds=ttl_seconds),
+    }
+    stmt = mysql_insert(AnalysisCacheEntry.__table__).values(**values)
+    db.session.execute(stmt.on_duplicate_key_update(
+        result=stmt.inserted.result,
+        hit_count=0,
+        created_at=stmt.inserted.created_at,
+        last_hit_at=None,
+        expires_at=stmt.inserted.expires_at,
+    ))
+
+
+def analyze_cv_cached(cv_text, job_desc_text, job_title="General Job", engine="gemini", on_late_result=None):
+    """
+    AstraScoringService.analyze_cv dengan cache. Return (result, cache_info) dengan
+    cache_info = {"cache_hit": bool, "cached_at": iso | None}.
+    Perubahan cache di-flush bersama commit pemanggil (route analyze menyimpan Analysis).
+    Hasil provisional (lewat latency budget) tidak di-cache; hasil Gemini yang datang
+    belakangan disimpan ke cache lalu diteruskan ke on_late_result.
+    """
+    if Config.ANALYSIS_CACHE_TTL <= 0:
+        result = AstraScoringService.analyze_cv(cv_text, job_desc_text, job_title, engine, on_late_result=on_late_result)
+        return result, {"cache_hit": False, "cached_at": None}
+
+    parts = cache_key_parts(cv_text, job_desc_text, job_title, engine)
+
+    def store_late(result):
+        store(parts, result)
+        db.session.commit()
+        if on_late_result:
+            on_late_result(result)
+
+    try:
+        cached, created_at = get_cached(parts)
+    except Exception as e:
+        db.session.rollback()
+        print(f"Database error in analysis_cache.get_cached: {e}")
+        cached, created_at = None, None
+
+    if cached is not None:
+        print(f"⚡ [ANALYSIS CACHE] hit untuk {job_title} ({parts['model']})")
+        return cached, {"cache_hit": True, "cached_at": created_at.isoformat() if created_at else None}
+
+    result = AstraScoringService.analyze_cv(cv_text, job_desc_text, job_title, engine, on_late_result=store_late)
+    if not result.get("error") and not result.get("fallback"):
+        try:
+            store(parts, result)
+        except Exception as e:
+            db.session.rollback()
+            print(f"Database error in analysis_cache.store: {e}")
+    return result, {"cache_hit": False, "cached_at": None}
+
+
+def purge_expired():
+    """Hapus entry yang sudah kedaluwarsa. Return jumlah baris."""
+    deleted = AnalysisCacheEntry.query.filter(
+        AnalysisCacheEntry.expires_at <= datetime.utcnow()
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
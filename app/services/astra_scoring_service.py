@@ -4,9 +4,14 @@ import json
 import google.generativeai as genai
 from typing import Dict, List
 import re
+import threading
+import time
 from datetime import datetime
 from dotenv import load_dotenv
 
+from app.services.cv_sections import compact_cv
+from config import Config
+
 # 1. Load Environment Variables
 load_dotenv()
 GENAI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -17,16 +22,38 @@ if GENAI_API_KEY:
 else:
     print("\033[91m⚠️ FATAL ERROR: GEMINI_API_KEY tidak ditemukan di file .env\033[0m")
 
+# Naikkan setiap kali prompt / rubrik berubah -> hasil analisis lama di analysis_cache tidak dipakai lagi
+ASTRA_PROMPT_VERSION = "rubric-60-20-20-v2"
+
+FALLBACK_MODEL = 'models/gemini-1.5-flash'
+# Deteksi gagal -> list_models baru dicoba lagi setelah sekian detik (bukan di setiap request)
+MODEL_DETECTION_RETRY = 300
+
+_detected_model = None
+_detected_until = 0.0
+_detection_lock = threading.Lock()
+
 def get_best_available_model():
-    """Auto-detect model terbaik."""
-    try:
-        available_models = [m.name for m in genai.list_models() if 'generateContent' in m.supported_generation_methods]
-        # Prioritas: Model 2.0 -> 1.5
-        priority_list = ['models/gemini-2.0-flash', 'models/gemini-1.5-pro', 'models/gemini-1.5-flash']
-        for model_name in priority_list:
-            if model_name in available_models: return model_name
-        return available_models[0]
-    except: return 'models/gemini-1.5-flash'
+    """
+    Auto-detect model terbaik. Hasilnya (termasuk fallback kalau list_models gagal)
+    di-memo selama Config.GEMINI_MODEL_DETECTION_TTL, jadi key analysis_cache tidak
+    menunggu network call di setiap request.
+    """
+    global _detected_model, _detected_until
+    with _detection_lock:
+        if _detected_model and time.monotonic() < _detected_until:
+            return _detected_model
+        try:
+            available_models = [m.name for m in genai.list_models() if 'generateContent' in m.supported_generation_methods]
+            # Prioritas: Model 2.0 -> 1.5
+            priority_list = ['models/gemini-2.0-flash', 'models/gemini-1.5-pro', 'models/gemini-1.5-flash']
+            _detected_model = next((m for m in priority_list if m in available_models), available_models[0])
+            _detected_until = time.monotonic() + Config.GEMINI_MODEL_DETECTION_TTL
+        except Exception as e:
+            print(f"⚠️ Deteksi model Gemini gagal, pakai {FALLBACK_MODEL}: {e}")
+            _detected_model = FALLBACK_MODEL
+            _detected_until = time.monotonic() + min(MODEL_DETECTION_RETRY, Config.GEMINI_MODEL_DETECTION_TTL)
+        return _detected_model
 
 class AstraScoringService:
     """
@@ -57,7 +84,7 @@ class AstraScoringService:
         CURRENT YEAR: {current_year}
 
         === CANDIDATE CV ===
-        {cv_text[:30000]}
+        {compact_cv(cv_text, Config.CV_PROMPT_TOKEN_BUDGET)}
 
         === SCORING RUBRIC (TOTAL 100.0) ===
         
@@ -124,48 +151,92 @@ class AstraScoringService:
                 generation_config={"response_mime_type": "application/json", "temperature": 0.0}
             )
             result = json.loads(response.text)
-
-            # --- CALCULATION ---
-            rubric = result.get('rubric_scores', {})
-            
-            # 1. Total Score (60+20+20)
-            final_score = float(rubric.get('relevance_score', 0)) + \
-                          float(rubric.get('seniority_score', 0)) + \
-                          float(rubric.get('quality_score', 0))
-            
-            # Cap at 100
-            final_score = min(100.0, final_score)
-
-            # 2. Mandatory Penalty (Strict Filter)
-            mandatory = result.get('mandatory_checks', {})
-            is_failed = False
-            fail_reasons = []
-            
-            # Cek Status (Kecuali GPA, GPA pass/note aman)
-            if mandatory.get('major', {}).get('status') == 'FAIL':
-                is_failed = True; fail_reasons.append("Jurusan Tidak Relevan")
-            if mandatory.get('experience_years', {}).get('status') == 'FAIL':
-                is_failed = True; fail_reasons.append("Pengalaman Kurang")
-
-            if is_failed:
-                final_score = min(final_score, 30.0) # Penalty keras
-                print(f"⛔ GATEKEEPER: Failed due to {fail_reasons}")
-
-            # --- LOGGING TO TERMINAL ---
-            print(f"\n📊 RUBRIC SCORE:")
-            print(f"   - Relevansi (60%): {rubric.get('relevance_score')}")
-            print(f"   - Senioritas (20%): {rubric.get('seniority_score')}")
-            print(f"   - Kualitas (20%): {rubric.get('quality_score')}")
-            print(f"   🏁 TOTAL: {final_score:.2f}%")
-            print("="*70 + "\n")
-
-            return {
-                "lulus": final_score >= 60,
-                "skor_akhir": round(final_score, 2),
-                "ai_analysis": result,
-                "job_info": {"title": job_title, "description": job_desc_text}
-            }
+            return AstraScoringService.finalize_result(result, job_title, job_desc_text)
 
         except Exception as e:
             print(f"❌ Gemini Error: {e}")
-            return {"lulus": False, "skor_akhir": 0, "error": str(e), "job_info": {"title": job_title}}
\ No newline at end of file
+            return {"lulus": False, "skor_akhir": 0, "error": str(e), "job_info": {"title": job_title}}
+
+    @staticmethod
+    def finalize_result(result: Dict, job_title: str, job_desc_text: str) -> Dict:
+        """Hitung skor akhir 60/20/20 + penalty mandatory dari JSON rubrik (Gemini / lokal)."""
+        rubric = result.get('rubric_scores', {})
+        
+        # 1. Total Score (60+20+20)
+        final_score = float(rubric.get('relevance_score', 0)) + \
+                      float(rubric.get('seniority_score', 0)) + \
+                      float(rubric.get('quality_score', 0))
+        
+        # Cap at 100
+        final_score = min(100.0, final_score)
+
+        # 2. Mandatory Penalty (Strict Filter)
+        mandatory = result.get('mandatory_checks', {})
+        is_failed = False
+        fail_reasons = []
+        
+        # Cek Status (Kecuali GPA, GPA pass/note aman)
+        if mandatory.get('major', {}).get('status') == 'FAIL':
+            is_failed = True; fail_reasons.append("Jurusan Tidak Relevan")
+        if mandatory.get('experience_years', {}).get('status') == 'FAIL':
+            is_failed = True; fail_reasons.append("Pengalaman Kurang")
+
+        if is_failed:
+            final_score = min(final_score, 30.0) # Penalty keras
+            print(f"⛔ GATEKEEPER: Failed due to {fail_reasons}")
+
+        # --- LOGGING TO TERMINAL ---
+        print(f"\n📊 RUBRIC SCORE:")
+        print(f"   - Relevansi (60%): {rubric.get('relevance_score')}")
+        print(f"   - Senioritas (20%): {rubric.get('seniority_score')}")
+        print(f"   - Kualitas (20%): {rubric.get('quality_score')}")
+        print(f"   🏁 TOTAL: {final_score:.2f}%")
+        print("="*70 + "\n")
+
+        return {
+            "lulus": final_score >= 60,
+            "skor_akhir": round(final_score, 2),
+            "ai_analysis": result,
+            "job_info": {"title": job_title, "description": job_desc_text}
+        }
+
+    @staticmethod
+    def analyze_cv(cv_text: str, job_desc_text: str, job_title: str = "General Job", engine: str = "gemini",
+                   on_late_result=None) -> Dict:
+        """
+        Pilih engine penilaian:
+        - "gemini": rubrik via Gemini dengan latency budget (services.llm_budget). Gemini error
+          -> fallback rubrik lokal; lewat deadline -> rubrik lokal dengan provisional=True dan
+          hasil Gemini yang datang belakangan dikirim ke on_late_result(result).
+        - "local" : rubrik lokal deterministik (services.rubric_scorer), hitungan milidetik
+        """
+        from app.services.rubric_scorer import score_cv_locally
+        from app.services.llm_budget import BUDGETS
+
+        if engine == "local":
+            result = score_cv_locally(cv_text, job_desc_text, job_title)
+            result["engine"] = "local"
+            return result
+
+        def gemini():
+            result = AstraScoringService.analyze_cv_with_gemini(cv_text, job_desc_text, job_title)
+            if not result.get("error"):
+                result["engine"] = "gemini"
+            return result
+
+        def local_fallback():
+            result = score_cv_locally(cv_text, job_desc_text, job_title)
+            result["engine"] = "local"
+            result["fallback"] = True
+            return result
+
+        result, info = BUDGETS["astra_analyze"].run(
+            gemini,
+            is_valid=lambda r: not r.get("error"),
+            fallback=local_fallback,
+            on_late_result=on_late_result,
+        )
+        if result.get("fallback"):
+            print("⚠️ Gemini gagal / lewat deadline, fallback ke rubrik lokal")
+            result["provisional"] = info["provisional"]
+        return result
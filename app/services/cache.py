@@ -0,0 +1,93 @@
+# app/services/cache.py
+import threading
+import time
+from collections import OrderedDict
+
+# Sentinel untuk membedakan "tidak ada di cache" dengan nilai None / [] yang memang di-cache
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Cache in-process dengan batas jumlah entry (LRU eviction), TTL opsional,
+    dan generation counter.
+
+    Setiap entry menyimpan generation saat ia ditulis. Memanggil
+    bump_generation() membuat semua entry lama basi tanpa harus
+    menghapusnya satu per satu (write-through invalidation).
+    """
+
+    def __init__(self, max_entries=256, ttl_seconds=None, name="cache"):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            generation, expires_at, value = entry
+            if generation != self._generation or (expires_at is not None and expires_at < time.monotonic()):
+                # Entry basi -> buang dan anggap miss
+                del self._data[key]
+                self._misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._data[key] = (self._generation, expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def bump_generation(self):
+        """Naikkan generation -> semua entry yang ada menjadi basi."""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            return self._generation
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "name": self.name,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "generation": self._generation,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,195 @@
+# app/services/candidate_export.py
+import csv
+import io
+import json
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.json_provider import iter_ndjson
+from app.models import Candidate, CandidateSkill, Skill
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional, hanya dibutuhkan untuk format=parquet
+    pa = None
+    pq = None
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_FIELDS = [
+    "id", "name", "email", "phone", "match_score", "scoring_stage", "skill_match_ratio", "status", "rejection_reason",
+    "gpa", "total_experience", "education", "skills", "original_filename", "uploaded_at",
+]
+
+YIELD_PER = 1000
+CHUNK_SIZE = 64 * 1024
+PARQUET_ROW_GROUP = 10000
+
+
+def _skills_column():
+    # Skill di-aggregate di SQL (correlated JSON_ARRAYAGG), bukan query per kandidat.
+    # Bukan GROUP_CONCAT: terpotong diam-diam di group_concat_max_len (1024 byte) dan
+    # separator "," bentrok dengan nama skill yang mengandung koma.
+    return (
+        db.session.query(func.json_arrayagg(Skill.skill_name, type_=db.JSON))
+        .join(CandidateSkill, CandidateSkill.skill_id == Skill.id)
+        .filter(CandidateSkill.candidate_id == Candidate.id)
+        .correlate(Candidate)
+        .scalar_subquery()
+        .label("skills")
+    )
+
+
+def _skill_list(value):
+    # Driver bisa mengembalikan JSON yang sudah di-decode atau masih string; tanpa skill -> NULL
+    if isinstance(value, str):
+        value = json.loads(value)
+    return [name for name in value or [] if name]
+
+
+def iter_export_rows(job_id):
+    """
+    Semua kandidat satu job, terurut match_score, dibaca lewat server-side cursor
+    (yield_per -> stream_results) supaya memory konstan berapapun jumlah barisnya.
+    """
+    query = (
+        db.session.query(
+            Candidate.id, Candidate.name, Candidate.email, Candidate.phone,
+            Candidate.match_score, Candidate.scoring_stage, Candidate.skill_match_ratio,
+            Candidate.status, Candidate.rejection_reason,
+            Candidate.gpa, Candidate.total_experience, Candidate.education,
+            _skills_column(), Candidate.original_filename, Candidate.uploaded_at,
+        )
+        .filter(Candidate.job_id == job_id)
+        .order_by(Candidate.match_score.desc(), Candidate.id.desc())
+        .execution_options(stream_results=True)
+        .yield_per(YIELD_PER)
+    )
+    for row in query:
+        yield {
+            "id": row.id,
+            "name": row.name,
+            "email": row.email,
+            "phone": row.phone,
+            "match_score": float(row.match_score) if row.match_score is not None else None,
+            "scoring_stage": row.scoring_stage,
+            "skill_match_ratio": float(row.skill_match_ratio) if row.skill_match_ratio is not None else None,
+            "status": row.status,
+            "rejection_reason": row.rejection_reason,
+            "gpa": float(row.gpa) if row.gpa is not None else None,
+            "total_experience": row.total_experience,
+            "education": row.education,
+            "skills": _skill_list(row.skills),
+            "original_filename": row.original_filename,
+            "uploaded_at": row.uploaded_at.isoformat() if row.uploaded_at else None,
+        }
+
+
+def iter_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+
+    def drain():
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    # Header langsung dikirim -> download mulai sebelum baris pertama dibaca dari DB
+    writer.writeheader()
+    yield drain()
+    for row in rows:
+        writer.writerow({**row, "skills": "; ".join(row["skills"])})
+        if buffer.tell() >= CHUNK_SIZE:
+            yield drain()
+    if buffer.tell():
+        yield drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """File-like untuk ParquetWriter: byte yang ditulis ditampung lalu dikuras per row group."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema():
+    return pa.schema([
+        ("id", pa.string()),
+        ("name", pa.string()),
+        ("email", pa.string()),
+        ("phone", pa.string()),
+        ("match_score", pa.float64()),
+        ("scoring_stage", pa.string()),
+        ("skill_match_ratio", pa.float64()),
+        ("status", pa.string()),
+        ("rejection_reason", pa.string()),
+        ("gpa", pa.float64()),
+        ("total_experience", pa.int32()),
+        ("education", pa.string()),
+        ("skills", pa.list_(pa.string())),
+        ("original_filename", pa.string()),
+        ("uploaded_at", pa.string()),
+    ])
+
+
+def iter_parquet(rows):
+    """Parquet ditulis per row group; setiap row group langsung dikirim ke client."""
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+
+    def flush(batch):
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        return sink.drain()
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= PARQUET_ROW_GROUP:
+            yield flush(batch)
+            batch = []
+    if batch:
+        yield flush(batch)
+
+    writer.close()
+    yield sink.drain()
+
+
+def export_stream(job_id, fmt):
+    """Generator bytes untuk format yang diminta (csv | ndjson | parquet)."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format harus salah satu dari {', '.join(EXPORT_FORMATS)}")
+    if fmt == "parquet" and pq is None:
+        raise ValueError("format parquet membutuhkan pyarrow")
+
+    rows = iter_export_rows(job_id)
+    if fmt == "csv":
+        return iter_csv(rows)
+    if fmt == "ndjson":
+        return iter_ndjson(rows, chunk_size=CHUNK_SIZE)
+    return iter_parquet(rows)
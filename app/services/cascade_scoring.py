@@ -0,0 +1,215 @@
+# app/services/cascade_scoring.py
+"""
+Cascade scoring untuk bulk upload:
+
+1. Stage "local": semua kandidat yang lolos hard filter diberi skor TF-IDF lokal
+   (services.term_stats, dihitung di databases.save_candidate).
+2. Stage "llm": hanya shortlist per job (top N atau top persentil menurut local_score)
+   yang dinilai ulang oleh Gemini. Sisanya tetap scoring_stage="local".
+   Stage ini berjalan di background thread (start_llm_stage), jadi response upload
+   tidak menunggu Gemini; skor LLM menggantikan skor lokal begitu hasilnya datang.
+
+Stage LLM sebuah job (cascade upload maupun re-scoring) selalu lewat run_llm_stage,
+yang memegang satu lock per job: tidak ada dua score_shortlist paralel untuk job yang sama.
+Skor hanya ditulis kalau hash JD saat penilaian masih sama dengan JD job sekarang.
+"""
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from app.extensions import db
+from app.models import Candidate, CandidateDocument, Job
+from app.services.ai_analyzer import get_ai_match_score
+from app.services.term_stats import text_hash
+import app.databases as databases
+from config import Config
+
+# Job yang stage LLM-nya sedang berjalan, dan parameter shortlist untuk run lanjutan
+_running = set()
+_reruns = {}
+# job_id -> Lock stage LLM (dipakai bersama oleh cascade dan rescoring)
+_stage_locks = {}
+# job_id -> Event pembatalan untuk score_shortlist yang sedang berjalan
+_cancels = {}
+_lock = threading.Lock()
+
+
+def stage_lock(job_id):
+    with _lock:
+        return _stage_locks.setdefault(job_id, threading.Lock())
+
+
+def cancel_llm_stage(job_id):
+    """Hentikan penilaian LLM yang sedang berjalan untuk job ini (mis. JD baru diubah)."""
+    with _lock:
+        cancel = _cancels.get(job_id)
+    if cancel is not None:
+        cancel.set()
+    return cancel is not None
+
+
+def shortlist_size(total, top_n=None, percentile=None):
+    """Ukuran shortlist: top persentil (kalau diisi) atau top N."""
+    top_n = Config.LLM_SHORTLIST_TOP_N if top_n is None else top_n
+    percentile = Config.LLM_SHORTLIST_PERCENTILE if percentile is None else percentile
+    if percentile:
+        return min(total, math.ceil(total * percentile / 100))
+    return min(total, max(0, top_n))
+
+
+def llm_shortlist(job_id, top_n=None, percentile=None):
+    """
+    Kandidat passed_filter job ini dengan local_score tertinggi yang BELUM dinilai LLM.
+    Ranking memakai local_score (bukan match_score), jadi skor LLM dan lokal tidak tercampur.
+    Return list (candidate_id, teks CV).
+    """
+    ranked = (
+        db.session.query(CandidateDocument.candidate_id, Candidate.scoring_stage)
+        .join(Candidate, Candidate.id == CandidateDocument.candidate_id)
+        .filter(CandidateDocument.job_id == job_id, Candidate.status == "passed_filter")
+        .order_by(CandidateDocument.local_score.desc(), CandidateDocument.candidate_id)
+    )
+    size = shortlist_size(ranked.count(), top_n, percentile)
+    if size <= 0:
+        return []
+
+    pending = [candidate_id for candidate_id, stage in ranked.limit(size).all() if stage != "llm"]
+    if not pending:
+        return []
+    texts = dict(
+        db.session.query(CandidateDocument.candidate_id, CandidateDocument.text)
+        .filter(CandidateDocument.candidate_id.in_(pending))
+        .all()
+    )
+    return [(candidate_id, texts.get(candidate_id)) for candidate_id in pending]
+
+
+def _current_jd_hash(job_id):
+    # Tutup transaksi baca yang lama dulu (REPEATABLE READ) supaya JD terbaru terlihat
+    db.session.commit()
+    return text_hash(db.session.query(Job.job_description).filter(Job.id == job_id).scalar())
+
+
+def _write_llm_score(job_id, jd_hash, candidate_id, ai_result):
+    """Tulis skor LLM; dibuang (return False) kalau JD job sudah berubah sejak penilaian dimulai."""
+    if _current_jd_hash(job_id) != jd_hash:
+        return False
+    databases.update_candidate_score(
+        candidate_id,
+        ai_result.get("match_score", 0),
+        scoring_reason=ai_result.get("reasoning"),
+        scoring_stage="llm",
+    )
+    return True
+
+
+def score_shortlist(job, shortlist, on_done=None, thread_name_prefix="llm-stage"):
+    """
+    Nilai shortlist [(candidate_id, teks CV)] terhadap JD job dengan Gemini di pool worker
+    terbatas (Config.RESCORE_WORKERS). Request paralel di worker, penulisan DB tetap di thread
+    pemanggil (satu session). on_done(candidate_id, dinilai?) dipanggil per kandidat.
+    Berhenti lebih awal kalau dibatalkan (cancel_llm_stage) atau JD berubah di tengah jalan.
+    Return jumlah kandidat yang dinilai LLM.
+    """
+    shortlist = [(candidate_id, text) for candidate_id, text in shortlist if text]
+    if not shortlist:
+        return 0
+
+    job_id = job.id
+    job_description = job.job_description or ""
+    jd_hash = text_hash(job.job_description)
+    cancel = threading.Event()
+    with _lock:
+        _cancels[job_id] = cancel
+
+    scored = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, Config.RESCORE_WORKERS), thread_name_prefix=thread_name_prefix) as pool:
+            futures = {
+                pool.submit(get_ai_match_score, cv_text, job_description): candidate_id
+                for candidate_id, cv_text in shortlist
+            }
+            for future in as_completed(futures):
+                if cancel.is_set():
+                    print(f"⏹️ [CASCADE] Stage LLM job {job_id} dibatalkan, sisa shortlist tidak dinilai")
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                candidate_id = futures[future]
+                try:
+                    ai_result = future.result()
+                except Exception as e:
+                    print(f"⚠️ [CASCADE] LLM error untuk kandidat {candidate_id}: {e}")
+                    ai_result = {}
+                # get_ai_match_score mengembalikan schema kosong kalau Gemini error
+                ok = bool(ai_result.get("reasoning"))
+                if not ok:
+                    print(f"⚠️ [CASCADE] LLM gagal untuk kandidat {candidate_id}, tetap memakai skor lokal")
+                elif not _write_llm_score(job_id, jd_hash, candidate_id, ai_result):
+                    # Sisa shortlist juga dinilai dengan JD lama -> hentikan
+                    print(f"⚠️ [CASCADE] JD job {job_id} berubah, skor LLM kandidat {candidate_id} dibuang")
+                    cancel.set()
+                    ok = False
+                else:
+                    scored += 1
+                if on_done:
+                    on_done(candidate_id, ok)
+    finally:
+        with _lock:
+            if _cancels.get(job_id) is cancel:
+                del _cancels[job_id]
+    return scored
+
+
+def run_llm_stage(job, top_n=None, percentile=None, on_start=None, on_done=None, thread_name_prefix="llm-stage"):
+    """
+    Stage 2 secara sinkron di bawah lock stage per job (menunggu stage lain yang sedang
+    berjalan). JD dan shortlist dibaca ulang setelah lock didapat. on_start(shortlist)
+    dipanggil sebelum penilaian dimulai. Return jumlah kandidat shortlist yang dinilai LLM.
+    """
+    with stage_lock(job.id):
+        _current_jd_hash(job.id)  # job di-expire oleh commit -> JD terbaru dibaca ulang
+        shortlist = [(candidate_id, text) for candidate_id, text in llm_shortlist(job.id, top_n, percentile) if text]
+        if on_start:
+            on_start(shortlist)
+        return score_shortlist(job, shortlist, on_done=on_done, thread_name_prefix=thread_name_prefix)
+
+
+def start_llm_stage(job_id, top_n=None, percentile=None):
+    """
+    Jadwalkan stage 2 di background thread (maksimal satu per job). Upload berikutnya
+    saat stage masih berjalan diantrekan sebagai satu run lanjutan; shortlist dihitung
+    ulang saat run dimulai, jadi kandidat yang sudah dinilai LLM tidak dinilai dua kali.
+    Return True kalau thread baru dimulai, False kalau diantrekan.
+    """
+    from flask import current_app
+
+    with _lock:
+        if job_id in _running:
+            _reruns[job_id] = (top_n, percentile)
+            return False
+        _running.add(job_id)
+
+    app = current_app._get_current_object()
+
+    def run():
+        params = (top_n, percentile)
+        while params is not None:
+            with app.app_context():
+                try:
+                    job = db.session.get(Job, job_id)
+                    if job is not None:
+                        scored = run_llm_stage(job, *params)
+                        print(f"🤖 [CASCADE] Job {job_id}: {scored} kandidat shortlist dinilai LLM")
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"!!! [CASCADE] Stage LLM gagal, kandidat tetap memakai skor lokal: {e}")
+                finally:
+                    db.session.remove()
+            with _lock:
+                params = _reruns.pop(job_id, None)
+                if params is None:
+                    _running.discard(job_id)
+
+    threading.Thread(target=run, name=f"llm-stage-{job_id}", daemon=True).start()
+    return True
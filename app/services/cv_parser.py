@@ -1,39 +1,102 @@
 import os
+import re
+from collections import defaultdict
+
 import fitz  #pyMuPDF
 import docx
 
+# Pita atas / bawah halaman (rasio tinggi halaman) tempat header & footer berada
+MARGIN_BAND = 0.08
+PAGE_NUMBER_RE = re.compile(r"^\W*(page|halaman|hal\.?)?\s*\d+\s*((of|dari|/)\s*\d+)?\W*$", re.IGNORECASE)
+MIN_DUPLICATE_LENGTH = 40
+
+
+def _normalize(text):
+    return re.sub(r"\s+", " ", re.sub(r"\d+", "#", text)).strip().lower()
+
+
+def _mark_boilerplate(blocks, page_count):
+    """
+    Tandai blok boilerplate dari layout PyMuPDF:
+    - nomor halaman / header / footer: blok di pita atas-bawah halaman yang berupa nomor
+      halaman, atau teksnya (angka diabaikan) muncul di >= 2 halaman;
+    - blok duplikat: teks panjang yang identik dengan blok sebelumnya.
+    """
+    pages_by_text = defaultdict(set)
+    for block in blocks:
+        if block["in_margin"]:
+            pages_by_text[_normalize(block["text"])].add(block["page"])
+
+    seen = set()
+    for block in blocks:
+        key = _normalize(block["text"])
+        repeated = page_count > 1 and len(pages_by_text.get(key, ())) >= 2
+        if block["in_margin"] and (PAGE_NUMBER_RE.match(block["text"].strip()) or repeated):
+            block["boilerplate"] = True
+        elif len(key) >= MIN_DUPLICATE_LENGTH and key in seen:
+            block["boilerplate"] = True
+        seen.add(key)
+    return blocks
+
+
+def extract_blocks(file_path, drop_boilerplate=True):
+    """
+    Blok teks CV dalam urutan baca (halaman, atas ke bawah, kiri ke kanan):
+    list dict {"page", "x0", "y0", "y1", "text", "in_margin", "boilerplate"}.
+    PDF memakai layout blok PyMuPDF; DOCX satu blok per paragraf (header/footer Word terpisah).
+    """
+    if file_path.endswith('.pdf'):
+        blocks = []
+        with fitz.open(file_path) as doc:
+            page_count = len(doc)
+            for page in doc:
+                height = page.rect.height or 1
+                for x0, y0, x1, y1, text, _, block_type in page.get_text("blocks"):
+                    if block_type != 0 or not text.strip():  # 1 = blok gambar
+                        continue
+                    blocks.append({
+                        "page": page.number,
+                        "x0": x0,
+                        "y0": y0,
+                        "y1": y1,
+                        "text": text.strip(),
+                        "in_margin": y1 <= height * MARGIN_BAND or y0 >= height * (1 - MARGIN_BAND),
+                        "boilerplate": False,
+                    })
+        blocks.sort(key=lambda b: (b["page"], b["y0"], b["x0"]))
+        _mark_boilerplate(blocks, page_count)
+
+    elif file_path.endswith('.docx'):
+        doc = docx.Document(file_path)
+        blocks = [
+            {"page": 0, "x0": 0, "y0": i, "y1": i, "text": para.text.strip(), "in_margin": False, "boilerplate": False}
+            for i, para in enumerate(doc.paragraphs) if para.text.strip()
+        ]
+        _mark_boilerplate(blocks, 1)
+
+    else:
+        return []
+
+    if drop_boilerplate:
+        blocks = [block for block in blocks if not block["boilerplate"]]
+    return blocks
+
 
 def extract_text(file_path):
     """
     Mengekstrak teks dari file PDF (menggunakan PyMuPDF) atau DOCX.
+    Blok diurutkan per halaman; header/footer berulang, nomor halaman dan blok duplikat dibuang.
     """
     try:
         if not os.path.exists(file_path):
             print(f"Error: File tidak ditemukan di {file_path}")
             return None
 
-        if file_path.endswith('.pdf'):
-            doc = fitz.open(file_path)
-            all_blocks = []
-            for page in doc:
-                all_blocks.extend(page.get_text("blocks"))
-            doc.close()
-            
-            all_blocks.sort(key=lambda b: (b[1], b[0]))
-            
-            full_text = "\n".join([block[4] for block in all_blocks])
-            return full_text
-
-        elif file_path.endswith('.docx'):
-            doc = docx.Document(file_path)
-            full_text = []
-            for para in doc.paragraphs:
-                full_text.append(para.text)
-            return '\n'.join(full_text)
-        
-        else:
+        if not file_path.endswith(('.pdf', '.docx')):
             return None
 
+        return "\n".join(block["text"] for block in extract_blocks(file_path))
+
     except Exception as e:
         print(f"Terjadi error saat memproses file {file_path}: {e}")
         return None
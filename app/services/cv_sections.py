@@ -0,0 +1,183 @@
+# app/services/cv_sections.py
+import re
+
+# Heading CV (Inggris / Indonesia) -> nama section kanonik
+SECTION_HEADINGS = {
+    "experience": [
+        "work experience", "professional experience", "experience", "employment history",
+        "work history", "pengalaman kerja", "pengalaman profesional", "pengalaman", "riwayat pekerjaan",
+        "internship", "internship experience", "pengalaman magang",
+    ],
+    "projects": ["projects", "project experience", "personal projects", "proyek", "projek"],
+    "skills": [
+        "skills", "technical skills", "hard skills", "soft skills", "core competencies",
+        "keterampilan", "keahlian", "kemampuan", "tools", "technologies",
+    ],
+    "education": ["education", "academic background", "pendidikan", "riwayat pendidikan"],
+    "certifications": ["certifications", "certificates", "licenses", "sertifikasi", "sertifikat"],
+    "organization": ["organizational experience", "organisational experience", "organization", "organisation",
+                     "organisasi", "pengalaman organisasi", "volunteer", "leadership"],
+    "summary": ["summary", "professional summary", "profile", "about me", "objective",
+                "ringkasan", "profil", "tentang saya"],
+    # Tidak dibutuhkan untuk penilaian -> dibuang dari prompt LLM
+    "references": ["references", "referensi", "referees"],
+    "interests": ["interests", "hobbies", "hobi", "minat"],
+}
+
+# Section yang dipertahankan lebih dulu saat teks CV harus dipotong (header = nama & kontak)
+SECTION_PRIORITY = [
+    "header", "experience", "skills", "education", "summary",
+    "projects", "certifications", "organization",
+]
+DROPPED_SECTIONS = {"references", "interests"}
+
+# Estimasi token Gemini: ~4 karakter per token untuk teks Latin
+CHARS_PER_TOKEN = 4
+# Baris pendek (nama kampus, jabatan) wajar berulang; hanya paragraf panjang yang dianggap duplikat
+MIN_DUPLICATE_LINE = 60
+
+_HEADING_LOOKUP = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+# Heading yang juga lazim sebagai isi (mis. "Leadership, Teamwork") tidak dicocokkan sebagai awalan
+_NO_PREFIX = {"leadership", "tools", "technologies", "volunteer", "internship", "profile", "profil", "minat"}
+_PREFIX_HEADINGS = sorted((h for h in _HEADING_LOOKUP if h not in _NO_PREFIX), key=len, reverse=True)
+_HEADING_RE = re.compile(r"^[\s•\-\*#]*([A-Za-z][A-Za-z &/,']{2,60}?)[\s:]*$")
+MAX_HEADING_WORDS = 6
+
+
+def heading_section(line):
+    """
+    Nama section kanonik kalau baris ini heading (pendek, tanpa isi lain), else None.
+    Variasi seperti "Work Experiences", "Education Level" atau "Skills, Achievements & Other"
+    dikenali lewat bentuk tunggal / awalan heading yang dikenal.
+    """
+    match = _HEADING_RE.match(line)
+    if not match:
+        return None
+    heading = re.sub(r"\s+", " ", match.group(1).strip().lower())
+    if len(heading.split()) > MAX_HEADING_WORDS:
+        return None
+    if heading in _HEADING_LOOKUP:
+        return _HEADING_LOOKUP[heading]
+    words = [word for word in re.split(r"[ ,&/]+", heading) if word]
+    plain = " ".join(words)
+    singular = " ".join(word[:-1] if word.endswith("s") and len(word) > 3 else word for word in words)
+    for candidate in (plain, singular):
+        if candidate in _HEADING_LOOKUP:
+            return _HEADING_LOOKUP[candidate]
+    for known in _PREFIX_HEADINGS:
+        if plain.startswith(known + " ") or singular.startswith(known + " "):
+            return _HEADING_LOOKUP[known]
+    return None
+
+
+def split_sections(text):
+    """
+    Pecah teks CV menjadi {section: teks}. Baris sebelum heading pertama masuk "header".
+    Section dengan nama sama (mis. dua heading "Experience") digabung.
+    """
+    sections = {}
+    current = "header"
+    for line in (text or "").splitlines():
+        section = heading_section(line)
+        if section:
+            current = section
+            continue
+        if line.strip():
+            sections.setdefault(current, []).append(line.strip())
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def estimate_tokens(text):
+    return -(-len(text or "") // CHARS_PER_TOKEN)
+
+
+def _clean_lines(text):
+    """Rapikan spasi dan buang baris duplikat (blok yang terulang, mis. header halaman)."""
+    seen = set()
+    lines = []
+    for line in text.splitlines():
+        line = re.sub(r"[ \t]+", " ", line).strip()
+        key = line.lower()
+        if not line or (len(key) >= MIN_DUPLICATE_LINE and key in seen):
+            continue
+        seen.add(key)
+        lines.append(line)
+    return lines
+
+
+def compact_cv(text, token_budget):
+    """
+    Teks CV untuk prompt LLM: section dikenali, section tak berguna (referensi, hobi) dan
+    baris duplikat dibuang, lalu section diisi menurut SECTION_PRIORITY sampai token_budget.
+    Section yang tidak muat penuh dipotong per baris. Urutan asli CV dipertahankan dan
+    setiap section diberi label (EXPERIENCE:, SKILLS:, ...) supaya LLM tetap tahu konteksnya.
+    token_budget <= 0 -> tanpa batas.
+    """
+    sections = {
+        name: _clean_lines(body) for name, body in split_sections(text).items()
+        if name not in DROPPED_SECTIONS
+    }
+    order = list(sections)
+    budget_chars = token_budget * CHARS_PER_TOKEN if token_budget and token_budget > 0 else None
+
+    kept = {}
+    used = 0
+    for name in sorted(order, key=lambda n: SECTION_PRIORITY.index(n) if n in SECTION_PRIORITY else len(SECTION_PRIORITY)):
+        label = "" if name == "header" else f"{name.upper()}:\n"
+        lines = []
+        for line in sections[name]:
+            cost = len(line) + 1 + (len(label) if not lines else 0)
+            if budget_chars is not None and used + cost > budget_chars:
+                break
+            lines.append(line)
+            used += cost
+        if lines:
+            kept[name] = label + "\n".join(lines)
+
+    return "\n\n".join(kept[name] for name in order if name in kept)
+
+
+def _benchmark(folder="test_cvs", token_budget=None):
+    """Penghematan token (dan latency Gemini, kalau GEMINI_API_KEY ada) untuk CV di test_cvs."""
+    import os
+    import time
+
+    from app.services.cv_parser import extract_text, extract_blocks
+    from config import Config
+
+    token_budget = Config.CV_PROMPT_TOKEN_BUDGET if token_budget is None else token_budget
+    live = bool(os.getenv("GEMINI_API_KEY"))
+    jd = "Data Analyst. Requirements: SQL, Python, Tableau, statistics, 2 years experience."
+    if live:
+        from app.services.ai_analyzer import get_ai_match_score
+
+    for filename in sorted(os.listdir(folder)):
+        path = os.path.join(folder, filename)
+        if not filename.endswith((".pdf", ".docx")):
+            continue
+        raw = "\n".join(block["text"] for block in extract_blocks(path, drop_boilerplate=False))
+        text = extract_text(path)
+        start = time.perf_counter()
+        compact = compact_cv(text, token_budget)
+        compact_ms = (time.perf_counter() - start) * 1000
+
+        raw_tokens, compact_tokens = estimate_tokens(raw), estimate_tokens(compact)
+        print(
+            f"{filename:22s} raw={raw_tokens:5d} tok  compact={compact_tokens:5d} tok  "
+            f"hemat={100 * (1 - compact_tokens / max(raw_tokens, 1)):5.1f}%  segmentasi={compact_ms:.1f} ms"
+        )
+        if live:
+            timings = []
+            for cv in (raw, compact):
+                start = time.perf_counter()
+                get_ai_match_score(cv, jd, token_budget=0)
+                timings.append(time.perf_counter() - start)
+            print(f"{'':22s} gemini raw={timings[0]:.2f}s compact={timings[1]:.2f}s delta={timings[1] - timings[0]:+.2f}s")
+    if not live:
+        print("GEMINI_API_KEY tidak diset: delta latency Gemini tidak diukur.")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,105 @@
+# app/services/experience_parser.py
+import re
+from datetime import date
+
+# Kata seniority di depan jabatan dibuang saat normalisasi,
+# sehingga "Senior Software Engineer" dan "Software Engineer" punya normalized_title yang sama
+SENIORITY_WORDS = {
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "head",
+    "intern", "internship", "magang", "trainee", "associate", "chief",
+}
+
+MONTHS = {
+    "jan": 1, "january": 1, "januari": 1,
+    "feb": 2, "february": 2, "februari": 2,
+    "mar": 3, "march": 3, "maret": 3,
+    "apr": 4, "april": 4,
+    "may": 5, "mei": 5,
+    "jun": 6, "june": 6, "juni": 6,
+    "jul": 7, "july": 7, "juli": 7,
+    "aug": 8, "august": 8, "agu": 8, "agustus": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10, "okt": 10, "oktober": 10,
+    "nov": 11, "november": 11, "nop": 11, "nopember": 11,
+    "dec": 12, "december": 12, "des": 12, "desember": 12,
+}
+
+PRESENT_WORDS = {"now", "present", "current", "sekarang", "saat ini", "kini"}
+
+DATE_PART_RE = re.compile(r"\(([^()]*)\)\s*$")
+RANGE_SPLIT_RE = re.compile(r"\s*(?:-|–|—|\bto\b|\bsampai\b|\bhingga\b|s/d)\s*", re.IGNORECASE)
+COMPANY_SPLIT_RE = re.compile(r"\s+(?:at|di|@|\|)\s+", re.IGNORECASE)
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalisasi jabatan untuk index: lowercase, buang tanda baca,
+    buang kata seniority di depan ("senior", "jr", "intern", ...).
+    """
+    if not title:
+        return ""
+    words = re.sub(r"[^a-z0-9+#/ ]+", " ", title.lower()).split()
+    while len(words) > 1 and words[0] in SENIORITY_WORDS:
+        words = words[1:]
+    return " ".join(words)[:255]
+
+
+def _parse_date(text: str):
+    """'May 2023' -> date(2023, 5, 1), '2021' -> date(2021, 1, 1), 'NOW' -> None."""
+    text = (text or "").strip().lower()
+    if not text or text in PRESENT_WORDS:
+        return None
+
+    year_match = re.search(r"(19|20)\d{2}", text)
+    if not year_match:
+        return None
+    year = int(year_match.group(0))
+
+    month = 1
+    for word in re.findall(r"[a-z]+", text):
+        if word in MONTHS:
+            month = MONTHS[word]
+            break
+    else:
+        numeric_month = re.search(r"\b(0?[1-9]|1[0-2])\s*/\s*(19|20)\d{2}", text)
+        if numeric_month:
+            month = int(numeric_month.group(1))
+
+    return date(year, month, 1)
+
+
+def parse_experience_entry(entry: str) -> dict:
+    """
+    Pecah satu string experience dari parser AI, contoh:
+    "Business Analyst di CV. Nur Cahaya Pratama (May 2023–NOW)"
+    menjadi title, normalized_title, company, start_date, end_date.
+    """
+    entry = (entry or "").strip()
+    start_date = end_date = None
+
+    date_match = DATE_PART_RE.search(entry)
+    if date_match:
+        range_parts = RANGE_SPLIT_RE.split(date_match.group(1).strip(), maxsplit=1)
+        start_date = _parse_date(range_parts[0])
+        if len(range_parts) > 1:
+            end_date = _parse_date(range_parts[1])
+        entry = entry[:date_match.start()].strip()
+
+    company = None
+    company_parts = COMPANY_SPLIT_RE.split(entry, maxsplit=1)
+    title = company_parts[0].strip(" ,-")
+    if len(company_parts) > 1:
+        company = company_parts[1].strip(" ,-") or None
+
+    return {
+        "title": title[:255] or None,
+        "normalized_title": normalize_title(title),
+        "company": company[:255] if company else None,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+
+
+def escape_like(value: str) -> str:
+    """Escape wildcard LIKE (% dan _) dari input user."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
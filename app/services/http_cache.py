@@ -0,0 +1,50 @@
+# app/services/http_cache.py
+import hashlib
+from datetime import timezone
+
+from flask import request, make_response
+
+
+def make_etag(*parts) -> str:
+    """ETag dari version stamp resource + parameter request (filter, cursor, dll)."""
+    raw = "|".join(str(p) for p in parts)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _as_utc(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def is_not_modified(etag, last_modified=None) -> bool:
+    """Cek If-None-Match (prioritas) lalu If-Modified-Since."""
+    if request.if_none_match:
+        # Weak comparison: ETag jadi W/"..." setelah response dikompres (app.compression)
+        return request.if_none_match.contains_weak(etag)
+
+    last_modified = _as_utc(last_modified)
+    if last_modified is not None and request.if_modified_since is not None:
+        # HTTP date hanya presisi detik
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def conditional_response(etag, last_modified, build_response):
+    """
+    Jawab 304 tanpa memanggil build_response() kalau client sudah punya versi ini,
+    kalau tidak build response lengkap lalu tempel ETag / Last-Modified.
+    """
+    if is_not_modified(etag, last_modified):
+        response = make_response("", 304)
+    else:
+        response = make_response(build_response())
+
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+    # Boleh di-cache browser, tapi selalu revalidate ke server
+    response.headers["Cache-Control"] = "no-cache"
+    return response
@@ -0,0 +1,82 @@
+# app/services/job_features.py
+"""
+Fitur sisi job yang dihitung SEKALI (saat create_job / backfill) lalu disimpan di
+Job.jd_features, supaya jalur scoring tidak mengulang spaCy, pencocokan skill
+berdasarkan judul, dan parsing degree_requirements untuk setiap CV.
+"""
+import hashlib
+import json
+from datetime import datetime
+
+from app.extensions import db
+from app.services.ai_analyzer import extract_jd_keywords
+from app.services.skill_matcher import skills_in_text, vocabulary_version
+from app.services.talent_facets import education_level
+
+# v2: skill diturunkan dari JD + requirements_json (skill_matcher), bukan dari judul job
+FEATURES_VERSION = 2
+
+EDUCATION_LEVELS = {"D3": 1, "S1": 2, "S2": 3, "S3": 4}
+
+
+def education_rank(text):
+    """0 = tidak ada / tidak dikenali, 1 = D3 ... 4 = S3 (urutan cek sama seperti filter upload)."""
+    return EDUCATION_LEVELS.get(education_level(text), 0)
+
+
+def job_text(job):
+    """JD lengkap: deskripsi + daftar requirement."""
+    requirements = job.requirements_json or []
+    if isinstance(requirements, dict):
+        requirements = requirements.values()
+    return "\n".join([job.job_description or ""] + [str(r) for r in requirements if r])
+
+
+def features_hash(job):
+    # vocabulary_version ikut di-hash: skill tersimpan dihitung ulang saat skill kurasi / alias berubah
+    raw = json.dumps(
+        [job.job_title, job.job_description, job.degree_requirements, job.requirements_json, vocabulary_version()],
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def compute_job_features(job):
+    text = job_text(job)
+    # Satu pass Aho-Corasick atas judul + JD + requirement untuk seluruh vocabulary skill
+    skills = skills_in_text(f"{job.job_title or ''}\n{text}")
+
+    label = education_level(job.degree_requirements) if job.degree_requirements else None
+    return {
+        "version": FEATURES_VERSION,
+        "source_hash": features_hash(job),
+        "keywords": extract_jd_keywords(text),
+        "skills": skills,
+        "education_level": EDUCATION_LEVELS.get(label, 0),
+        "education_label": label if label in EDUCATION_LEVELS else None,
+        "computed_at": datetime.utcnow().isoformat(),
+    }
+
+
+def is_fresh(job):
+    features = job.jd_features or {}
+    return features.get("version") == FEATURES_VERSION and features.get("source_hash") == features_hash(job)
+
+
+def refresh_job_features(job, commit=True):
+    job.jd_features = compute_job_features(job)
+    if commit:
+        db.session.commit()
+    return job.jd_features
+
+
+def get_job_features(job):
+    """Fitur job yang tersimpan; dihitung ulang (dan disimpan) kalau belum ada atau JD berubah."""
+    if is_fresh(job):
+        return job.jd_features
+    try:
+        return refresh_job_features(job)
+    except Exception as e:
+        db.session.rollback()
+        print(f"Database error in refresh_job_features: {e}")
+        return compute_job_features(job)
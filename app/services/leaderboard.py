@@ -0,0 +1,168 @@
+# app/services/leaderboard.py
+import threading
+
+from sortedcontainers import SortedList
+
+from app.extensions import db
+from app.models import Candidate, JobLeaderboardEntry
+from config import Config
+
+
+class JobLeaderboard:
+    """
+    Ranking kandidat 'passed_filter' untuk satu job.
+    SortedList berisi (-score, candidate_id) -> insert/remove/rank O(log n),
+    top-K O(log n + K). Skor sama diurutkan berdasarkan candidate_id supaya stabil.
+    """
+
+    def __init__(self, rows=()):
+        self._scores = {}
+        self._entries = SortedList()
+        for candidate_id, score in rows:
+            self.upsert(candidate_id, score)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def upsert(self, candidate_id, score):
+        score = float(score or 0)
+        self.remove(candidate_id)
+        self._scores[candidate_id] = score
+        self._entries.add((-score, candidate_id))
+
+    def remove(self, candidate_id):
+        old_score = self._scores.pop(candidate_id, None)
+        if old_score is not None:
+            self._entries.discard((-old_score, candidate_id))
+
+    def top(self, k):
+        return [(candidate_id, -neg_score) for neg_score, candidate_id in self._entries.islice(0, k)]
+
+    def rank_of(self, candidate_id):
+        """Rank 1-based, None jika kandidat tidak ada di leaderboard."""
+        score = self._scores.get(candidate_id)
+        if score is None:
+            return None
+        return self._entries.index((-score, candidate_id)) + 1
+
+    def percentile_of(self, candidate_id):
+        """Persentase kandidat lain yang skornya di bawah kandidat ini (0-100)."""
+        rank = self.rank_of(candidate_id)
+        if rank is None:
+            return None
+        total = len(self._entries)
+        if total <= 1:
+            return 100.0
+        return round((total - rank) / (total - 1) * 100, 2)
+
+    def score_of(self, candidate_id):
+        return self._scores.get(candidate_id)
+
+
+class LeaderboardRegistry:
+    """
+    Leaderboard per job, di-load dari DB sekali lalu di-update incremental oleh
+    databases.save_candidate / update_candidate_status. Top-N juga disimpan ke
+    tabel job_leaderboard_entries supaya top-K bisa dilayani tanpa load penuh.
+    """
+
+    def __init__(self, top_n=100):
+        self.top_n = top_n
+        self._boards = {}
+        self._lock = threading.RLock()
+
+    def get(self, job_id):
+        with self._lock:
+            board = self._boards.get(job_id)
+            if board is None:
+                rows = (
+                    db.session.query(Candidate.id, Candidate.match_score)
+                    .filter(Candidate.job_id == job_id, Candidate.status == "passed_filter")
+                    .all()
+                )
+                board = JobLeaderboard(rows)
+                self._boards[job_id] = board
+            return board
+
+    def is_loaded(self, job_id):
+        return job_id in self._boards
+
+    def on_candidate_saved(self, job_id, candidate_id, status, score):
+        """Update incremental setelah kandidat disimpan / statusnya berubah."""
+        with self._lock:
+            if not self.is_loaded(job_id):
+                # Belum pernah dipakai -> akan di-load lengkap saat pertama kali dibutuhkan,
+                # tapi snapshot top-N di DB tetap harus ikut berubah
+                self._refresh_snapshot_if_needed(job_id, candidate_id, status, score)
+                return
+
+            board = self._boards[job_id]
+            was_in_top = self._in_top_n(board, candidate_id)
+            if status == "passed_filter":
+                board.upsert(candidate_id, score)
+            else:
+                board.remove(candidate_id)
+
+            if was_in_top or self._in_top_n(board, candidate_id):
+                self._write_snapshot(job_id, board)
+
+    def reload(self, job_id):
+        """Bulk update (mis. re-scoring satu job) -> load ulang dari DB dan tulis ulang snapshot."""
+        with self._lock:
+            self._boards.pop(job_id, None)
+            self._write_snapshot(job_id, self.get(job_id))
+
+    def top_k(self, job_id, k):
+        """
+        Top-K kandidat. Kalau leaderboard in-memory belum di-load dan K <= top_n,
+        dilayani langsung dari snapshot DB (index (job_id, rank)).
+        """
+        if not self.is_loaded(job_id) and k <= self.top_n:
+            entries = (
+                db.session.query(JobLeaderboardEntry.candidate_id, JobLeaderboardEntry.match_score)
+                .filter(JobLeaderboardEntry.job_id == job_id)
+                .order_by(JobLeaderboardEntry.rank)
+                .limit(k)
+                .all()
+            )
+            if entries:
+                return [(candidate_id, float(score or 0)) for candidate_id, score in entries]
+
+        return self.get(job_id).top(k)
+
+    def _in_top_n(self, board, candidate_id):
+        rank = board.rank_of(candidate_id)
+        return rank is not None and rank <= self.top_n
+
+    def _refresh_snapshot_if_needed(self, job_id, candidate_id, status, score):
+        lowest = (
+            db.session.query(JobLeaderboardEntry.match_score)
+            .filter(JobLeaderboardEntry.job_id == job_id)
+            .order_by(JobLeaderboardEntry.rank.desc())
+            .first()
+        )
+        count = db.session.query(JobLeaderboardEntry.id).filter(JobLeaderboardEntry.job_id == job_id).count()
+        in_snapshot = db.session.query(JobLeaderboardEntry.id).filter_by(
+            job_id=job_id, candidate_id=candidate_id
+        ).first() is not None
+
+        enters_top = status == "passed_filter" and (
+            count < self.top_n or lowest is None or float(score or 0) > float(lowest[0] or 0)
+        )
+        if enters_top or in_snapshot:
+            self._write_snapshot(job_id, self.get(job_id))
+
+    def _write_snapshot(self, job_id, board):
+        try:
+            JobLeaderboardEntry.query.filter_by(job_id=job_id).delete(synchronize_session=False)
+            db.session.bulk_insert_mappings(JobLeaderboardEntry, [
+                {"job_id": job_id, "candidate_id": candidate_id, "rank": rank, "match_score": score}
+                for rank, (candidate_id, score) in enumerate(board.top(self.top_n), start=1)
+            ])
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"Database error in leaderboard snapshot: {e}")
+
+
+LEADERBOARDS = LeaderboardRegistry(top_n=Config.LEADERBOARD_TOP_N)
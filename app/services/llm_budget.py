@@ -0,0 +1,178 @@
+# app/services/llm_budget.py
+"""
+Latency budget untuk panggilan LLM di endpoint user-facing.
+
+- Setiap budget mencatat latency panggilan yang berhasil; p95-nya dipakai sebagai
+  batas hedge: kalau request pertama belum selesai setelah p95, satu request duplikat
+  dikirim dan hasil yang pertama valid yang dipakai.
+- Lewat hard deadline, endpoint langsung menerima hasil fallback lokal (provisional).
+  Request LLM tetap berjalan di background; hasil valid pertama yang datang
+  diteruskan ke on_late_result (mis. untuk menimpa skor provisional di DB).
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from config import Config
+
+MIN_SAMPLES = 20
+WINDOW = 200
+
+_executor = ThreadPoolExecutor(max_workers=Config.LLM_MAX_INFLIGHT, thread_name_prefix="llm-budget")
+
+
+def _in_app_context(callback):
+    """Bungkus callback supaya bisa akses DB dari thread worker."""
+    try:
+        from flask import current_app, has_app_context
+        if not has_app_context():
+            return callback
+        app = current_app._get_current_object()
+    except ImportError:
+        return callback
+
+    def run(result):
+        from app.extensions import db
+        with app.app_context():
+            try:
+                callback(result)
+            except Exception as e:
+                db.session.rollback()
+                print(f"⚠️ [LLM BUDGET] write-back gagal: {e}")
+            finally:
+                db.session.remove()
+    return run
+
+
+class LatencyBudget:
+    def __init__(self, name, deadline, default_hedge_delay):
+        self.name = name
+        self.deadline = deadline
+        self.default_hedge_delay = default_hedge_delay
+        self._samples = deque(maxlen=WINDOW)
+        self._lock = threading.Lock()
+        self._counters = {"calls": 0, "hedged": 0, "provisional": 0, "late_results": 0}
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def _count(self, key):
+        with self._lock:
+            self._counters[key] += 1
+
+    def p95(self):
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+    def hedge_delay(self):
+        # Hedge harus sempat selesai sebelum deadline
+        delay = self.p95() or self.default_hedge_delay
+        return min(delay, self.deadline * 0.75)
+
+    def stats(self):
+        p95 = self.p95()
+        hedge_delay = self.hedge_delay()
+        with self._lock:
+            return {
+                "name": self.name,
+                "deadline_s": self.deadline,
+                "p95_s": round(p95, 3) if p95 is not None else None,
+                "hedge_delay_s": round(hedge_delay, 3),
+                "samples": len(self._samples),
+                **self._counters,
+            }
+
+    def _submit(self, call):
+        started = time.monotonic()
+
+        def timed():
+            result = call()
+            return result, time.monotonic() - started
+        return _executor.submit(timed)
+
+    def run(self, call, is_valid, fallback, on_late_result=None):
+        """
+        Jalankan call() dengan hedge + deadline. Return (hasil, info) dengan
+        info = {"provisional", "hedged", "elapsed_ms"}.
+        - hasil valid sebelum deadline -> hasil LLM
+        - semua percobaan gagal sebelum deadline -> fallback() (tidak provisional)
+        - lewat deadline -> fallback() dengan provisional=True; hasil LLM yang datang
+          belakangan diteruskan ke on_late_result (sekali saja)
+        """
+        self._count("calls")
+        start = time.monotonic()
+        pending = {self._submit(call)}
+        hedged = False
+
+        def remaining():
+            return self.deadline - (time.monotonic() - start)
+
+        while pending and remaining() > 0:
+            timeout = remaining()
+            if not hedged:
+                timeout = min(timeout, max(0.0, self.hedge_delay() - (time.monotonic() - start)))
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                try:
+                    result, seconds = future.result()
+                except Exception as e:
+                    print(f"⚠️ [LLM BUDGET] {self.name}: request error {e}")
+                    continue
+                if is_valid(result):
+                    self.record(seconds)
+                    return result, {"provisional": False, "hedged": hedged, "elapsed_ms": round((time.monotonic() - start) * 1000)}
+
+            # Request pertama melewati p95 (atau gagal cepat) -> kirim satu duplikat
+            if not hedged and remaining() > 0:
+                hedged = True
+                self._count("hedged")
+                print(f"⏱️ [LLM BUDGET] {self.name}: lewat {self.hedge_delay():.1f}s, kirim hedged request")
+                pending.add(self._submit(call))
+
+        info = {"provisional": bool(pending), "hedged": hedged, "elapsed_ms": round((time.monotonic() - start) * 1000)}
+        if pending:
+            self._count("provisional")
+            print(f"⌛ [LLM BUDGET] {self.name}: deadline {self.deadline}s terlewati, pakai hasil lokal provisional")
+            self._forward_late(pending, is_valid, on_late_result)
+        return fallback(), info
+
+    def _forward_late(self, futures, is_valid, on_late_result):
+        delivered = threading.Event()
+        callback = _in_app_context(on_late_result) if on_late_result else None
+
+        def done(future):
+            try:
+                result, seconds = future.result()
+            except Exception:
+                return
+            if not is_valid(result):
+                return
+            self.record(seconds)
+            # Hasil hedge kedua yang datang belakangan diabaikan
+            with self._lock:
+                if delivered.is_set():
+                    return
+                delivered.set()
+                self._counters["late_results"] += 1
+            if callback:
+                callback(result)
+
+        for future in futures:
+            future.add_done_callback(done)
+
+
+BUDGETS = {
+    "astra_analyze": LatencyBudget(
+        "astra_analyze", Config.LLM_DEADLINE_ASTRA_ANALYZE, Config.LLM_HEDGE_DEFAULT_DELAY
+    ),
+}
+
+
+def budget_stats():
+    return {name: budget.stats() for name, budget in BUDGETS.items()}
@@ -0,0 +1,44 @@
+# app/services/pagination.py
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from config import Config
+
+
+def encode_cursor(values: dict) -> str:
+    """Cursor opaque (base64 JSON) dari nilai sort key baris terakhir sebuah halaman."""
+    def _plain(value):
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    payload = json.dumps({k: _plain(v) for k, v in values.items()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, required_keys=()) -> dict:
+    """Kebalikan encode_cursor. Cursor rusak / tidak lengkap -> ValueError."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("cursor tidak valid")
+
+    if not isinstance(values, dict) or any(key not in values for key in required_keys):
+        raise ValueError("cursor tidak valid")
+    return values
+
+
+def page_size(raw_value) -> int:
+    """?limit=... -> ukuran halaman, dibatasi Config.MAX_PAGE_SIZE."""
+    if raw_value in (None, ""):
+        return Config.DEFAULT_PAGE_SIZE
+    try:
+        size = int(raw_value)
+    except (TypeError, ValueError):
+        raise ValueError("limit harus berupa angka")
+    return min(max(size, 1), Config.MAX_PAGE_SIZE)
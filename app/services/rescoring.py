@@ -0,0 +1,319 @@
+# app/services/rescoring.py
+"""
+Re-scoring background setelah JD / requirement sebuah job diubah.
+
+Tidak ada parsing ulang CV: profil terstruktur (gpa, total_experience, education)
+sudah ada di tabel candidates dan teks CV di candidate_documents.
+
+0. Skill: kalau JD berubah, skill_match_ratio dihitung ulang dari teks CV tersimpan
+   dengan automaton skill job (services.skill_matcher); hanya baris yang berubah di-UPDATE.
+1. Filter: hard filter baru diterapkan dengan UPDATE massal di SQL. Hanya kandidat
+   yang statusnya berubah (lolos -> ditolak, ditolak otomatis -> lolos) yang disentuh.
+2. Lokal: kalau JD berubah, IDF job di-rebuild dan local_score semua CV dihitung ulang
+   (TERM_STATS.renormalize); kalau hanya filter yang berubah, cukup kandidat yang baru lolos.
+3. LLM: shortlist cascade dinilai ulang oleh pool worker terbatas (cascade_scoring.run_llm_stage),
+   di bawah lock stage LLM yang sama dengan cascade upload. Kalau JD berubah, stage cascade
+   yang masih berjalan dibatalkan dulu (skornya memakai JD lama).
+
+Progress per job bisa dibaca lewat get_progress(job_id). Perubahan job saat run masih
+berjalan diantrekan sebagai satu follow-up run (start_rescore(..., queue_if_running=True)).
+"""
+import threading
+from datetime import datetime
+
+from sqlalchemy import case, or_
+
+from app.extensions import db
+from app.models import Candidate, CandidateDocument, Job
+from app.services.cascade_scoring import cancel_llm_stage, run_llm_stage
+from app.services.job_features import EDUCATION_LEVELS, get_job_features
+from app.services.leaderboard import LEADERBOARDS
+from app.services.skill_matcher import JOB_SKILL_MATCHERS, match_job_skills
+from app.services.talent_facets import education_level_case
+from app.services.term_stats import TERM_STATS
+import app.databases as databases
+from config import Config
+
+# Alasan penolakan yang dibuat oleh hard filter upload; penolakan manual HR tidak dibatalkan
+AUTO_REJECTION_PATTERN = "% below minimum requirement (%"
+
+_progress = {}
+# job_id -> jd_changed untuk run lanjutan yang diminta saat run lain masih berjalan
+_follow_ups = {}
+_lock = threading.Lock()
+
+
+def get_progress(job_id):
+    with _lock:
+        progress = _progress.get(job_id)
+        return dict(progress) if progress else None
+
+
+def _update(job_id, **fields):
+    with _lock:
+        _progress[job_id].update(fields)
+
+
+def _increment(job_id, field, amount=1):
+    with _lock:
+        _progress[job_id][field] += amount
+
+
+def _rejection_reason_case(job, features):
+    """CASE SQL alasan penolakan, urutan cek sama dengan upload_and_process_cvs (GPA, pengalaman, edukasi, skill)."""
+    whens = []
+    if job.min_gpa is not None:
+        whens.append((
+            or_(Candidate.gpa.is_(None), Candidate.gpa < job.min_gpa),
+            f"GPA below minimum requirement ({job.min_gpa})",
+        ))
+    if job.min_experience is not None:
+        whens.append((
+            or_(Candidate.total_experience.is_(None), Candidate.total_experience < job.min_experience),
+            f"Experience below minimum requirement ({job.min_experience} years)",
+        ))
+    required_edu_level = features.get("education_level", 0)
+    if required_edu_level > 0:
+        rank = case(*[(education_level_case() == label, level) for label, level in EDUCATION_LEVELS.items()], else_=0)
+        whens.append((
+            rank < required_edu_level,
+            f"Education below minimum requirement ({job.degree_requirements})",
+        ))
+    if Config.MIN_SKILL_MATCH_RATIO > 0 and features.get("skills"):
+        whens.append((
+            Candidate.skill_match_ratio < Config.MIN_SKILL_MATCH_RATIO,
+            f"Skill match below minimum requirement ({Config.MIN_SKILL_MATCH_RATIO}%)",
+        ))
+    if not whens:
+        return None
+    return case(*whens, else_=None)
+
+
+def apply_filters(job):
+    """
+    Terapkan hard filter job (yang sudah diubah) ke kandidat tersimpan dengan SQL massal.
+    Return (jumlah baru ditolak, list id kandidat yang baru lolos).
+    """
+    reason = _rejection_reason_case(job, get_job_features(job))
+    base = Candidate.query.filter(Candidate.job_id == job.id)
+
+    newly_rejected = 0
+    if reason is not None:
+        newly_rejected = base.filter(Candidate.status == "passed_filter", reason.isnot(None)).update({
+            Candidate.status: "rejected",
+            Candidate.rejection_reason: reason,
+            Candidate.match_score: None,
+            Candidate.scoring_reason: None,
+            Candidate.scoring_stage: None,
+        }, synchronize_session=False)
+
+    reopened = base.filter(
+        Candidate.status == "rejected",
+        Candidate.rejection_reason.like(AUTO_REJECTION_PATTERN),
+    )
+    if reason is not None:
+        reopened = reopened.filter(reason.is_(None))
+    newly_passed = [candidate_id for (candidate_id,) in reopened.with_entities(Candidate.id).all()]
+    if newly_passed:
+        Candidate.query.filter(Candidate.id.in_(newly_passed)).update({
+            Candidate.status: "passed_filter",
+            Candidate.rejection_reason: None,
+        }, synchronize_session=False)
+
+    # Penolakan yang masih berlaku tapi batasnya berubah -> alasan ikut diperbarui
+    if reason is not None:
+        base.filter(
+            Candidate.status == "rejected",
+            Candidate.rejection_reason.like(AUTO_REJECTION_PATTERN),
+            reason.isnot(None),
+        ).update({Candidate.rejection_reason: reason}, synchronize_session=False)
+
+    db.session.commit()
+    return newly_rejected, newly_passed
+
+
+def refresh_skill_ratios(job, batch_size=500):
+    """
+    Hitung ulang skill_match_ratio semua kandidat job dari candidate_documents.text.
+    Teks CV dibaca per batch; UPDATE massal hanya untuk kandidat yang rasionya berubah.
+    Return jumlah kandidat yang diupdate.
+    """
+    skills = get_job_features(job).get("skills", [])
+    JOB_SKILL_MATCHERS.invalidate(job.id)
+
+    changed = {}
+    rows = (
+        db.session.query(Candidate.id, Candidate.skill_match_ratio, CandidateDocument.text)
+        .join(CandidateDocument, CandidateDocument.candidate_id == Candidate.id)
+        .filter(Candidate.job_id == job.id)
+        .yield_per(batch_size)
+    )
+    for candidate_id, old_ratio, text in rows:
+        _, ratio = match_job_skills(job.id, skills, text or "")
+        old_ratio = float(old_ratio) if old_ratio is not None else None
+        if ratio != old_ratio:
+            changed.setdefault(ratio, []).append(candidate_id)
+
+    updated = 0
+    for ratio, candidate_ids in changed.items():
+        for start in range(0, len(candidate_ids), batch_size):
+            updated += Candidate.query.filter(
+                Candidate.id.in_(candidate_ids[start:start + batch_size])
+            ).update({Candidate.skill_match_ratio: ratio}, synchronize_session=False)
+    db.session.commit()
+    return updated
+
+
+def apply_local_scores(job_id, candidate_ids=None):
+    """
+    match_score = local_score (correlated subquery, satu UPDATE) untuk kandidat passed_filter.
+    candidate_ids=None -> semua kandidat lolos di job ini. Return (jumlah diupdate, jumlah tanpa teks CV).
+    """
+    has_document = db.session.query(CandidateDocument.candidate_id).filter(
+        CandidateDocument.candidate_id == Candidate.id
+    ).exists()
+    local_score = (
+        db.session.query(CandidateDocument.local_score)
+        .filter(CandidateDocument.candidate_id == Candidate.id)
+        .scalar_subquery()
+    )
+
+    query = Candidate.query.filter(Candidate.job_id == job_id, Candidate.status == "passed_filter")
+    if candidate_ids is not None:
+        if not candidate_ids:
+            return 0, 0
+        query = query.filter(Candidate.id.in_(candidate_ids))
+
+    updated = query.filter(has_document).update({
+        Candidate.match_score: local_score,
+        Candidate.scoring_reason: None,
+        Candidate.scoring_stage: "local",
+    }, synchronize_session=False)
+    without_text = query.filter(~has_document).count()
+    db.session.commit()
+    return updated, without_text
+
+
+def _run_llm(job, job_id):
+    """
+    Tahap LLM: request Gemini paralel di worker, penulisan DB tetap di thread ini (satu session).
+    Menunggu stage LLM cascade yang sedang berjalan untuk job ini (lock bersama).
+    """
+    _update(job_id, phase="llm")
+
+    def start(shortlist):
+        _update(job_id, llm_total=len(shortlist))
+
+    def done(candidate_id, scored):
+        if scored:
+            _increment(job_id, "llm_scored")
+        _increment(job_id, "llm_done")
+
+    run_llm_stage(job, on_start=start, on_done=done, thread_name_prefix=f"rescore-{job_id}")
+
+
+def rescore_job(job_id, jd_changed=True):
+    """Jalankan seluruh tahap re-scoring secara sinkron (dipanggil dari thread background)."""
+    job = db.session.get(Job, job_id)
+    if job is None:
+        raise ValueError(f"Job {job_id} tidak ditemukan")
+
+    if jd_changed:
+        # Stage LLM cascade yang masih berjalan menilai dengan JD lama -> hentikan
+        cancel_llm_stage(job_id)
+        _update(job_id, state="running", phase="skills")
+        _update(job_id, skill_ratios_updated=refresh_skill_ratios(job))
+
+    _update(job_id, state="running", phase="filter")
+    newly_rejected, newly_passed = apply_filters(job)
+    _update(job_id, newly_rejected=newly_rejected, newly_passed=len(newly_passed), phase="local")
+
+    if jd_changed:
+        # Hash JD berubah -> IDF di-rebuild dari term_counts tersimpan, lalu semua local_score dihitung ulang
+        TERM_STATS.renormalize(job_id)
+        rescored, without_text = apply_local_scores(job_id)
+    else:
+        rescored, without_text = apply_local_scores(job_id, newly_passed)
+    _update(job_id, rescored_local=rescored, skipped_no_text=without_text)
+
+    databases.bump_job_candidates_version(job_id)
+    databases.invalidate_candidate_caches()
+    LEADERBOARDS.reload(job_id)
+
+    _run_llm(job, job_id)
+
+
+def _new_progress(job_id, jd_changed):
+    return {
+        "job_id": job_id,
+        "state": "queued",
+        "phase": None,
+        "jd_changed": jd_changed,
+        "follow_up_queued": False,
+        "skill_ratios_updated": 0,
+        "newly_rejected": 0,
+        "newly_passed": 0,
+        "rescored_local": 0,
+        "skipped_no_text": 0,
+        "llm_total": 0,
+        "llm_done": 0,
+        "llm_scored": 0,
+        "started_at": datetime.utcnow().isoformat(),
+        "finished_at": None,
+        "error": None,
+    }
+
+
+def _finish(job_id, state, error=None):
+    """
+    Tutup satu run. Kalau ada follow-up yang antre (job diubah lagi saat run berjalan),
+    progress langsung di-reset ke "queued" di bawah lock yang sama, jadi tidak ada
+    celah untuk start_rescore lain. Return jd_changed follow-up, atau None.
+    """
+    with _lock:
+        follow_up = _follow_ups.pop(job_id, None)
+        if follow_up is None:
+            _progress[job_id].update(state=state, phase=None, error=error, finished_at=datetime.utcnow().isoformat())
+            return None
+        _progress[job_id] = _new_progress(job_id, follow_up)
+        return follow_up
+
+
+def start_rescore(job_id, jd_changed=True, queue_if_running=False):
+    """
+    Jadwalkan re-scoring di background thread (maksimal satu per job).
+    Kalau sudah ada run yang berjalan dan queue_if_running=True, satu follow-up run
+    diantrekan setelahnya (beberapa permintaan digabung; jd_changed di-OR).
+    Return (dimulai?, progress).
+    """
+    from flask import current_app
+
+    with _lock:
+        if _progress.get(job_id, {}).get("state") in ("queued", "running"):
+            if queue_if_running:
+                _follow_ups[job_id] = _follow_ups.get(job_id, False) or jd_changed
+                _progress[job_id]["follow_up_queued"] = True
+            return False, dict(_progress[job_id])
+        _progress[job_id] = _new_progress(job_id, jd_changed)
+        progress = dict(_progress[job_id])
+
+    app = current_app._get_current_object()
+
+    def run():
+        next_jd_changed = jd_changed
+        while next_jd_changed is not None:
+            with app.app_context():
+                try:
+                    rescore_job(job_id, jd_changed=next_jd_changed)
+                    print(f"♻️  [RESCORE] Job {job_id} selesai: {get_progress(job_id)}")
+                    state, error = "done", None
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"Error re-scoring job {job_id}: {e}")
+                    state, error = "failed", str(e)
+                finally:
+                    db.session.remove()
+            next_jd_changed = _finish(job_id, state, error)
+
+    threading.Thread(target=run, name=f"rescore-{job_id}", daemon=True).start()
+    return True, progress
@@ -0,0 +1,259 @@
+# app/services/rubric_scorer.py
+"""
+Rubrik 60/20/20 versi lokal (tanpa LLM), output JSON sama dengan
+AstraScoringService.analyze_cv_with_gemini. Deterministik, hitungan milidetik.
+
+- Relevansi (60): skill yang diminta JD dicari di CV, diberi "Proof Level"
+  berdasarkan lokasi section (pengalaman kerja vs daftar skill) dan ada/tidaknya angka.
+- Senioritas (20): total tahun dari rentang tahun di section pengalaman + level jabatan.
+- Kualitas (20): rasio action verb kuat dan kalimat dengan metrik kuantitatif.
+"""
+import re
+from bisect import bisect_right
+from datetime import datetime
+
+from app.services.astra_scoring_service import AstraScoringService
+from app.services.cv_sections import split_sections
+from app.services.skill_matcher import SkillMatcher, skill_names, skills_in_text
+from app.services.term_stats import text_similarity
+
+RELEVANCE_WEIGHT = 60.0
+SENIORITY_WEIGHT = 20.0
+QUALITY_WEIGHT = 20.0
+
+PROOF_LEVELS = {
+    "Strong Evidence": (10.0, "Sangat baik. Bukti kuat dengan konteks nyata."),
+    "Standard Context": (7.5, "Ada di pengalaman kerja, tapi deskripsi terlalu umum. Tambahkan dampak/angka (Impact) agar lebih meyakinkan."),
+    "Listed Only": (5.0, "Hanya scannable sebagai kata kunci. Wajib masukkan ke deskripsi pengalaman kerja dengan contoh nyata."),
+    "Missing": (0.0, "Fatal. Keyword ini tidak ditemukan. Tambahkan segera jika Anda memilikinya."),
+}
+
+STRONG_VERBS = {
+    "led", "lead", "developed", "built", "architected", "designed", "implemented", "launched",
+    "optimized", "improved", "increased", "reduced", "automated", "delivered", "created",
+    "managed", "migrated", "spearheaded", "initiated", "analyzed", "deployed", "streamlined",
+    "memimpin", "mengembangkan", "membangun", "merancang", "mengimplementasikan", "meningkatkan",
+    "menurunkan", "mengotomatisasi", "mengoptimalkan", "menganalisis", "membuat",
+}
+WEAK_PHRASES = ("responsible for", "helped", "assisted", "involved in", "bertanggung jawab", "membantu", "terlibat")
+
+METRIC_RE = re.compile(
+    r"(\d+(?:[.,]\d+)?\s*(%|persen|percent|x\b|k\b|rb\b|ribu|juta|jt\b|million|billion|miliar|"
+    r"users|pengguna|clients|klien|customers|pelanggan|hours|jam|days|hari))|((rp|idr|usd|\$)\s*\d)",
+    re.IGNORECASE,
+)
+YEAR_RANGE_RE = re.compile(
+    r"((?:19|20)\d{2})\s*(?:-|–|—|to|until|s/d|sampai|hingga)\s*"
+    r"((?:19|20)\d{2}|present|now|current|sekarang|saat ini|kini)",
+    re.IGNORECASE,
+)
+REQUIRED_YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?|tahun)", re.IGNORECASE)
+GPA_RE = re.compile(r"(?:gpa|ipk)\s*[:=]?\s*([0-4][.,]\d{1,2})", re.IGNORECASE)
+
+LEVELS = [
+    ("intern", ["intern", "magang", "trainee"]),
+    ("junior", ["junior", "jr", "entry level", "fresh graduate", "associate"]),
+    ("mid", []),
+    ("senior", ["senior", "sr", "specialist"]),
+    ("lead", ["lead", "principal", "head", "manager", "supervisor", "architect"]),
+]
+MAJOR_KEYWORDS = [
+    "computer science", "informatika", "information technology", "teknologi informasi",
+    "sistem informasi", "information system", "software engineering", "teknik komputer",
+    "data science", "statistics", "statistika", "mathematics", "matematika",
+    "industrial engineering", "teknik industri", "accounting", "akuntansi",
+    "management", "manajemen", "economics", "ekonomi", "business", "bisnis",
+]
+
+
+def _contains(text, phrase):
+    return re.search(r"(?<![a-z0-9])" + re.escape(phrase) + r"(?![a-z0-9])", text) is not None
+
+
+def required_skills(job_desc_text, job_title=""):
+    """Skill dari vocabulary (services.skill_matcher) yang disebut di JD / judul job."""
+    return skills_in_text(f"{job_title}\n{job_desc_text}")
+
+
+def _lines(text):
+    return [line for line in (text or "").lower().splitlines() if line.strip()]
+
+
+def _proof_levels(skills, experience_lines, cv_text):
+    """
+    Proof level semua skill sekaligus: satu pass matcher atas section pengalaman
+    (offset -> nomor baris) dan satu pass atas seluruh CV.
+    """
+    matcher = SkillMatcher({skill: skill_names(skill) for skill in skills})
+    experience_text = "\n".join(experience_lines)
+    line_starts = [0]
+    for line in experience_lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    in_experience = matcher.find(experience_text)
+    anywhere = matcher.find(cv_text)
+
+    levels = {}
+    for skill in skills:
+        offsets = in_experience.get(skill)
+        if offsets:
+            lines = {experience_lines[bisect_right(line_starts, offset) - 1] for offset in offsets}
+            levels[skill] = "Strong Evidence" if any(METRIC_RE.search(line) for line in lines) else "Standard Context"
+        elif skill in anywhere:
+            levels[skill] = "Listed Only"
+        else:
+            levels[skill] = "Missing"
+    return levels
+
+
+def _experience_years(experience_text, current_year):
+    """Total tahun dari rentang tahun (interval overlap digabung)."""
+    intervals = []
+    for start, end in YEAR_RANGE_RE.findall(experience_text or ""):
+        start_year = int(start)
+        end_year = int(end) if end.isdigit() else current_year
+        if start_year <= end_year <= current_year + 1:
+            intervals.append((start_year, end_year))
+
+    total, last_end = 0, None
+    for start, end in sorted(intervals):
+        if last_end is not None and start < last_end:
+            start = last_end
+        if end > start:
+            total += end - start
+        last_end = max(last_end or end, end)
+    return total
+
+
+def _level(text):
+    text = (text or "").lower()
+    best = None
+    for index, (_, words) in enumerate(LEVELS):
+        if any(_contains(text, word) for word in words):
+            best = index
+    return best
+
+
+def _seniority(experience_text, job_desc_text, job_title, current_year):
+    total_years = _experience_years(experience_text, current_year)
+    years_match = REQUIRED_YEARS_RE.search(f"{job_title}\n{job_desc_text}")
+    required_years = int(years_match.group(1)) if years_match else None
+
+    if required_years:
+        years_score = min(1.0, total_years / required_years)
+    else:
+        years_score = min(1.0, total_years / 3)
+
+    required_level = _level(job_title) if _level(job_title) is not None else _level(job_desc_text)
+    candidate_level = _level(experience_text)
+    if required_level is None:
+        level_score = 1.0
+    elif candidate_level is None:
+        level_score = 0.5
+    else:
+        level_score = min(1.0, (candidate_level + 1) / (required_level + 1))
+
+    score = SENIORITY_WEIGHT * (0.75 * years_score + 0.25 * level_score)
+    return round(score, 2), total_years, required_years
+
+
+def _quality(experience_lines):
+    if not experience_lines:
+        return 0.0, 0.0, 0.0
+    strong = sum(1 for line in experience_lines if set(re.findall(r"[a-z]+", line)) & STRONG_VERBS)
+    weak = sum(1 for line in experience_lines if any(p in line for p in WEAK_PHRASES))
+    metrics = sum(1 for line in experience_lines if METRIC_RE.search(line))
+
+    verb_ratio = max(0.0, (strong - 0.5 * weak) / len(experience_lines))
+    metric_ratio = metrics / len(experience_lines)
+    # Tidak perlu setiap baris ada angka: 1 dari 3 baris sudah dianggap penuh
+    score = QUALITY_WEIGHT * (0.5 * min(1.0, verb_ratio * 2) + 0.5 * min(1.0, metric_ratio * 3))
+    return round(score, 2), verb_ratio, metric_ratio
+
+
+def score_cv_locally(cv_text, job_desc_text, job_title="General Job", skills=None):
+    """
+    Rubrik 60/20/20 tanpa LLM. Return dict dengan shape yang sama seperti hasil Gemini.
+    skills: skill JD yang sudah dihitung (Job.jd_features["skills"]); None -> dicari dari JD.
+    """
+    current_year = datetime.now().year
+    cv_lower = (cv_text or "").lower()
+    sections = {name: text.lower() for name, text in split_sections(cv_text).items()}
+
+    experience_text = "\n".join(sections.get(name, "") for name in ("experience", "projects", "organization"))
+    # Tanpa heading yang dikenali -> seluruh CV dianggap deskripsi pengalaman
+    if not experience_text.strip():
+        experience_text = cv_lower
+    experience_lines = _lines(experience_text)
+
+    # --- 1. Relevansi ---
+    if skills is None:
+        skills = required_skills(job_desc_text, job_title)
+    levels = _proof_levels(skills, experience_lines, cv_lower)
+    skills_analysis = []
+    for skill in skills:
+        points, reason = PROOF_LEVELS[levels[skill]]
+        skills_analysis.append({"skill": skill, "level": levels[skill], "score": points, "reason": reason})
+
+    if skills_analysis:
+        relevance = RELEVANCE_WEIGHT * sum(s["score"] for s in skills_analysis) / (10.0 * len(skills_analysis))
+    else:
+        # JD tanpa skill yang dikenali -> pakai kemiripan term (50% cosine sudah dianggap penuh)
+        relevance = RELEVANCE_WEIGHT * min(1.0, text_similarity(cv_text, job_desc_text) / 50)
+
+    # --- 2. Senioritas ---
+    seniority, total_years, required_years = _seniority(experience_text, job_desc_text, job_title, current_year)
+
+    # --- 3. Kualitas ---
+    quality, verb_ratio, metric_ratio = _quality(experience_lines)
+
+    # --- Mandatory checks ---
+    gpa_match = GPA_RE.search(cv_text or "")
+    jd_majors = [m for m in MAJOR_KEYWORDS if _contains((job_desc_text or "").lower(), m)]
+    education_text = sections.get("education", cv_lower)
+    candidate_major = next((m for m in MAJOR_KEYWORDS if _contains(education_text, m)), None)
+    # Jurusan tidak terdeteksi tidak dianggap gagal (parser teks, bukan LLM)
+    major_status = "FAIL" if jd_majors and candidate_major and candidate_major not in jd_majors else "PASS"
+
+    mandatory_checks = {
+        "gpa": {
+            "value": gpa_match.group(1).replace(",", ".") if gpa_match else "Not Listed",
+            "status": "PASS" if gpa_match else "NOTE",
+        },
+        "major": {"value": (candidate_major or "Tidak terdeteksi").title(), "status": major_status},
+        "experience_years": {
+            "value": str(total_years),
+            "status": "FAIL" if required_years and total_years < required_years else "PASS",
+        },
+    }
+
+    missing = [s["skill"] for s in skills_analysis if s["level"] == "Missing"]
+    listed_only = [s["skill"] for s in skills_analysis if s["level"] == "Listed Only"]
+    found = len(skills_analysis) - len(missing)
+
+    summary = (
+        f"{found} dari {len(skills_analysis)} skill yang diminta ditemukan di CV, "
+        f"dengan total pengalaman sekitar {total_years} tahun. "
+        f"{round(metric_ratio * 100)}% poin pengalaman memuat angka/dampak terukur."
+    )
+    if missing:
+        suggestion = f"Tambahkan bukti untuk skill yang belum ada: {', '.join(missing[:5])}."
+    elif listed_only:
+        suggestion = f"Pindahkan {', '.join(listed_only[:5])} dari daftar skill ke deskripsi pengalaman kerja dengan contoh nyata."
+    elif metric_ratio < 0.34:
+        suggestion = "Tambahkan angka dampak (%, jumlah user, waktu yang dihemat) pada poin pengalaman kerja."
+    else:
+        suggestion = "CV sudah kuat; pertahankan struktur dan fokuskan pada pencapaian paling relevan."
+
+    result = {
+        "candidate_summary": summary,
+        "mandatory_checks": mandatory_checks,
+        "rubric_scores": {
+            "relevance_score": round(relevance, 2),
+            "seniority_score": seniority,
+            "quality_score": quality,
+        },
+        "skills_analysis": skills_analysis,
+        "suggestion": suggestion,
+    }
+    return AstraScoringService.finalize_result(result, job_title, job_desc_text)
@@ -0,0 +1,337 @@
+# app/services/semantic_search.py
+import json
+import threading
+from collections import defaultdict
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.extensions import db
+from app.models import Candidate, CandidateSkill, Skill
+
+
+def candidate_document(experience, skills, education) -> str:
+    """Gabungkan experience + skills + education kandidat menjadi satu teks untuk di-embed."""
+    experience_list = []
+    if experience:
+        try:
+            experience_list = json.loads(experience)
+        except (TypeError, json.JSONDecodeError):
+            experience_list = [experience]
+    if isinstance(experience_list, str):
+        experience_list = [experience_list]
+
+    parts = [str(e) for e in experience_list if e]
+    parts.extend(skills or [])
+    if education:
+        parts.append(education)
+    return "\n".join(parts)
+
+
+class CandidateVectorIndex:
+    """
+    Index vektor in-memory untuk seluruh pool kandidat.
+
+    - Embedding: TF-IDF + TruncatedSVD (LSA), dinormalisasi L2, disimpan sebagai matrix float32.
+    - Query: cosine similarity lewat satu matrix product (batched) + argpartition top-k.
+    - Kalau pool melebihi ann_threshold, dibangun index IVF sederhana (k-means centroid)
+      sehingga query hanya men-scan cluster terdekat (approximate nearest neighbour).
+    - Kandidat baru ditambahkan secara incremental lewat add_candidate(); vocabulary
+      di-refit penuh hanya ketika pool sudah tumbuh refit_factor kali sejak fit terakhir.
+    - Rebuild tidak pernah berjalan di request: index stale di-rebuild di background
+      thread (schedule_build) sementara query tetap dilayani index lama.
+    """
+
+    def __init__(self, n_components=128, ann_threshold=20000, n_probe=8, refit_factor=2.0):
+        self.n_components = n_components
+        self.ann_threshold = ann_threshold
+        self.n_probe = n_probe
+        self.refit_factor = refit_factor
+
+        self._lock = threading.RLock()
+        self._vectorizer = None
+        self._svd = None
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._ids = []
+        self._job_ids = []
+        self._row_of = {}
+        self._fitted_size = 0
+        self._stale = True
+        self._building = False
+        # add_candidate yang masuk selama build() -> diterapkan ke index baru setelah swap
+        self._pending = []
+
+        # IVF (ANN)
+        self._centroids = None
+        self._lists = None
+
+    # ------------------------------------------------------------------
+    # Build / update
+    # ------------------------------------------------------------------
+    @property
+    def is_built(self):
+        return not self._stale
+
+    def mark_stale(self):
+        self._stale = True
+
+    def build(self):
+        """Bangun ulang index dari seluruh kandidat di database (butuh app context)."""
+        with self._lock:
+            self._building = True
+            self._pending = []
+        try:
+            self._build()
+        finally:
+            with self._lock:
+                self._building = False
+                self._pending = []
+
+    def _build(self):
+        rows = db.session.query(
+            Candidate.id, Candidate.job_id, Candidate.experience, Candidate.education
+        ).all()
+
+        skills_by_candidate = defaultdict(list)
+        skill_rows = (
+            db.session.query(CandidateSkill.candidate_id, Skill.skill_name)
+            .join(Skill, Skill.id == CandidateSkill.skill_id)
+            .all()
+        )
+        for candidate_id, skill_name in skill_rows:
+            if skill_name:
+                skills_by_candidate[candidate_id].append(skill_name)
+
+        ids = [r.id for r in rows]
+        job_ids = [r.job_id for r in rows]
+        docs = [
+            candidate_document(r.experience, skills_by_candidate.get(r.id), r.education)
+            for r in rows
+        ]
+
+        # Fit + embed di index baru (tanpa lock) -> query tetap dilayani index lama selama build
+        fresh = CandidateVectorIndex(self.n_components, self.ann_threshold, self.n_probe, self.refit_factor)
+        fresh._fit(docs)
+        fresh._ids = ids
+        fresh._matrix = fresh._embed(docs) if docs else np.zeros((0, 0), dtype=np.float32)
+        fresh._build_ann()
+
+        with self._lock:
+            self._vectorizer, self._svd = fresh._vectorizer, fresh._svd
+            self._matrix, self._centroids, self._lists = fresh._matrix, fresh._centroids, fresh._lists
+            self._ids = ids
+            self._job_ids = job_ids
+            self._row_of = {cid: i for i, cid in enumerate(ids)}
+            self._fitted_size = len(ids)
+            self._stale = False
+            if self._vectorizer is not None:
+                for pending in self._pending:
+                    self._add(*pending)
+
+        print(f"🧭 Semantic index built: {len(ids)} kandidat, dim={self._matrix.shape[1] if len(ids) else 0}")
+
+    def schedule_build(self):
+        """Rebuild di background thread (maksimal satu). Return True kalau thread baru dimulai."""
+        from flask import current_app
+
+        with self._lock:
+            if self._building:
+                return False
+            self._building = True
+
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                try:
+                    self.build()
+                except Exception as e:
+                    print(f"Error membangun semantic index: {e}")
+                finally:
+                    db.session.remove()
+                    with self._lock:
+                        self._building = False
+
+        threading.Thread(target=run, name="semantic-index-build", daemon=True).start()
+        return True
+
+    def add_candidate(self, candidate_id, job_id, experience, skills, education):
+        """Tambah / update satu kandidat tanpa refit (dipanggil dari save_candidate)."""
+        with self._lock:
+            if self._building:
+                self._pending.append((candidate_id, job_id, experience, skills, education))
+            if self._vectorizer is None:
+                # Belum pernah dibangun -> kandidat ini akan ikut saat build() berikutnya
+                return
+            self._add(candidate_id, job_id, experience, skills, education)
+
+    def _add(self, candidate_id, job_id, experience, skills, education):
+        vector = self._embed([candidate_document(experience, skills, education)])
+        row = self._row_of.get(candidate_id)
+        if row is not None:
+            self._matrix[row] = vector[0]
+            self._job_ids[row] = job_id
+        else:
+            row = len(self._ids)
+            self._ids.append(candidate_id)
+            self._job_ids.append(job_id)
+            self._row_of[candidate_id] = row
+            self._matrix = np.vstack([self._matrix, vector])
+            if self._centroids is not None:
+                nearest = int(np.argmax(self._centroids @ vector[0]))
+                self._lists[nearest] = np.append(self._lists[nearest], row)
+
+        if len(self._ids) >= max(1, self._fitted_size) * self.refit_factor:
+            # Vocabulary sudah terlalu tua untuk pool sebesar ini
+            self._stale = True
+
+    def _fit(self, docs):
+        self._vectorizer = None
+        self._svd = None
+        if not docs:
+            return
+
+        self._vectorizer = TfidfVectorizer(stop_words="english", sublinear_tf=True, max_features=50000)
+
+        try:
+            tfidf = self._vectorizer.fit_transform(docs)
+        except ValueError:
+            # Semua dokumen kosong / hanya stop words
+            self._vectorizer = None
+            return
+
+        n_components = min(self.n_components, tfidf.shape[1] - 1, tfidf.shape[0] - 1)
+        if n_components >= 2:
+            self._svd = TruncatedSVD(n_components=n_components, random_state=42)
+            self._svd.fit(tfidf)
+        # else: pool terlalu kecil untuk SVD -> pakai TF-IDF dense langsung
+
+    def _embed(self, texts):
+        if self._vectorizer is None:
+            return np.zeros((len(texts), 1), dtype=np.float32)
+
+        tfidf = self._vectorizer.transform(texts)
+        dense = self._svd.transform(tfidf) if self._svd is not None else tfidf.toarray()
+        dense = dense.astype(np.float32, copy=False)
+        norms = np.linalg.norm(dense, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return dense / norms
+
+    def _build_ann(self):
+        n_rows = len(self._ids)
+        if n_rows <= self.ann_threshold:
+            self._centroids = None
+            self._lists = None
+            return
+
+        n_lists = int(np.sqrt(n_rows))
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=42, batch_size=4096, n_init=3)
+        labels = kmeans.fit_predict(self._matrix)
+        centroids = kmeans.cluster_centers_.astype(np.float32)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._centroids = centroids / norms
+        self._lists = [np.flatnonzero(labels == i) for i in range(n_lists)]
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def search(self, query, k=20, job_id=None):
+        return self.search_many([query], k=k, job_id=job_id)[0]
+
+    def search_many(self, queries, k=20, job_id=None):
+        """
+        Top-k untuk beberapa query sekaligus. Return list of [(candidate_id, similarity)].
+        Index stale -> rebuild dijadwalkan di background, query memakai index yang ada
+        (kosong kalau index belum pernah dibangun).
+        """
+        if self._stale:
+            self.schedule_build()
+
+        with self._lock:
+            if not self._ids or self._vectorizer is None:
+                return [[] for _ in queries]
+
+            query_vectors = self._embed(queries)
+            job_mask = None
+            if job_id:
+                job_mask = np.fromiter((j == job_id for j in self._job_ids), dtype=bool, count=len(self._job_ids))
+
+            if self._centroids is None:
+                # Exact: (n_queries x dim) @ (dim x n_rows) dalam satu matrix product
+                scores = query_vectors @ self._matrix.T
+                if job_mask is not None:
+                    scores[:, ~job_mask] = -np.inf
+                return [self._top_k(row_scores, np.arange(len(self._ids)), k) for row_scores in scores]
+
+            results = []
+            centroid_scores = query_vectors @ self._centroids.T
+            for query_vector, c_scores in zip(query_vectors, centroid_scores):
+                probe = np.argpartition(-c_scores, min(self.n_probe, len(c_scores) - 1))[: self.n_probe]
+                rows = np.concatenate([self._lists[i] for i in probe])
+                if job_mask is not None:
+                    rows = rows[job_mask[rows]]
+                row_scores = self._matrix[rows] @ query_vector
+                results.append(self._top_k(row_scores, rows, k))
+            return results
+
+    def _top_k(self, scores, rows, k):
+        if len(scores) == 0:
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (self._ids[rows[i]], float(scores[i]))
+            for i in top
+            if np.isfinite(scores[i]) and scores[i] > 0
+        ]
+
+    def stats(self):
+        return {
+            "candidates": len(self._ids),
+            "dimensions": int(self._matrix.shape[1]) if len(self._ids) else 0,
+            "ann_enabled": self._centroids is not None,
+            "stale": self._stale,
+            "building": self._building,
+        }
+
+
+CANDIDATE_INDEX = CandidateVectorIndex()
+
+
+def semantic_search(query: str, k: int = 20, job_id: str = None):
+    """
+    Cari kandidat secara semantik. Return list dict kandidat + skor similarity,
+    sudah terurut dari yang paling mirip.
+    """
+    query = (query or "").strip()
+    if not query:
+        return []
+
+    hits = CANDIDATE_INDEX.search(query, k=k, job_id=job_id)
+    if not hits:
+        return []
+
+    candidates = {
+        c.id: c for c in Candidate.query.filter(Candidate.id.in_([cid for cid, _ in hits])).all()
+    }
+
+    results = []
+    for candidate_id, similarity in hits:
+        candidate = candidates.get(candidate_id)
+        if not candidate:
+            continue
+        results.append({
+            "id": candidate.id,
+            "job_id": candidate.job_id,
+            "name": candidate.name,
+            "email": candidate.email,
+            "status": candidate.status,
+            "match_score": float(candidate.match_score) if candidate.match_score is not None else 0.0,
+            "similarity": round(similarity, 4),
+            "skills": [cs.skill.skill_name for cs in candidate.candidate_skills if cs.skill],
+        })
+    return results
@@ -0,0 +1,159 @@
+# app/services/skill_dictionary.py
+import re
+import threading
+
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models import Skill, SkillAlias
+from app.services.experience_parser import escape_like
+
+# Alias bawaan: key alias -> key kanonik.
+# "Node.js", "NodeJS" dan "node js" sudah sama setelah skill_key(); alias ini
+# untuk nama yang memang berbeda tulisannya.
+BUILTIN_ALIASES = {
+    "reactjs": "react",
+    "vue": "vuejs",
+    "node": "nodejs",
+    "express": "expressjs",
+    "next": "nextjs",
+    "nuxt": "nuxtjs",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "tailwind": "tailwindcss",
+    "restfulapi": "restapi",
+    "rest": "restapi",
+    "sklearn": "scikitlearn",
+    "gcp": "googlecloudplatform",
+    "googlecloud": "googlecloudplatform",
+    "amazonwebservices": "aws",
+    "ml": "machinelearning",
+    "nlp": "naturallanguageprocessing",
+    "msexcel": "excel",
+    "microsoftexcel": "excel",
+}
+
+
+def skill_key(name: str) -> str:
+    """
+    Key kanonik sebuah skill: lowercase, hanya huruf/angka/+/#.
+    "Node.js" / "NodeJS" / "node js" -> "nodejs", "C++" -> "c++", "C#" -> "c#".
+    """
+    key = re.sub(r"[^a-z0-9+#]+", "", (name or "").lower())
+    return BUILTIN_ALIASES.get(key, key)
+
+
+def display_name(name: str) -> str:
+    """Nama tampilan untuk skill baru. Casing asli dipertahankan (SQL, AWS, Node.js)."""
+    name = " ".join(name.split())
+    return name.title() if name.islower() else name
+
+
+class SkillDictionary:
+    """
+    Cache in-process key -> skill_id untuk tabel skills + skill_aliases.
+    Lookup exact selalu lewat dict ini; miss dicek ke DB (unique index normalized_key)
+    sebelum membuat skill baru.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids_by_key = {}
+        self._loaded = False
+
+    def load(self):
+        ids_by_key = {}
+        for skill_id, key in db.session.query(Skill.id, Skill.normalized_key).all():
+            if key:
+                ids_by_key[key] = skill_id
+        for alias_key, skill_id in db.session.query(SkillAlias.alias_key, SkillAlias.skill_id).all():
+            ids_by_key.setdefault(alias_key, skill_id)
+
+        with self._lock:
+            self._ids_by_key = ids_by_key
+            self._loaded = True
+
+    def clear(self):
+        with self._lock:
+            self._ids_by_key = {}
+            self._loaded = False
+
+    def _remember(self, key, skill_id):
+        with self._lock:
+            self._ids_by_key[key] = skill_id
+
+    def resolve(self, name):
+        """Nama skill (atau alias) -> skill_id kanonik, None jika belum ada."""
+        key = skill_key(name)
+        if not key:
+            return None
+
+        if not self._loaded:
+            self.load()
+
+        skill_id = self._ids_by_key.get(key)
+        if skill_id:
+            return skill_id
+
+        # Mungkin dibuat proses lain sejak cache di-load
+        skill_id = db.session.query(Skill.id).filter(Skill.normalized_key == key).scalar()
+        if not skill_id:
+            skill_id = db.session.query(SkillAlias.skill_id).filter(SkillAlias.alias_key == key).scalar()
+        if skill_id:
+            self._remember(key, skill_id)
+        return skill_id
+
+    def get_or_create(self, name):
+        """Resolve ke skill kanonik, buat Skill baru jika belum ada. Return skill_id."""
+        if not name or not name.strip():
+            return None
+
+        skill_id = self.resolve(name)
+        if skill_id:
+            return skill_id
+
+        key = skill_key(name)
+        skill = Skill(skill_name=display_name(name), normalized_key=key)
+        try:
+            db.session.add(skill)
+            db.session.commit()
+        except IntegrityError:
+            # Race dengan request lain -> unique index menang, ambil yang sudah ada
+            db.session.rollback()
+            skill = Skill.query.filter_by(normalized_key=key).first()
+            if not skill:
+                return None
+
+        self._remember(key, skill.id)
+        # Import lokal: skill_matcher meng-import modul ini
+        from app.services.skill_matcher import invalidate_vocabulary
+        invalidate_vocabulary()
+        return skill.id
+
+    def match_ids(self, term):
+        """
+        skill_id untuk satu search term: exact (key/alias) jika ada,
+        kalau tidak prefix pada normalized_key (index range scan).
+        """
+        skill_id = self.resolve(term)
+        if skill_id:
+            return [skill_id]
+
+        key = skill_key(term)
+        if not key:
+            return []
+        rows = (
+            db.session.query(Skill.id)
+            .filter(Skill.normalized_key.like(f"{escape_like(key)}%"))
+            .limit(50)
+            .all()
+        )
+        return [r.id for r in rows]
+
+
+SKILL_DICTIONARY = SkillDictionary()
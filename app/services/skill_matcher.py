@@ -0,0 +1,259 @@
+# app/services/skill_matcher.py
+"""
+Pencocokan skill multi-pattern (Aho-Corasick, pure Python).
+
+- Vocabulary: skill bawaan (ai_analyzer) + skill kurasi di tabel skill_aliases, di-compile
+  sekali menjadi satu automaton untuk menurunkan skill dari JD + requirements_json.
+  Nama hasil parsing CV di tabel skills ("Developer", "Team Player") sengaja tidak ikut,
+  supaya kata umum tidak menjadi skill wajib job.
+- Per job: skill yang diminta job di-compile menjadi automaton kecil (JOB_SKILL_MATCHERS)
+  lalu dicocokkan ke setiap CV dalam satu pass linear, berapapun jumlah skill-nya.
+"""
+import hashlib
+import threading
+from collections import OrderedDict, deque
+
+from app.models import Skill, SkillAlias
+from app.services.ai_analyzer import SKILL_KEYWORDS, DATA_ENGINEER_SKILLS, BUSINESS_ANALYST_SKILLS
+from app.services.cache import LRUCache, MISSING
+from app.services.skill_dictionary import BUILTIN_ALIASES, skill_key
+from config import Config
+
+# Nama / alias yang juga kata umum ("go", "rest", "next") terlalu sering muncul di kalimat biasa
+AMBIGUOUS_TERMS = {"go", "rest", "next", "node", "express", "vue", "nuxt", "mongo"}
+MIN_PATTERN_LENGTH = 2
+
+_VOCABULARY_CACHE = LRUCache(max_entries=2, ttl_seconds=Config.SKILL_VOCABULARY_TTL, name="skill_vocabulary")
+
+
+def _is_word_char(char):
+    return char.isalnum()
+
+
+class AhoCorasick:
+    """Automaton Aho-Corasick untuk pola lowercase -> value."""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for pattern, value in patterns.items():
+            self._add(pattern, value)
+        self._build()
+
+    def _add(self, pattern, value):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(pattern), value))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                if state:
+                    fallback = self._fail[state]
+                    while fallback and char not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Pola yang merupakan akhiran pola lain ikut dilaporkan
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, value) untuk setiap kemunculan pola di text (sudah lowercase)."""
+        state = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield index - length + 1, index + 1, value
+
+
+def pattern_variants(name):
+    """Bentuk tulisan skill di teks: "Node.js" -> {"node.js", "nodejs", "node js"}, "Power BI" -> "power-bi"."""
+    lower = " ".join((name or "").lower().split())
+    variants = {
+        lower, lower.replace(".", ""), lower.replace(".", " "),
+        lower.replace("-", " "), lower.replace("-", ""), lower.replace(" ", "-"),
+    }
+    return {v.strip() for v in variants if len(v.strip()) >= MIN_PATTERN_LENGTH}
+
+
+class SkillMatcher:
+    """
+    skills: {nama tampilan: [nama / alias]}. Match hanya di batas kata, dan match yang
+    tertutup match lain yang lebih panjang dibuang ("data analysis" menang atas "analysis").
+    """
+
+    def __init__(self, skills):
+        patterns = {}
+        for display, names in skills.items():
+            for name in names:
+                for variant in pattern_variants(name):
+                    patterns.setdefault(variant, display)
+        self.skills = list(skills)
+        self._automaton = AhoCorasick(patterns)
+
+    def find(self, text):
+        """{skill: [offset awal, ...]} dalam satu pass linear atas text."""
+        lower = (text or "").lower()
+        spans = []
+        for start, end, skill in self._automaton.iter_matches(lower):
+            if start > 0 and _is_word_char(lower[start - 1]) and _is_word_char(lower[start]):
+                continue
+            if end < len(lower) and _is_word_char(lower[end]) and _is_word_char(lower[end - 1]):
+                continue
+            spans.append((start, end, skill))
+
+        # Match terpanjang dulu; span yang berada di dalam span lain dibuang
+        spans.sort(key=lambda s: (s[0], -(s[1] - s[0])))
+        found = OrderedDict()
+        covered_until = -1
+        for start, end, skill in spans:
+            if end <= covered_until:
+                continue
+            covered_until = max(covered_until, end)
+            found.setdefault(skill, []).append(start)
+        return found
+
+    def matched(self, text):
+        return list(self.find(text))
+
+
+def _vocabulary():
+    """
+    {skill_key: {"display": nama, "names": set(nama & alias)}} dari skill bawaan
+    + skill yang punya baris skill_aliases (dianggap kurasi).
+    """
+    vocabulary = {}
+
+    def add(name, key=None):
+        key = key or skill_key(name)
+        if not key or len(key) < MIN_PATTERN_LENGTH or name.strip().lower() in AMBIGUOUS_TERMS:
+            return
+        entry = vocabulary.setdefault(key, {"display": " ".join(name.split()), "names": set()})
+        entry["names"].add(name)
+
+    # Nama bawaan lebih dulu -> kapitalisasi tampilan (SQL, Power BI) diambil dari sini
+    for name in DATA_ENGINEER_SKILLS + BUSINESS_ANALYST_SKILLS + SKILL_KEYWORDS:
+        add(name)
+
+    try:
+        from app.extensions import db
+        alias_rows = []
+        for alias, name, key in (
+            db.session.query(SkillAlias.alias_key, Skill.skill_name, Skill.normalized_key).join(Skill).all()
+        ):
+            if name and key:
+                add(name, key)
+                alias_rows.append((alias, key))
+    except Exception as e:  # tanpa app context / DB -> vocabulary bawaan saja
+        print(f"[SKILL MATCHER] vocabulary dari DB tidak tersedia: {e}")
+        alias_rows = []
+
+    aliases = list(BUILTIN_ALIASES.items()) + [tuple(row) for row in alias_rows]
+    for alias, key in aliases:
+        if key in vocabulary and len(alias) > MIN_PATTERN_LENGTH and alias not in AMBIGUOUS_TERMS:
+            vocabulary[key]["names"].add(alias)
+    return vocabulary
+
+
+def vocabulary():
+    cached = _VOCABULARY_CACHE.get("vocabulary")
+    if cached is MISSING:
+        cached = _vocabulary()
+        _VOCABULARY_CACHE.set("vocabulary", cached)
+    return cached
+
+
+def vocabulary_matcher():
+    cached = _VOCABULARY_CACHE.get("matcher")
+    if cached is MISSING:
+        cached = SkillMatcher({entry["display"]: entry["names"] for entry in vocabulary().values()})
+        _VOCABULARY_CACHE.set("matcher", cached)
+    return cached
+
+
+def vocabulary_version():
+    """Digest isi vocabulary; berubah kalau skill kurasi / alias berubah (dipakai job_features)."""
+    cached = _VOCABULARY_CACHE.get("version")
+    if cached is MISSING:
+        raw = "\n".join(
+            f"{key}\x1f{entry['display']}\x1f{','.join(sorted(entry['names']))}"
+            for key, entry in sorted(vocabulary().items())
+        )
+        cached = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        _VOCABULARY_CACHE.set("version", cached)
+    return cached
+
+
+def invalidate_vocabulary():
+    """Panggil setelah menulis tabel skills / skill_aliases."""
+    _VOCABULARY_CACHE.clear()
+
+
+def skills_in_text(text):
+    """Skill vocabulary yang disebut di text (JD / requirement), urut kemunculan pertama."""
+    return vocabulary_matcher().matched(text)
+
+
+def skill_names(display):
+    """Semua nama & alias sebuah skill (untuk compile matcher per job)."""
+    entry = vocabulary().get(skill_key(display))
+    return (entry["names"] | {display}) if entry else {display}
+
+
+def skill_match_ratio(matched, required):
+    """Persentase (0-100) skill job yang ditemukan di CV; None kalau job tanpa skill."""
+    if not required:
+        return None
+    return round(100.0 * len(set(matched) & set(required)) / len(required), 2)
+
+
+class JobSkillMatcherRegistry:
+    """SkillMatcher per job, di-compile ulang hanya kalau daftar skill job berubah."""
+
+    def __init__(self, max_jobs=128):
+        self.max_jobs = max_jobs
+        self._matchers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id, skills):
+        signature = tuple(skills)
+        with self._lock:
+            cached = self._matchers.get(job_id)
+            if cached and cached[0] == signature:
+                self._matchers.move_to_end(job_id)
+                return cached[1]
+
+        matcher = SkillMatcher({skill: skill_names(skill) for skill in skills})
+        with self._lock:
+            self._matchers[job_id] = (signature, matcher)
+            self._matchers.move_to_end(job_id)
+            while len(self._matchers) > self.max_jobs:
+                self._matchers.popitem(last=False)
+        return matcher
+
+    def invalidate(self, job_id):
+        with self._lock:
+            self._matchers.pop(job_id, None)
+
+
+JOB_SKILL_MATCHERS = JobSkillMatcherRegistry()
+
+
+def match_job_skills(job_id, skills, cv_text):
+    """Skill job yang ditemukan di CV + rasio kecocokan (satu pass atas teks CV)."""
+    matched = JOB_SKILL_MATCHERS.get(job_id, skills).matched(cv_text)
+    return matched, skill_match_ratio(matched, skills)
@@ -0,0 +1,162 @@
+# app/services/talent_facets.py
+from collections import Counter
+
+from sqlalchemy import case, func, or_
+
+from app.extensions import db
+from app.models import Candidate, CandidateSkill, Skill
+
+# Hasil search <= batas ini dihitung di memory (data sudah ada di tangan),
+# di atasnya pakai grouped aggregate SQL.
+IN_MEMORY_FACET_LIMIT = 500
+TOP_SKILLS_LIMIT = 15
+
+# Urutan penting: level tertinggi dicek dulu (sama seperti filter di upload_and_process_cvs)
+EDUCATION_PATTERNS = [
+    ("S3", ["S3", "DOCTORATE", "PHD"]),
+    ("S2", ["S2", "MASTER", "MAGISTER"]),
+    ("S1", ["S1", "BACHELOR", "SARJANA"]),
+    ("D3", ["D3", "DIPLOMA"]),
+]
+
+# (batas bawah inklusif, batas atas eksklusif, label)
+GPA_BUCKETS = [
+    (None, 2.5, "< 2.50"),
+    (2.5, 3.0, "2.50 - 2.99"),
+    (3.0, 3.5, "3.00 - 3.49"),
+    (3.5, None, ">= 3.50"),
+]
+EXPERIENCE_BUCKETS = [
+    (None, 1, "< 1 tahun"),
+    (1, 3, "1 - 2 tahun"),
+    (3, 5, "3 - 4 tahun"),
+    (5, 10, "5 - 9 tahun"),
+    (10, None, "10+ tahun"),
+]
+UNKNOWN = "Unknown"
+
+
+def education_level(education):
+    if not education:
+        return UNKNOWN
+    upper = education.upper()
+    for label, words in EDUCATION_PATTERNS:
+        if any(word in upper for word in words):
+            return label
+    return "Other"
+
+
+def _bucket(value, buckets):
+    if value is None:
+        return UNKNOWN
+    value = float(value)
+    for low, high, label in buckets:
+        if (low is None or value >= low) and (high is None or value < high):
+            return label
+    return UNKNOWN
+
+
+def education_level_case():
+    """CASE SQL yang sama dengan education_level(): Candidate.education -> "S3" / "S2" / "S1" / "D3" / "Other" / "Unknown"."""
+    upper = func.upper(Candidate.education)
+    whens = [
+        (or_(*[upper.like(f"%{word}%") for word in words]), label)
+        for label, words in EDUCATION_PATTERNS
+    ]
+    return case((Candidate.education.is_(None), UNKNOWN), *whens, else_="Other")
+
+
+def _bucket_case(column, buckets):
+    whens = [(column.is_(None), UNKNOWN)]
+    for low, high, label in buckets:
+        conditions = []
+        if low is not None:
+            conditions.append(column >= low)
+        if high is not None:
+            conditions.append(column < high)
+        whens.append((db.and_(*conditions), label))
+    return case(*whens, else_=UNKNOWN)
+
+
+def _as_facet(counter, order=None):
+    if order:
+        items = [(label, counter[label]) for label in order if counter.get(label)]
+    else:
+        items = counter.most_common()
+    return [{"value": value, "count": count} for value, count in items]
+
+
+def _education_order():
+    return [label for label, _ in EDUCATION_PATTERNS] + ["Other", UNKNOWN]
+
+
+def _bucket_order(buckets):
+    return [label for _, _, label in buckets] + [UNKNOWN]
+
+
+def facets_in_memory(results):
+    """Satu pass atas hasil search yang sudah di-fetch."""
+    skills, education, gpa, experience, status = Counter(), Counter(), Counter(), Counter(), Counter()
+    for row in results:
+        skills.update(set(row.get("skills") or []))
+        education[education_level(row.get("university"))] += 1
+        gpa[_bucket(row.get("gpa"), GPA_BUCKETS)] += 1
+        experience[_bucket(row.get("total_experience"), EXPERIENCE_BUCKETS)] += 1
+        status[row.get("status") or UNKNOWN] += 1
+
+    return {
+        "skills": [{"value": v, "count": c} for v, c in skills.most_common(TOP_SKILLS_LIMIT)],
+        "education": _as_facet(education, _education_order()),
+        "gpa": _as_facet(gpa, _bucket_order(GPA_BUCKETS)),
+        "experience": _as_facet(experience, _bucket_order(EXPERIENCE_BUCKETS)),
+        "status": _as_facet(status),
+    }
+
+
+def facets_sql(candidate_ids):
+    """
+    Grouped aggregate di database: satu query untuk facet per-kandidat
+    (GROUP BY status, education, gpa bucket, experience bucket) + satu untuk top skills.
+    """
+    education_col = education_level_case().label("education_level")
+    gpa_col = _bucket_case(Candidate.gpa, GPA_BUCKETS).label("gpa_bucket")
+    exp_col = _bucket_case(Candidate.total_experience, EXPERIENCE_BUCKETS).label("experience_bucket")
+
+    rows = (
+        db.session.query(Candidate.status, education_col, gpa_col, exp_col, func.count(Candidate.id))
+        .filter(Candidate.id.in_(candidate_ids))
+        .group_by(Candidate.status, education_col, gpa_col, exp_col)
+        .all()
+    )
+
+    education, gpa, experience, status = Counter(), Counter(), Counter(), Counter()
+    for row_status, row_education, row_gpa, row_exp, count in rows:
+        status[row_status or UNKNOWN] += count
+        education[row_education] += count
+        gpa[row_gpa] += count
+        experience[row_exp] += count
+
+    skill_rows = (
+        db.session.query(Skill.skill_name, func.count(func.distinct(CandidateSkill.candidate_id)).label("n"))
+        .join(CandidateSkill, CandidateSkill.skill_id == Skill.id)
+        .filter(CandidateSkill.candidate_id.in_(candidate_ids))
+        .group_by(Skill.id, Skill.skill_name)
+        .order_by(func.count(func.distinct(CandidateSkill.candidate_id)).desc())
+        .limit(TOP_SKILLS_LIMIT)
+        .all()
+    )
+
+    return {
+        "skills": [{"value": name, "count": count} for name, count in skill_rows],
+        "education": _as_facet(education, _education_order()),
+        "gpa": _as_facet(gpa, _bucket_order(GPA_BUCKETS)),
+        "experience": _as_facet(experience, _bucket_order(EXPERIENCE_BUCKETS)),
+        "status": _as_facet(status),
+    }
+
+
+def compute_facets(results):
+    """Pilih strategi berdasarkan ukuran hasil search."""
+    if len(results) <= IN_MEMORY_FACET_LIMIT:
+        return facets_in_memory(results)
+    return facets_sql([row["id"] for row in results])
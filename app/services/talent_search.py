@@ -1,8 +1,23 @@
-from app.models import Candidate, Skill, CandidateSkill
-from sqlalchemy import or_, func, and_
+from app.models import Candidate, Skill, CandidateSkill, CandidateExperience
+from sqlalchemy import or_, func, and_, false
 from app.extensions import db
+from app.services.cache import LRUCache, MISSING
+from app.services.experience_parser import normalize_title, escape_like
+from app.services.skill_dictionary import SKILL_DICTIONARY
+from app.services.talent_facets import compute_facets
+from config import Config
 import re
 
+# Cache hasil pencarian. Di-invalidate (bump_generation) oleh databases.save_candidate
+# dan perubahan status kandidat, lihat databases.invalidate_candidate_caches()
+SEARCH_CACHE = LRUCache(max_entries=Config.SEARCH_CACHE_MAX_ENTRIES, name="talent_search")
+
+# Filter yang didukung oleh search_candidates (nama filter -> kolom Candidate)
+SEARCH_FILTERS = {
+    "status": Candidate.status,
+    "job_id": Candidate.job_id,
+}
+
 # ============================
 # Role/Job Title Mapping untuk Experience Search
 # ============================
@@ -169,16 +184,103 @@ def find_closest_role(input_text):
     print(f"🔍 Fuzzy match backend: '{input_text}' → '{best_match}' (score: {best_score})")
     return best_match
 
-def search_candidates(keyword: str):
+def normalize_search_query(keyword: str) -> str:
+    """Lowercase + rapikan spasi, dipakai sebagai bagian dari cache key."""
+    return " ".join((keyword or "").lower().split())
+
+
+def _search_cache_key(query: str, filters: dict):
+    active = tuple(sorted((k, str(v)) for k, v in (filters or {}).items() if v))
+    return (query, active)
+
+
+def search_cache_stats():
+    return SEARCH_CACHE.stats()
+
+
+def search_candidates(keyword: str, filters: dict = None):
     """
-    Cari kandidat berdasarkan kombinasi role dan skill dengan scoring yang lebih baik
+    Cari kandidat berdasarkan kombinasi role dan skill dengan scoring yang lebih baik.
+    Hasil di-cache per (query ternormalisasi, filter).
     """
-    keyword_lower = keyword.lower().strip()
-    
+    keyword_lower = normalize_search_query(keyword)
+
     if not keyword_lower:
         return []
-    
-    print(f"🎯 Starting search for: '{keyword}'")
+
+    filters = {k: v for k, v in (filters or {}).items() if k in SEARCH_FILTERS and v}
+    cache_key = _search_cache_key(keyword_lower, filters)
+    cached = SEARCH_CACHE.get(cache_key)
+    if cached is not MISSING:
+        print(f"⚡ Search cache hit: '{keyword_lower}' {filters}")
+        return cached
+
+    results = _run_search(keyword_lower, filters)
+    if results is None:
+        # Error query -> jangan di-cache
+        return []
+
+    SEARCH_CACHE.set(cache_key, results)
+    return results
+
+
+def role_filter(role_terms):
+    """
+    Kondisi "kandidat pernah menjabat salah satu role_terms".
+    Memakai index candidate_experiences.normalized_title (equality / prefix),
+    bukan LIKE '%..%' ke kolom JSON experience.
+    """
+    normalized_terms = {normalize_title(term) for term in role_terms}
+    normalized_terms.discard("")
+
+    title_conditions = [CandidateExperience.normalized_title.in_(normalized_terms)]
+    for term in normalized_terms:
+        title_conditions.append(CandidateExperience.normalized_title.like(f"{escape_like(term)} %"))
+
+    matching_candidates = (
+        db.session.query(CandidateExperience.candidate_id)
+        .filter(or_(*title_conditions))
+    )
+    return Candidate.id.in_(matching_candidates)
+
+
+def skill_filter(skill_terms):
+    """
+    Kondisi "baris candidate_skills adalah salah satu skill yang dicari".
+    Term di-resolve ke skill_id kanonik lewat SKILL_DICTIONARY, jadi tidak perlu
+    join ke tabel skills + LIKE.
+    """
+    skill_ids = set()
+    for term in skill_terms:
+        skill_ids.update(SKILL_DICTIONARY.match_ids(term))
+
+    if not skill_ids:
+        return false()
+    return CandidateSkill.skill_id.in_(skill_ids)
+
+
+def search_candidates_with_facets(keyword: str, filters: dict = None):
+    """
+    Sama seperti search_candidates, ditambah facet counts (top skills, education,
+    GPA bucket, experience bucket, status). Facet di-cache bersama hasil search.
+    """
+    results = search_candidates(keyword, filters)
+    keyword_lower = normalize_search_query(keyword)
+    if not keyword_lower:
+        return results, compute_facets([])
+
+    filters = {k: v for k, v in (filters or {}).items() if k in SEARCH_FILTERS and v}
+    facets_key = ("facets",) + _search_cache_key(keyword_lower, filters)
+    facets = SEARCH_CACHE.get(facets_key)
+    if facets is MISSING:
+        facets = compute_facets(results)
+        SEARCH_CACHE.set(facets_key, facets)
+    return results, facets
+
+
+def _run_search(keyword_lower: str, filters: dict):
+    print(f"🎯 Starting search for: '{keyword_lower}'")
+    filter_conditions = [SEARCH_FILTERS[k] == v for k, v in filters.items()]
     
     # ============================
     # 1. Identifikasi Role dan Skill
@@ -221,31 +323,19 @@ def search_candidates(keyword: str):
             # CASE 1: Kombinasi Role + Skill - UTAMAKAN SKILL MATCH
             print("🎯 Performing ROLE + SKILL search with skill priority")
             
-            # Buat kondisi untuk role
-            role_conditions = []
-            for term in role_terms:
-                role_conditions.append(func.lower(Candidate.experience).like(f"%{term}%"))
-            
-            # Buat kondisi untuk skill
-            skill_conditions = []
-            for term in skill_terms:
-                like_pattern = f"%{term}%"
-                skill_conditions.append(func.lower(Skill.skill_name).like(like_pattern))
-            
             # Query untuk kandidat yang match role DAN skill
             query = (
                 db.session.query(
                     Candidate,
-                    func.count(Skill.id).label('matched_skills_count')
+                    func.count(CandidateSkill.skill_id).label('matched_skills_count')
                 )
                 .join(CandidateSkill, Candidate.id == CandidateSkill.candidate_id)
-                .join(Skill, Skill.id == CandidateSkill.skill_id)
                 .filter(and_(
-                    or_(*role_conditions),
-                    or_(*skill_conditions)
-                ))
+                    role_filter(role_terms),
+                    skill_filter(skill_terms)
+                ), *filter_conditions)
                 .group_by(Candidate.id)
-                .order_by(func.count(Skill.id).desc())  # Urutkan berdasarkan jumlah skill match
+                .order_by(func.count(CandidateSkill.skill_id).desc())  # Urutkan berdasarkan jumlah skill match
                 .all()
             )
             
@@ -280,6 +370,8 @@ def search_candidates(keyword: str):
                         "skills": db_skills,
                         "experience": getattr(candidate, 'experience', ''),
                         "university": getattr(candidate, 'education', ''),
+                        "gpa": float(candidate.gpa) if candidate.gpa is not None else None,
+                        "total_experience": candidate.total_experience,
                     }
                     
                     candidate_data = {k: v for k, v in candidate_data.items() if v is not None}
@@ -295,13 +387,9 @@ def search_candidates(keyword: str):
             # CASE 2: Hanya Role search
             print("🎯 Performing ROLE-only search")
             
-            role_conditions = []
-            for term in role_terms:
-                role_conditions.append(func.lower(Candidate.experience).like(f"%{term}%"))
-            
             query = (
                 db.session.query(Candidate)
-                .filter(or_(*role_conditions))
+                .filter(role_filter(role_terms), *filter_conditions)
                 .all()
             )
             
@@ -325,6 +413,8 @@ def search_candidates(keyword: str):
                     "skills": db_skills,
                     "experience": getattr(candidate, 'experience', ''),
                     "university": getattr(candidate, 'education', ''),
+                    "gpa": float(candidate.gpa) if candidate.gpa is not None else None,
+                    "total_experience": candidate.total_experience,
                 }
                 
                 candidate_data = {k: v for k, v in candidate_data.items() if v is not None}
@@ -336,21 +426,15 @@ def search_candidates(keyword: str):
             # CASE 3: Hanya Skill search
             print("🎯 Performing SKILL-only search")
             
-            skill_conditions = []
-            for term in skill_terms:
-                like_pattern = f"%{term}%"
-                skill_conditions.append(func.lower(Skill.skill_name).like(like_pattern))
-            
             query = (
                 db.session.query(
                     Candidate,
-                    func.count(Skill.id).label('matched_skills_count')
+                    func.count(CandidateSkill.skill_id).label('matched_skills_count')
                 )
                 .join(CandidateSkill, Candidate.id == CandidateSkill.candidate_id)
-                .join(Skill, Skill.id == CandidateSkill.skill_id)
-                .filter(or_(*skill_conditions))
+                .filter(skill_filter(skill_terms), *filter_conditions)
                 .group_by(Candidate.id)
-                .order_by(func.count(Skill.id).desc())
+                .order_by(func.count(CandidateSkill.skill_id).desc())
                 .all()
             )
             
@@ -378,6 +462,8 @@ def search_candidates(keyword: str):
                         "skills": db_skills,
                         "experience": getattr(candidate, 'experience', ''),
                         "university": getattr(candidate, 'education', ''),
+                        "gpa": float(candidate.gpa) if candidate.gpa is not None else None,
+                        "total_experience": candidate.total_experience,
                     }
                     
                     candidate_data = {k: v for k, v in candidate_data.items() if v is not None}
@@ -409,4 +495,4 @@ def search_candidates(keyword: str):
         
     except Exception as e:
         print(f"❌ Error dalam query: {e}")
-        return []
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -0,0 +1,308 @@
+# app/services/term_stats.py
+import hashlib
+import math
+import threading
+from collections import Counter
+from datetime import datetime
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app.extensions import db
+from app.models import Job, JobTermStats, JobTerm, Candidate, CandidateDocument
+from app.services.leaderboard import LEADERBOARDS
+from app.services.tfidf_scorer import JobTfidfScorer
+from config import Config
+
+# Analyzer TfidfVectorizer bawaan sklearn (lowercase, token >= 2 huruf, stop words)
+_analyze = TfidfVectorizer(stop_words="english").build_analyzer()
+MAX_TERM_LENGTH = 100
+
+
+def text_hash(text) -> str:
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+
+
+def term_counts(text) -> dict:
+    return dict(Counter(term for term in _analyze(text or "") if len(term) <= MAX_TERM_LENGTH))
+
+
+def idf(doc_count, doc_frequency):
+    """IDF dengan smoothing yang sama seperti sklearn (smooth_idf=True)."""
+    return math.log((1 + doc_count) / (1 + doc_frequency)) + 1
+
+
+def cosine_score(cv_counts, job_counts, doc_count, frequencies):
+    """
+    Cosine similarity TF-IDF (0-100) antara CV dan JD dari term counts + document frequency.
+    Biaya O(term unik CV + term unik JD), tidak bergantung pada jumlah CV di job.
+    """
+    def weights(counts):
+        return {t: c * idf(doc_count, frequencies.get(t, 0)) for t, c in counts.items()}
+
+    cv_vec, job_vec = weights(cv_counts), weights(job_counts)
+    cv_norm = math.sqrt(sum(w * w for w in cv_vec.values()))
+    job_norm = math.sqrt(sum(w * w for w in job_vec.values()))
+    if not cv_norm or not job_norm:
+        return 0.0
+    dot = sum(w * job_vec[t] for t, w in cv_vec.items() if t in job_vec)
+    return round(min(dot / (cv_norm * job_norm), 1.0) * 100, 2)
+
+
+def text_similarity(cv_text, job_text):
+    """
+    Skor 0-100 CV vs JD tanpa korpus job (mis. JD bebas dari jobseeker). IDF dari dua
+    dokumen tidak bermakna (term yang muncul di keduanya justru diberi bobot lebih kecil),
+    jadi semua term diberi IDF sama -> cosine term frequency.
+    """
+    return cosine_score(term_counts(cv_text), term_counts(job_text), 0, {})
+
+
+class TermStatsStore:
+    """
+    Model IDF per job yang dipersist di DB (job_term_stats + job_terms) dan di-update
+    incremental setiap CV baru masuk, sehingga skor CV baru tidak perlu refit seluruh korpus.
+
+    Skor lama dihitung dengan IDF saat itu. Re-normalisasi (hitung ulang semua
+    local_score dari term_counts yang tersimpan, lalu match_score kandidat yang masih
+    di stage "local") hanya dijalankan di background ketika IDF term-term JD bergeser
+    melewati Config.IDF_DRIFT_THRESHOLD.
+    """
+
+    def __init__(self, drift_threshold=0.05):
+        self.drift_threshold = drift_threshold
+        self._renormalizing = set()
+        self._lock = threading.Lock()
+
+    # --- statistik ---
+
+    def _frequencies(self, job_id, terms):
+        if not terms:
+            return {}
+        rows = (
+            db.session.query(JobTerm.term, JobTerm.doc_frequency)
+            .filter(JobTerm.job_id == job_id, JobTerm.term.in_(list(terms)))
+            .all()
+        )
+        return dict(rows)
+
+    def _increment_terms(self, job_id, terms):
+        if not terms:
+            return
+        stmt = mysql_insert(JobTerm.__table__).values(
+            [{"job_id": job_id, "term": term, "doc_frequency": 1} for term in terms]
+        )
+        db.session.execute(stmt.on_duplicate_key_update(doc_frequency=JobTerm.__table__.c.doc_frequency + 1))
+
+    def _locked_stats(self, job):
+        """
+        Row JobTermStats job ini (SELECT ... FOR UPDATE supaya upload paralel tidak
+        kehilangan increment). Dibuat / di-rebuild kalau belum ada atau JD berubah.
+        """
+        job_hash = text_hash(job.job_description)
+        stats = db.session.query(JobTermStats).filter_by(job_id=job.id).with_for_update().first()
+        if stats is None:
+            stats = JobTermStats(job_id=job.id, doc_count=0, job_text_hash=job_hash)
+            db.session.add(stats)
+            db.session.flush()
+            self._seed(stats, job)
+        elif stats.job_text_hash != job_hash:
+            self._rebuild(stats, job)
+        return stats
+
+    def _seed(self, stats, job):
+        """JD sebagai dokumen pertama korpus."""
+        job_terms = term_counts(job.job_description)
+        stats.doc_count = 1
+        self._increment_terms(job.id, job_terms.keys())
+        stats.idf_snapshot = {t: idf(1, 1) for t in job_terms}
+        stats.normalized_at = datetime.utcnow()
+
+    def _rebuild(self, stats, job):
+        """JD berubah: hitung ulang document frequency dari JD + semua CV yang tersimpan."""
+        JobTerm.query.filter_by(job_id=job.id).delete(synchronize_session=False)
+        frequencies = Counter(term_counts(job.job_description).keys())
+        doc_count = 1
+        for (counts,) in (
+            db.session.query(CandidateDocument.term_counts)
+            .filter(CandidateDocument.job_id == job.id)
+            .yield_per(500)
+        ):
+            frequencies.update((counts or {}).keys())
+            doc_count += 1
+
+        if frequencies:
+            db.session.execute(JobTerm.__table__.insert(), [
+                {"job_id": job.id, "term": term, "doc_frequency": df} for term, df in frequencies.items()
+            ])
+        stats.doc_count = doc_count
+        stats.job_text_hash = text_hash(job.job_description)
+        # Snapshot dikosongkan -> drift pasti melewati threshold -> skor lama dihitung ulang
+        stats.idf_snapshot = {}
+
+    # --- scoring ---
+
+    def add_document(self, job_id, candidate_id, text):
+        """
+        Tambahkan CV ke korpus job dan simpan local_score-nya. Return skor (0-100) atau None.
+        Idempoten: CV yang sama (hash teks sama) tidak dihitung dua kali.
+        """
+        job = db.session.get(Job, job_id)
+        if not job or not text:
+            return None
+
+        digest = text_hash(text)
+        document = db.session.get(CandidateDocument, candidate_id)
+        if document is not None and document.text_hash == digest:
+            return float(document.local_score) if document.local_score is not None else None
+
+        try:
+            stats = self._locked_stats(job)
+            cv_terms = term_counts(text)
+            job_terms = term_counts(job.job_description)
+
+            stats.doc_count += 1
+            self._increment_terms(job_id, cv_terms.keys())
+            frequencies = self._frequencies(job_id, set(cv_terms) | set(job_terms))
+            score = cosine_score(cv_terms, job_terms, stats.doc_count, frequencies)
+
+            if document is None:
+                document = CandidateDocument(candidate_id=candidate_id, job_id=job_id)
+                db.session.add(document)
+            document.text = text
+            document.text_hash = digest
+            document.term_counts = cv_terms
+            document.local_score = score
+            document.scored_at = datetime.utcnow()
+
+            drift = self._drift(stats, job_terms, frequencies)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"Database error in term_stats.add_document: {e}")
+            return None
+
+        if drift > self.drift_threshold:
+            self.schedule_renormalize(job_id)
+        return score
+
+    def _drift(self, stats, job_terms, frequencies):
+        """Rata-rata perubahan relatif IDF term-term JD sejak re-normalisasi terakhir."""
+        snapshot = stats.idf_snapshot or {}
+        if not job_terms:
+            return 0.0
+        if not snapshot:
+            return float("inf")
+        changes = []
+        for term in job_terms:
+            current = idf(stats.doc_count, frequencies.get(term, 0))
+            previous = snapshot.get(term)
+            changes.append(1.0 if previous is None else abs(current - previous) / previous)
+        return sum(changes) / len(changes)
+
+    def drift(self, job_id):
+        stats = db.session.get(JobTermStats, job_id)
+        job = db.session.get(Job, job_id)
+        if stats is None or job is None:
+            return 0.0
+        job_terms = term_counts(job.job_description)
+        return self._drift(stats, job_terms, self._frequencies(job_id, job_terms.keys()))
+
+    # --- re-normalisasi ---
+
+    def renormalize(self, job_id):
+        """
+        Hitung ulang local_score semua CV job ini dengan IDF terbaru, dan match_score
+        kandidat yang skornya masih dari stage "local" (yang dibaca ranking, leaderboard,
+        export). Return jumlah CV.
+        """
+        job = db.session.get(Job, job_id)
+        if job is None:
+            return 0
+
+        stats = self._locked_stats(job)
+        db.session.commit()  # lepas row lock; upload baru boleh jalan selama skor dihitung ulang
+
+        frequencies = dict(
+            db.session.query(JobTerm.term, JobTerm.doc_frequency).filter(JobTerm.job_id == job_id).all()
+        )
+        doc_count = stats.doc_count
+        job_terms = term_counts(job.job_description)
+        # Satu scorer (IDF dari term stats) untuk semua CV job, skor per batch dengan satu mat-vec
+        scorer = JobTfidfScorer(job_terms, lambda term: idf(doc_count, frequencies.get(term, 0)))
+
+        updates, batch = [], []
+
+        def flush():
+            scores = scorer.score_many([counts for _, counts in batch])
+            updates.extend(
+                {"candidate_id": candidate_id, "local_score": float(score)}
+                for (candidate_id, _), score in zip(batch, scores)
+            )
+            batch.clear()
+
+        for candidate_id, counts in (
+            db.session.query(CandidateDocument.candidate_id, CandidateDocument.term_counts)
+            .filter(CandidateDocument.job_id == job_id)
+            .yield_per(500)
+        ):
+            batch.append((candidate_id, counts or {}))
+            if len(batch) >= 500:
+                flush()
+        if batch:
+            flush()
+        if updates:
+            db.session.bulk_update_mappings(CandidateDocument, updates)
+            # match_score = local_score baru (correlated subquery, satu UPDATE); skor LLM tidak disentuh
+            local_score = (
+                db.session.query(CandidateDocument.local_score)
+                .filter(CandidateDocument.candidate_id == Candidate.id)
+                .scalar_subquery()
+            )
+            has_document = db.session.query(CandidateDocument.candidate_id).filter(
+                CandidateDocument.candidate_id == Candidate.id
+            ).exists()
+            Candidate.query.filter(
+                Candidate.job_id == job_id, Candidate.scoring_stage == "local", has_document
+            ).update({Candidate.match_score: local_score}, synchronize_session=False)
+
+        stats.idf_snapshot = {t: idf(doc_count, frequencies.get(t, 0)) for t in job_terms}
+        stats.normalized_at = datetime.utcnow()
+        db.session.commit()
+
+        if updates:
+            import app.databases as databases  # databases mengimpor TERM_STATS -> import lokal
+            databases.bump_job_candidates_version(job_id)
+            databases.invalidate_candidate_caches()
+            LEADERBOARDS.reload(job_id)
+        print(f"♻️  [TERM STATS] Re-normalisasi job {job_id}: {len(updates)} CV, doc_count={doc_count}")
+        return len(updates)
+
+    def schedule_renormalize(self, job_id):
+        """Jalankan renormalize di background thread (maksimal satu per job)."""
+        from flask import current_app
+
+        with self._lock:
+            if job_id in self._renormalizing:
+                return False
+            self._renormalizing.add(job_id)
+
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                try:
+                    self.renormalize(job_id)
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"Error re-normalisasi term stats job {job_id}: {e}")
+                finally:
+                    db.session.remove()
+                    with self._lock:
+                        self._renormalizing.discard(job_id)
+
+        threading.Thread(target=run, name=f"term-stats-{job_id}", daemon=True).start()
+        return True
+
+
+TERM_STATS = TermStatsStore(drift_threshold=Config.IDF_DRIFT_THRESHOLD)
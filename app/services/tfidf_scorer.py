@@ -0,0 +1,125 @@
+# app/services/tfidf_scorer.py
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.preprocessing import normalize
+
+
+class JobTfidfScorer:
+    """
+    Scorer TF-IDF untuk satu job: satu model IDF, banyak CV.
+
+    Tidak ada fit per pasangan CV/JD: IDF di-load dari statistik korpus job
+    (services.term_stats, document frequency semua CV job itu). Semua CV
+    (term counts) dijadikan satu sparse matrix, baris di-L2-normalize, lalu
+    cosine similarity terhadap JD dihitung dengan satu sparse matrix-vector product.
+    Hasilnya sama dengan term_stats.cosine_score per pasangan.
+    """
+
+    def __init__(self, job_counts, idf):
+        """job_counts: {term: count} JD. idf: callable term -> bobot IDF."""
+        self._idf = idf
+        self._index = {}
+        self._weights = []
+        rows, cols, data = self._entries([job_counts or {}])
+        # Term JD menempati kolom 0..n_job_terms-1; hanya kolom ini yang masuk dot product
+        self._n_job_terms = len(self._weights)
+        # JD kosong / hanya stop words -> semua skor 0
+        self._job_vector = normalize(self._matrix(rows, cols, data, 1)).T.tocsc() if self._n_job_terms else None
+
+    def _column(self, term):
+        column = self._index.get(term)
+        if column is None:
+            column = self._index[term] = len(self._weights)
+            self._weights.append(self._idf(term))
+        return column
+
+    def _entries(self, documents):
+        rows, cols, data = [], [], []
+        for row, counts in enumerate(documents):
+            for term, count in counts.items():
+                column = self._column(term)
+                rows.append(row)
+                cols.append(column)
+                data.append(count * self._weights[column])
+        return rows, cols, data
+
+    def _matrix(self, rows, cols, data, n_rows):
+        return csr_matrix((np.asarray(data, dtype=np.float64), (rows, cols)), shape=(n_rows, len(self._weights)))
+
+    def score_many(self, documents) -> np.ndarray:
+        """Skor 0-100 untuk setiap CV ({term: count}), urutan sama dengan input."""
+        documents = [counts or {} for counts in documents]
+        if self._job_vector is None or not documents:
+            return np.zeros(len(documents))
+        rows, cols, data = self._entries(documents)
+        # Norm CV dari semua term-nya, dot product cukup di kolom term JD
+        matrix = normalize(self._matrix(rows, cols, data, len(documents)))[:, :self._n_job_terms]
+        similarity = matrix @ self._job_vector               # (n_cv, 1), sparse mat-vec
+        scores = np.asarray(similarity.todense()).ravel()
+        return np.round(np.clip(scores, 0.0, 1.0) * 100, 2)
+
+    def score(self, counts) -> float:
+        return float(self.score_many([counts])[0])
+
+
+def _benchmark():
+    """
+    python -m app.services.tfidf_scorer
+    Bandingkan loop per pasangan (fit vectorizer per CV) vs satu matrix-vector product
+    dengan IDF dari statistik korpus job.
+    """
+    import math
+    import random
+    import time
+    from collections import Counter
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    random.seed(42)
+    vocabulary = [
+        "python", "sql", "spark", "airflow", "etl", "pipeline", "docker", "kubernetes", "aws",
+        "gcp", "bigquery", "tableau", "excel", "stakeholder", "requirement", "analysis",
+        "dashboard", "kafka", "hadoop", "scala", "java", "machine", "learning", "statistics",
+        "communication", "agile", "scrum", "jira", "api", "microservices", "postgresql", "mysql",
+        "data", "warehouse", "modeling", "reporting", "business", "process", "documentation",
+    ] + [f"term{i}" for i in range(2000)]
+    analyze = TfidfVectorizer(stop_words="english").build_analyzer()
+
+    def fake_text(n_words):
+        return " ".join(random.choice(vocabulary) for _ in range(n_words))
+
+    job_text = fake_text(250)
+
+    def per_pair(cv_texts):
+        scores = []
+        for cv_text in cv_texts:
+            tfidf = TfidfVectorizer(stop_words="english")
+            matrix = tfidf.fit_transform([cv_text, job_text])
+            scores.append(round(cosine_similarity(matrix[0:1], matrix[1:2])[0][0] * 100, 2))
+        return scores
+
+    for n in (1000, 10000):
+        cv_texts = [fake_text(600) for _ in range(n)]
+        documents = [Counter(analyze(text)) for text in cv_texts]
+        frequencies = Counter()
+        for counts in [Counter(analyze(job_text))] + documents:
+            frequencies.update(counts.keys())
+        doc_count = n + 1
+
+        def vectorized(_):
+            scorer = JobTfidfScorer(
+                Counter(analyze(job_text)),
+                lambda term: math.log((1 + doc_count) / (1 + frequencies.get(term, 0))) + 1,
+            )
+            return scorer.score_many(documents)
+
+        for label, fn in (("per-pair loop", per_pair), ("term stats", vectorized)):
+            started = time.perf_counter()
+            fn(cv_texts)
+            elapsed = time.perf_counter() - started
+            print(f"{n:>6} CV  {label:<15} {elapsed:>8.2f} s  ({elapsed / n * 1000:.3f} ms/CV)")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -19,4 +19,59 @@ class Config:
     )
 
 
-    SQLALCHEMY_TRACK_MODIFICATIONS = False  # disables overhead warning
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False  # disables overhead warning
+
+    # Cache hasil talent search (jumlah entry maksimum sebelum LRU eviction)
+    SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', 256))
+
+    # Keyset pagination untuk endpoint list kandidat
+    DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', 50))
+    MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', 500))
+
+    # Jumlah kandidat teratas per job yang disimpan di tabel job_leaderboard_entries
+    LEADERBOARD_TOP_N = int(os.getenv('LEADERBOARD_TOP_N', 100))
+
+    # Cache detail kandidat (GET /api/hr/candidates/<id>), TTL dalam detik
+    CANDIDATE_DETAIL_CACHE_MAX_ENTRIES = int(os.getenv('CANDIDATE_DETAIL_CACHE_MAX_ENTRIES', 512))
+    CANDIDATE_DETAIL_CACHE_TTL = int(os.getenv('CANDIDATE_DETAIL_CACHE_TTL', 300))
+
+    # Cache daftar job (+ statistik kandidat) untuk dashboard, TTL dalam detik
+    JOB_LIST_CACHE_TTL = int(os.getenv('JOB_LIST_CACHE_TTL', 30))
+
+    # Kompresi response (app/compression.py). Brotli / zstd dipakai kalau library-nya ter-install.
+    COMPRESS_ENABLED = os.getenv('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_ALGORITHMS = os.getenv('COMPRESS_ALGORITHMS', 'br,zstd,gzip').split(',')
+
+    # Re-normalisasi skor TF-IDF lokal per job dijalankan kalau rata-rata perubahan relatif
+    # IDF term-term JD sejak re-normalisasi terakhir melewati batas ini
+    IDF_DRIFT_THRESHOLD = float(os.getenv('IDF_DRIFT_THRESHOLD', 0.05))
+
+    # Cascade scoring bulk upload: hanya top N (atau top persentil, kalau > 0) per job
+    # menurut skor TF-IDF lokal yang dinilai ulang oleh LLM
+    LLM_SHORTLIST_TOP_N = int(os.getenv('LLM_SHORTLIST_TOP_N', 10))
+    LLM_SHORTLIST_PERCENTILE = float(os.getenv('LLM_SHORTLIST_PERCENTILE', 0))
+
+    # Re-scoring background setelah JD / requirement job diubah: jumlah worker paralel tahap LLM
+    RESCORE_WORKERS = int(os.getenv('RESCORE_WORKERS', 4))
+
+    # Batas token teks CV di prompt Gemini (parse, match score, Astra). 0 = tanpa batas.
+    # Section CV diisi menurut prioritas (lihat services.cv_sections.compact_cv)
+    CV_PROMPT_TOKEN_BUDGET = int(os.getenv('CV_PROMPT_TOKEN_BUDGET', 2000))
+
+    # Cache hasil analisis rubrik Astra (tabel analysis_cache), dalam detik. 0 = cache mati
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', 7 * 24 * 3600))
+    # Model Gemini hasil auto-detect (list_models) di-memo selama ini (detik)
+    GEMINI_MODEL_DETECTION_TTL = int(os.getenv('GEMINI_MODEL_DETECTION_TTL', 3600))
+
+    # Latency budget panggilan LLM user-facing (services.llm_budget), dalam detik.
+    # Lewat deadline -> skor lokal provisional, hasil LLM ditulis belakangan.
+    LLM_DEADLINE_ASTRA_ANALYZE = float(os.getenv('LLM_DEADLINE_ASTRA_ANALYZE', 20))
+    # Batas hedge sebelum p95 punya cukup sampel
+    LLM_HEDGE_DEFAULT_DELAY = float(os.getenv('LLM_HEDGE_DEFAULT_DELAY', 8))
+    LLM_MAX_INFLIGHT = int(os.getenv('LLM_MAX_INFLIGHT', 16))
+
+    # Skill matcher (services.skill_matcher): vocabulary skill dari DB di-compile ulang setelah TTL ini (detik)
+    SKILL_VOCABULARY_TTL = int(os.getenv('SKILL_VOCABULARY_TTL', 600))
+    # Hard filter upload: minimal persentase skill job yang ditemukan di CV. 0 = filter mati
+    MIN_SKILL_MATCH_RATIO = float(os.getenv('MIN_SKILL_MATCH_RATIO', 0))
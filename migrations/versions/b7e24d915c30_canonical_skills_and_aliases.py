@@ -0,0 +1,155 @@
+"""Canonical skills: normalized_key, skill_aliases, merge duplicates
+
+Revision ID: b7e24d915c30
+Revises: a3f1c9d2e847
+Create Date: 2026-10-19 10:02:47.530611
+
+"""
+import re
+import uuid
+from collections import defaultdict
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e24d915c30'
+down_revision = 'a3f1c9d2e847'
+branch_labels = None
+depends_on = None
+
+
+# Snapshot normalisasi + alias bawaan dari app/services/skill_dictionary.py saat revisi ini
+# dibuat. Sengaja tidak diimpor dari app: merge dan alias hasil migrasi tidak boleh berubah
+# (atau gagal) kalau dictionary di app diubah.
+BUILTIN_ALIASES = {
+    "reactjs": "react",
+    "vue": "vuejs",
+    "node": "nodejs",
+    "express": "expressjs",
+    "next": "nextjs",
+    "nuxt": "nuxtjs",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "tailwind": "tailwindcss",
+    "restfulapi": "restapi",
+    "rest": "restapi",
+    "sklearn": "scikitlearn",
+    "gcp": "googlecloudplatform",
+    "googlecloud": "googlecloudplatform",
+    "amazonwebservices": "aws",
+    "ml": "machinelearning",
+    "nlp": "naturallanguageprocessing",
+    "msexcel": "excel",
+    "microsoftexcel": "excel",
+}
+
+
+def skill_key(name: str) -> str:
+    """
+    Key kanonik sebuah skill: lowercase, hanya huruf/angka/+/#.
+    "Node.js" / "NodeJS" / "node js" -> "nodejs", "C++" -> "c++", "C#" -> "c#".
+    """
+    key = re.sub(r"[^a-z0-9+#]+", "", (name or "").lower())
+    return BUILTIN_ALIASES.get(key, key)
+
+
+def upgrade():
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('normalized_key', sa.String(length=255), nullable=True))
+
+    skill_aliases = op.create_table('skill_aliases',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('alias_key', sa.String(length=255), nullable=False),
+    sa.Column('skill_id', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # --- Merge skill duplikat ("Node.js" / "Nodejs" / "Node Js") ---
+    bind = op.get_bind()
+    link_counts = dict(bind.execute(sa.text(
+        "SELECT skill_id, COUNT(*) FROM candidate_skills GROUP BY skill_id"
+    )).fetchall())
+
+    skills_by_key = defaultdict(list)
+    for skill_id, skill_name in bind.execute(sa.text("SELECT id, skill_name FROM skills")).fetchall():
+        skills_by_key[skill_key(skill_name)].append(skill_id)
+
+    canonical_by_key = {}
+    for key, skill_ids in skills_by_key.items():
+        if not key:
+            continue
+        # Skill yang paling banyak dipakai kandidat dijadikan kanonik
+        skill_ids.sort(key=lambda sid: link_counts.get(sid, 0), reverse=True)
+        canonical_id, duplicate_ids = skill_ids[0], skill_ids[1:]
+        canonical_by_key[key] = canonical_id
+
+        bind.execute(
+            sa.text("UPDATE skills SET normalized_key = :key WHERE id = :id"),
+            {"key": key, "id": canonical_id},
+        )
+        if duplicate_ids:
+            bind.execute(
+                sa.text("UPDATE candidate_skills SET skill_id = :canonical WHERE skill_id IN :dups")
+                .bindparams(sa.bindparam("dups", expanding=True)),
+                {"canonical": canonical_id, "dups": duplicate_ids},
+            )
+            bind.execute(
+                sa.text("DELETE FROM skills WHERE id IN :dups")
+                .bindparams(sa.bindparam("dups", expanding=True)),
+                {"dups": duplicate_ids},
+            )
+
+    # Skill tanpa nama tidak bisa di-resolve -> buang
+    empty_ids = skills_by_key.get("", [])
+    if empty_ids:
+        bind.execute(
+            sa.text("DELETE FROM skills WHERE id IN :ids").bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": empty_ids},
+        )
+
+    # Link kandidat yang jadi dobel setelah re-point
+    bind.execute(sa.text(
+        "DELETE cs1 FROM candidate_skills cs1 "
+        "JOIN candidate_skills cs2 ON cs1.candidate_id = cs2.candidate_id "
+        "AND cs1.skill_id = cs2.skill_id AND cs1.id > cs2.id"
+    ))
+
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_skills_normalized_key'), ['normalized_key'], unique=True)
+
+    with op.batch_alter_table('skill_aliases', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_skill_aliases_alias_key'), ['alias_key'], unique=True)
+
+    with op.batch_alter_table('candidate_skills', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_candidate_skills_candidate_skill', ['candidate_id', 'skill_id'])
+
+    # Alias bawaan untuk skill kanonik yang sudah ada
+    aliases = [
+        {"id": str(uuid.uuid4()), "alias_key": alias_key, "skill_id": canonical_by_key[canonical_key]}
+        for alias_key, canonical_key in BUILTIN_ALIASES.items()
+        if canonical_key in canonical_by_key and alias_key not in canonical_by_key
+    ]
+    if aliases:
+        op.bulk_insert(skill_aliases, aliases)
+
+
+def downgrade():
+    with op.batch_alter_table('candidate_skills', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_candidate_skills_candidate_skill', type_='unique')
+
+    with op.batch_alter_table('skill_aliases', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skill_aliases_alias_key'))
+
+    op.drop_table('skill_aliases')
+
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skills_normalized_key'))
+        batch_op.drop_column('normalized_key')
@@ -0,0 +1,26 @@
+"""Add composite index candidates(job_id, status, match_score)
+
+Revision ID: c5d8a0f3b612
+Revises: b7e24d915c30
+Create Date: 2026-10-19 10:41:18.204977
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d8a0f3b612'
+down_revision = 'b7e24d915c30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('candidates', schema=None) as batch_op:
+        batch_op.create_index('ix_candidates_job_status_score', ['job_id', 'status', 'match_score'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('candidates', schema=None) as batch_op:
+        batch_op.drop_index('ix_candidates_job_status_score')
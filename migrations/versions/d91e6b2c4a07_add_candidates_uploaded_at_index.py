@@ -0,0 +1,26 @@
+"""Add index candidates(uploaded_at) for keyset pagination
+
+Revision ID: d91e6b2c4a07
+Revises: c5d8a0f3b612
+Create Date: 2026-10-19 11:05:52.771904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91e6b2c4a07'
+down_revision = 'c5d8a0f3b612'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('candidates', schema=None) as batch_op:
+        batch_op.create_index('ix_candidates_uploaded_at', ['uploaded_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('candidates', schema=None) as batch_op:
+        batch_op.drop_index('ix_candidates_uploaded_at')
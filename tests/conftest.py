@@ -0,0 +1,71 @@
+# tests/conftest.py
+import json
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+import app.databases as databases
+from app.extensions import db
+from app.services.leaderboard import LEADERBOARDS
+from app.services.skill_dictionary import SKILL_DICTIONARY
+from app.services.skill_matcher import invalidate_vocabulary
+
+
+class _JsonArrayAgg:
+    """Padanan JSON_ARRAYAGG MySQL untuk SQLite (NULL kalau tidak ada baris)."""
+
+    def __init__(self):
+        self.values = []
+
+    def step(self, value):
+        self.values.append(value)
+
+    def finalize(self):
+        return json.dumps(self.values) if self.values else None
+
+
+def _register_mysql_shims(conn, _):
+    # JobTerm.term memakai collation MySQL utf8mb4_bin
+    conn.create_collation("utf8mb4_bin", lambda a, b: (a > b) - (a < b))
+    conn.create_aggregate("json_arrayagg", 1, _JsonArrayAgg)
+
+
+@pytest.fixture
+def app():
+    """App Flask minimal dengan SQLite in-memory (tanpa MySQL, tanpa blueprint)."""
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+    )
+    db.init_app(app)
+
+    with app.app_context():
+        event.listen(db.engine, "connect", _register_mysql_shims)
+        db.engine.dispose()
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+        # Cache in-process menyimpan data dari database yang baru saja di-drop
+        SKILL_DICTIONARY.clear()
+        databases.invalidate_candidate_caches()
+        LEADERBOARDS._boards.clear()
+        invalidate_vocabulary()
+
+
+@pytest.fixture
+def make_job(app):
+    from app.models import Job
+
+    def make(**fields):
+        fields.setdefault("hr_user_id", "hr-1")
+        fields.setdefault("job_title", "Data Analyst")
+        fields.setdefault("job_description", "SQL, Python and dashboard reporting")
+        job = Job(**fields)
+        db.session.add(job)
+        db.session.commit()
+        return job
+    return make
@@ -0,0 +1,114 @@
+# tests/test_analysis_cache.py
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.extensions import db
+from app.models import AnalysisCacheEntry
+from app.services import analysis_cache, astra_scoring_service
+from app.services.analysis_cache import (
+    _cache_key, _digest, analyze_cv_cached, cache_key_parts, get_cached, purge_expired,
+)
+from app.services.astra_scoring_service import AstraScoringService, FALLBACK_MODEL, get_best_available_model
+from config import Config
+
+
+@pytest.fixture
+def model_detection(monkeypatch):
+    """genai.list_models palsu + jam monotonic yang bisa dimajukan; memo model di-reset."""
+    state = SimpleNamespace(now=1000.0, calls=0, models=["models/gemini-1.5-flash", "models/gemini-2.0-flash"], error=None)
+
+    def list_models():
+        state.calls += 1
+        if state.error:
+            raise state.error
+        return [SimpleNamespace(name=name, supported_generation_methods=["generateContent"]) for name in state.models]
+
+    monkeypatch.setattr(astra_scoring_service.genai, "list_models", list_models)
+    monkeypatch.setattr(astra_scoring_service.time, "monotonic", lambda: state.now)
+    monkeypatch.setattr(astra_scoring_service, "_detected_model", None)
+    monkeypatch.setattr(astra_scoring_service, "_detected_until", 0.0)
+    monkeypatch.setattr(Config, "GEMINI_MODEL_DETECTION_TTL", 3600)
+    return state
+
+
+def test_model_is_memoized_for_the_ttl(model_detection):
+    assert get_best_available_model() == "models/gemini-2.0-flash"
+    model_detection.now += 3599
+    model_detection.models = ["models/gemini-1.5-pro"]
+    assert get_best_available_model() == "models/gemini-2.0-flash"
+    assert model_detection.calls == 1
+
+    model_detection.now += 2
+    assert get_best_available_model() == "models/gemini-1.5-pro"
+    assert model_detection.calls == 2
+
+
+def test_failed_detection_caches_the_fallback_for_a_shorter_retry(model_detection):
+    model_detection.error = RuntimeError("network down")
+    assert get_best_available_model() == FALLBACK_MODEL
+    assert get_best_available_model() == FALLBACK_MODEL
+    assert model_detection.calls == 1
+
+    model_detection.error = None
+    model_detection.now += astra_scoring_service.MODEL_DETECTION_RETRY + 1
+    assert get_best_available_model() == "models/gemini-2.0-flash"
+
+
+def test_digest_ignores_whitespace_only_changes():
+    assert _digest("Python  SQL\n\nAirflow ") == _digest("Python SQL Airflow")
+    assert _digest("Python SQL") != _digest("Python, SQL")
+    assert _digest(None) == _digest("")
+
+
+def test_key_changes_with_engine_and_prompt_budget(model_detection, monkeypatch):
+    gemini = cache_key_parts("cv", "jd", "Data Engineer", "gemini")
+    local = cache_key_parts("cv", "jd", "Data Engineer", "local")
+    assert (gemini["model"], local["model"]) == ("models/gemini-2.0-flash", analysis_cache.LOCAL_MODEL)
+    assert _cache_key(gemini) != _cache_key(local)
+
+    monkeypatch.setattr(Config, "CV_PROMPT_TOKEN_BUDGET", Config.CV_PROMPT_TOKEN_BUDGET + 1)
+    assert _cache_key(cache_key_parts("cv", "jd", "Data Engineer", "local")) != _cache_key(local)
+
+
+def _entry(parts, result, expires_in):
+    now = datetime.utcnow()
+    db.session.add(AnalysisCacheEntry(
+        cache_key=_cache_key(parts), result=result, created_at=now, expires_at=now + timedelta(seconds=expires_in),
+        **parts,
+    ))
+    db.session.commit()
+
+
+def test_get_cached_counts_hits_and_honours_expiry(app):
+    fresh = cache_key_parts("cv a", "jd", "Analyst", "local")
+    expired = cache_key_parts("cv b", "jd", "Analyst", "local")
+    _entry(fresh, {"skor_akhir": 70}, 60)
+    _entry(expired, {"skor_akhir": 50}, -1)
+
+    assert get_cached(fresh)[0] == {"skor_akhir": 70}
+    get_cached(fresh)
+    db.session.commit()
+    assert db.session.get(AnalysisCacheEntry, _cache_key(fresh)).hit_count == 2
+    assert get_cached(expired) == (None, None)
+
+    assert purge_expired() == 1
+    assert AnalysisCacheEntry.query.count() == 1
+
+
+def test_hit_skips_analysis_and_fallback_is_not_stored(app, monkeypatch):
+    analyses, stored = [], []
+    monkeypatch.setattr(AstraScoringService, "analyze_cv", staticmethod(
+        lambda *args, **kwargs: analyses.append(args) or {"skor_akhir": 40, "fallback": True}
+    ))
+    monkeypatch.setattr(analysis_cache, "store", lambda parts, result, ttl_seconds=None: stored.append(result))
+    monkeypatch.setattr(Config, "ANALYSIS_CACHE_TTL", 3600)
+
+    _entry(cache_key_parts("cv", "jd", "Analyst", "local"), {"skor_akhir": 88}, 60)
+    result, info = analyze_cv_cached("cv\n", "jd", "Analyst", engine="local")
+    assert result == {"skor_akhir": 88} and info["cache_hit"] and not analyses
+
+    result, info = analyze_cv_cached("other cv", "jd", "Analyst", engine="local")
+    assert result["fallback"] and not info["cache_hit"]
+    assert len(analyses) == 1 and stored == []
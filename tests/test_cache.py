@@ -0,0 +1,51 @@
+# tests/test_cache.py
+from app.services import cache as cache_module
+from app.services.cache import LRUCache, MISSING
+
+
+def test_cached_none_is_distinct_from_missing():
+    cache = LRUCache()
+    cache.set("empty", None)
+    assert cache.get("empty") is None
+    assert cache.get("unknown") is MISSING
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1          # "a" jadi paling baru dipakai
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(ttl_seconds=30)
+    cache.set("key", "value")
+    now[0] += 29
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key") is MISSING
+
+
+def test_bump_generation_invalidates_everything():
+    cache = LRUCache()
+    cache.set("a", 1)
+    assert cache.bump_generation() == 1
+    assert cache.get("a") is MISSING
+    cache.set("a", 2)
+    assert cache.get("a") == 2
+
+
+def test_stats_hit_rate():
+    cache = LRUCache(name="talent_search")
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert (stats["name"], stats["hits"], stats["misses"], stats["hit_rate"]) == ("talent_search", 1, 1, 0.5)
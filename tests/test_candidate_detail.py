@@ -0,0 +1,44 @@
+# tests/test_candidate_detail.py
+from datetime import date
+
+import app.databases as databases
+from app.extensions import db
+from app.models import Candidate, CandidateExperience, CandidateSkill
+from app.services.skill_dictionary import SKILL_DICTIONARY
+
+
+def _candidate(job):
+    candidate = Candidate(id="c1", job_id=job.id, name="Dewi", status="passed_filter", match_score=75)
+    candidate.experiences = [
+        CandidateExperience(title="Intern", normalized_title="intern", start_date=date(2018, 1, 1), end_date=date(2018, 6, 1)),
+        CandidateExperience(title="Data Analyst", normalized_title="data analyst", start_date=date(2021, 3, 1)),
+        CandidateExperience(title="Junior Analyst", normalized_title="analyst", start_date=date(2019, 1, 1), end_date=date(2021, 2, 1)),
+    ]
+    db.session.add(candidate)
+    db.session.flush()
+    for name in ("python", "Excel"):
+        db.session.add(CandidateSkill(candidate_id="c1", skill_id=SKILL_DICTIONARY.get_or_create(name)))
+    db.session.commit()
+
+
+def test_detail_contains_skills_and_experience_newest_first(make_job):
+    _candidate(make_job())
+    detail = databases.get_candidate_by_id("c1")
+
+    assert [s["name"] for s in detail["skill_details"]] == ["Excel", "Python"]
+    assert [e["title"] for e in detail["experience_entries"]] == ["Data Analyst", "Junior Analyst", "Intern"]
+    assert detail["experience_entries"][0]["end_date"] is None
+    assert databases.get_candidate_by_id("missing") is None
+
+
+def test_detail_is_cached_until_the_candidate_changes(make_job):
+    _candidate(make_job())
+    assert databases.get_candidate_by_id("c1")["status"] == "passed_filter"
+
+    Candidate.query.filter_by(id="c1").update({"name": "Dewi Lestari"})
+    db.session.commit()
+    assert databases.get_candidate_by_id("c1")["name"] == "Dewi"
+
+    databases.update_candidate_status("c1", "rejected", "Not a fit")
+    detail = databases.get_candidate_by_id("c1")
+    assert (detail["name"], detail["status"], detail["rejection_reason"]) == ("Dewi Lestari", "rejected", "Not a fit")
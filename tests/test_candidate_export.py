@@ -0,0 +1,68 @@
+# tests/test_candidate_export.py
+import csv
+import io
+import json
+
+import pytest
+
+from app.extensions import db
+from app.models import Candidate, CandidateSkill
+from app.services import candidate_export
+from app.services.candidate_export import EXPORT_FIELDS, _skill_list, export_stream, iter_csv, iter_export_rows
+from app.services.skill_dictionary import SKILL_DICTIONARY
+
+# Lebih dari 1024 byte (batas default group_concat_max_len) + nama skill yang mengandung koma
+MANY_SKILLS = [f"Skill Nomor {i:03d} Dengan Nama Panjang" for i in range(40)] + ["Data Analysis, Visualisation"]
+
+
+@pytest.fixture
+def export_job(make_job):
+    job = make_job()
+    db.session.add(Candidate(id="c1", job_id=job.id, name="Rina", status="passed_filter", match_score=88))
+    db.session.add(Candidate(id="c2", job_id=job.id, name="Andi", status="rejected"))
+    db.session.flush()
+    for name in MANY_SKILLS:
+        db.session.add(CandidateSkill(candidate_id="c1", skill_id=SKILL_DICTIONARY.get_or_create(name)))
+    db.session.commit()
+    return job
+
+
+@pytest.mark.parametrize("value, skills", [
+    ('["SQL", "A, B"]', ["SQL", "A, B"]),
+    (["SQL", None], ["SQL"]),
+    (None, []),
+])
+def test_skill_list(value, skills):
+    assert _skill_list(value) == skills
+
+
+def test_rows_carry_every_skill_untruncated(export_job):
+    rows = list(iter_export_rows(export_job.id))
+    assert [row["id"] for row in rows] == ["c1", "c2"]
+    assert sorted(rows[0]["skills"]) == sorted(MANY_SKILLS)
+    assert rows[1]["skills"] == []
+
+
+def test_csv_and_ndjson(export_job, monkeypatch):
+    monkeypatch.setattr(candidate_export, "CHUNK_SIZE", 16)
+    csv_rows = list(csv.DictReader(io.StringIO(b"".join(export_stream(export_job.id, "csv")).decode("utf-8"))))
+    assert [row["name"] for row in csv_rows] == ["Rina", "Andi"]
+    assert "Data Analysis, Visualisation" in csv_rows[0]["skills"].split("; ")
+
+    ndjson_rows = [json.loads(line) for line in b"".join(export_stream(export_job.id, "ndjson")).splitlines()]
+    assert [row["match_score"] for row in ndjson_rows] == [88.0, None]
+
+
+def test_csv_header_is_sent_before_any_row_is_read():
+    def rows():
+        raise AssertionError("baris belum boleh dibaca")
+        yield
+
+    chunks = iter_csv(rows())
+    assert next(chunks).decode("utf-8") == ",".join(EXPORT_FIELDS) + "\r\n"
+    assert list(iter_csv([])) == [(",".join(EXPORT_FIELDS) + "\r\n").encode("utf-8")]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        export_stream("job", "xlsx")
@@ -0,0 +1,31 @@
+# tests/test_candidate_projection.py
+from decimal import Decimal
+
+import app.databases as databases
+from app.extensions import db
+from app.models import Candidate, CandidateSkill
+from app.services.skill_dictionary import SKILL_DICTIONARY
+
+
+def test_projection_matches_full_orm_dict(make_job):
+    job = make_job()
+    db.session.add(Candidate(
+        id="c1", job_id=job.id, name="Siti", email="siti@example.com", phone="0812", original_filename="siti.pdf",
+        status="passed_filter", match_score=Decimal("82.50"), gpa=Decimal("3.45"), total_experience=3,
+        experience='["Data Analyst at Bukalapak (2021 - 2024)"]', education="S1 Statistika",
+    ))
+    db.session.flush()
+    for name in ("SQL", "Tableau"):
+        db.session.add(CandidateSkill(candidate_id="c1", skill_id=SKILL_DICTIONARY.get_or_create(name)))
+    db.session.commit()
+
+    lean = databases.get_candidates_page_for_job(job.id)[0][0]
+    full = databases.candidate_to_dict(db.session.get(Candidate, "c1"))
+
+    shared = set(lean) & set(full) - {"skills"}
+    assert shared >= {"id", "name", "match_score", "status", "gpa"}
+    assert {key: lean[key] for key in shared} == {key: full[key] for key in shared}
+    assert sorted(lean["skills"]) == sorted(full["skills"]) == ["SQL", "Tableau"]
+    # Kolom berat tidak ikut di-load untuk list
+    assert "experience" not in lean
+
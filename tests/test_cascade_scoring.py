@@ -0,0 +1,129 @@
+# tests/test_cascade_scoring.py
+import threading
+import time
+
+import pytest
+
+from app.extensions import db
+from app.models import Candidate, CandidateDocument, Job
+from app.services import cascade_scoring
+from app.services.cascade_scoring import cancel_llm_stage, llm_shortlist, score_shortlist, shortlist_size, start_llm_stage
+
+
+@pytest.fixture
+def scored_job(make_job):
+    job = make_job()
+    rows = [
+        # id, status, stage, local_score
+        ("c1", "passed_filter", "local", 90),
+        ("c2", "passed_filter", "llm", 85),
+        ("c3", "passed_filter", "local", 70),
+        ("c4", "rejected", None, 99),
+        ("c5", "passed_filter", "local", 10),
+    ]
+    for candidate_id, status, stage, score in rows:
+        db.session.add(Candidate(id=candidate_id, job_id=job.id, status=status, scoring_stage=stage, match_score=score))
+        db.session.add(CandidateDocument(
+            candidate_id=candidate_id, job_id=job.id, text=f"CV {candidate_id}", local_score=score,
+        ))
+    db.session.commit()
+    return job
+
+
+@pytest.mark.parametrize("total, top_n, percentile, size", [
+    (50, 10, 0, 10),
+    (5, 10, 0, 5),
+    (50, 10, 25, 13),
+    (0, 10, 25, 0),
+    (50, -1, 0, 0),
+])
+def test_shortlist_size(total, top_n, percentile, size):
+    assert shortlist_size(total, top_n, percentile) == size
+
+
+def test_shortlist_ranks_by_local_score_and_skips_llm_scored(scored_job):
+    assert llm_shortlist(scored_job.id, top_n=3, percentile=0) == [("c1", "CV c1"), ("c3", "CV c3")]
+    assert llm_shortlist(scored_job.id, top_n=1, percentile=0) == [("c1", "CV c1")]
+
+
+def test_score_shortlist_writes_llm_scores_and_keeps_local_on_failure(scored_job, monkeypatch):
+    def fake_llm(cv_text, job_description):
+        if cv_text == "CV c3":
+            raise RuntimeError("quota")
+        return {"match_score": 77, "reasoning": "Strong pipeline experience"}
+
+    monkeypatch.setattr(cascade_scoring, "get_ai_match_score", fake_llm)
+    done = []
+
+    scored = score_shortlist(scored_job, [("c1", "CV c1"), ("c3", "CV c3"), ("c5", None)], on_done=lambda cid, ok: done.append((cid, ok)))
+
+    assert scored == 1
+    assert sorted(done) == [("c1", True), ("c3", False)]
+    c1, c3 = db.session.get(Candidate, "c1"), db.session.get(Candidate, "c3")
+    assert (float(c1.match_score), c1.scoring_stage, c1.scoring_reason) == (77.0, "llm", "Strong pipeline experience")
+    assert (float(c3.match_score), c3.scoring_stage) == (70.0, "local")
+
+
+def test_background_stage_queues_one_rerun_per_job(scored_job, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def slow_llm(cv_text, job_description):
+        calls.append(cv_text)
+        release.wait(5)
+        return {"match_score": 80, "reasoning": "ok"}
+
+    monkeypatch.setattr(cascade_scoring, "get_ai_match_score", slow_llm)
+
+    assert start_llm_stage(scored_job.id, top_n=1, percentile=0) is True
+    assert start_llm_stage(scored_job.id, top_n=5, percentile=0) is False
+    assert start_llm_stage(scored_job.id, top_n=5, percentile=0) is False
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while scored_job.id in cascade_scoring._running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert scored_job.id not in cascade_scoring._running
+    # Run pertama: c1. Satu run lanjutan (shortlist dihitung ulang): c3 dan c5, c1 tidak dinilai dua kali
+    assert sorted(calls) == ["CV c1", "CV c3", "CV c5"]
+    db.session.expire_all()
+    assert {c.id for c in Candidate.query.filter_by(scoring_stage="llm")} == {"c1", "c2", "c3", "c5"}
+
+
+def test_scores_for_an_outdated_jd_are_dropped(scored_job, monkeypatch):
+    monkeypatch.setattr(cascade_scoring, "get_ai_match_score", lambda cv_text, jd: {"match_score": 95, "reasoning": "old JD"})
+    done = []
+    # Shortlist dinilai dengan JD lama, sementara JD di DB sudah diubah
+    stale_job = Job(id=scored_job.id, job_description="Old description")
+
+    scored = score_shortlist(stale_job, [("c1", "CV c1"), ("c3", "CV c3")], on_done=lambda cid, ok: done.append((cid, ok)))
+
+    assert scored == 0
+    assert len(done) == 1 and done[0][1] is False
+    db.session.expire_all()
+    assert {c.id for c in Candidate.query.filter_by(scoring_stage="llm")} == {"c2"}
+
+
+def test_cancelled_stage_writes_nothing(scored_job, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_llm(cv_text, job_description):
+        started.set()
+        release.wait(5)
+        return {"match_score": 80, "reasoning": "ok"}
+
+    monkeypatch.setattr(cascade_scoring, "get_ai_match_score", slow_llm)
+    assert cancel_llm_stage(scored_job.id) is False
+
+    start_llm_stage(scored_job.id, top_n=1, percentile=0)
+    assert started.wait(5)
+    assert cancel_llm_stage(scored_job.id) is True
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while scored_job.id in cascade_scoring._running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    db.session.expire_all()
+    assert db.session.get(Candidate, "c1").scoring_stage == "local"
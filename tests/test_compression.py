@@ -0,0 +1,56 @@
+# tests/test_compression.py
+import gzip
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from app.compression import Compress
+
+PAYLOAD = [{"id": i, "name": f"Candidate {i}", "status": "passed_filter"} for i in range(200)]
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.config["COMPRESS_ALGORITHMS"] = ["gzip"]
+    Compress(app)
+
+    @app.route("/big")
+    def big():
+        response = jsonify(PAYLOAD)
+        response.set_etag("v1")
+        return response
+
+    @app.route("/small")
+    def small():
+        return jsonify({"status": "ok"})
+
+    @app.route("/stream")
+    def stream():
+        return Response((b"x" * 2048 for _ in range(2)), mimetype="text/plain")
+
+    @app.route("/pdf")
+    def pdf():
+        return Response(b"%PDF" + b"0" * 4096, mimetype="application/pdf")
+
+    return app.test_client()
+
+
+def test_large_json_is_gzipped_with_weak_etag(client):
+    response = client.get("/big", headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.get_etag() == ("v1", True)
+    assert gzip.decompress(response.data).startswith(b"[")
+    assert int(response.headers["Content-Length"]) == len(response.data)
+
+
+def test_client_without_accept_encoding_gets_identity(client):
+    response = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_etag() == ("v1", False)
+
+
+@pytest.mark.parametrize("path", ["/small", "/stream", "/pdf"])
+def test_skipped_responses(client, path):
+    assert "Content-Encoding" not in client.get(path, headers={"Accept-Encoding": "gzip"}).headers
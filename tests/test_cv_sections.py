@@ -0,0 +1,79 @@
+# tests/test_cv_sections.py
+import pytest
+
+from app.services.cv_sections import (
+    CHARS_PER_TOKEN, compact_cv, estimate_tokens, heading_section, split_sections,
+)
+
+CV = """Budi Santoso
+budi@example.com | 0812-3456-7890
+
+Professional Summary
+Data analyst with 4 years of experience.
+
+Work Experiences:
+Data Analyst at Bank Jago (2021 - 2024)
+- Built weekly dashboards in Tableau used by 120 stakeholders across the retail banking division
+- Built weekly dashboards in Tableau used by 120 stakeholders across the retail banking division
+
+Skills, Achievements & Other
+SQL, Python, Tableau
+
+Pendidikan
+S1 Statistika, Universitas Padjadjaran
+
+References
+Available upon request
+
+Hobi
+Badminton
+"""
+
+
+@pytest.mark.parametrize("line, section", [
+    ("Work Experiences:", "experience"),
+    ("  • PENGALAMAN KERJA", "experience"),
+    ("Education Level", "education"),
+    ("Skills, Achievements & Other", "skills"),
+    ("Sertifikasi", "certifications"),
+    ("Leadership, Teamwork and Communication", None),
+    ("Data Analyst at Bank Jago (2021 - 2024)", None),
+    ("Experience with Python and SQL in a fast paced environment", None),
+])
+def test_heading_section(line, section):
+    assert heading_section(line) == section
+
+
+def test_split_sections():
+    sections = split_sections(CV)
+    assert sections["header"].startswith("Budi Santoso")
+    assert sections["skills"] == "SQL, Python, Tableau"
+    assert sections["education"].startswith("S1 Statistika")
+    assert set(sections) == {"header", "summary", "experience", "skills", "education", "references", "interests"}
+
+
+def test_estimate_tokens_rounds_up():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("a" * (CHARS_PER_TOKEN + 1)) == 2
+
+
+def test_compact_drops_useless_sections_and_duplicate_lines():
+    compact = compact_cv(CV, 0)
+    assert "References" not in compact and "Badminton" not in compact
+    assert compact.count("Built weekly dashboards") == 1
+    assert "EXPERIENCE:\nData Analyst at Bank Jago" in compact
+    # Urutan asli CV dipertahankan
+    assert compact.index("SUMMARY:") < compact.index("EXPERIENCE:") < compact.index("SKILLS:") < compact.index("EDUCATION:")
+
+
+def test_compact_fills_budget_by_priority():
+    budget = 40
+    compact = compact_cv(CV, budget)
+    assert estimate_tokens(compact) <= budget + 1
+    # header + experience lebih dulu; summary (prioritas rendah) tidak muat
+    assert "Budi Santoso" in compact and "EXPERIENCE:" in compact
+    assert "SUMMARY:" not in compact
+
+
+def test_compact_without_headings_keeps_text():
+    assert compact_cv("just one line\n\n  another   line ", 0) == "just one line\nanother line"
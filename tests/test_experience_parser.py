@@ -0,0 +1,42 @@
+# tests/test_experience_parser.py
+from datetime import date
+
+import pytest
+
+from app.services.experience_parser import escape_like, normalize_title, parse_experience_entry
+
+
+def test_parses_title_company_and_open_range():
+    parsed = parse_experience_entry("Business Analyst di CV. Nur Cahaya Pratama (May 2023–NOW)")
+    assert parsed == {
+        "title": "Business Analyst",
+        "normalized_title": "business analyst",
+        "company": "CV. Nur Cahaya Pratama",
+        "start_date": date(2023, 5, 1),
+        "end_date": None,
+    }
+
+
+@pytest.mark.parametrize("entry, start, end", [
+    ("Data Engineer at Gojek (Jan 2020 - Des 2022)", date(2020, 1, 1), date(2022, 12, 1)),
+    ("Data Engineer at Gojek (2019 sampai 2021)", date(2019, 1, 1), date(2021, 1, 1)),
+    ("Data Engineer at Gojek (03/2018 - sekarang)", date(2018, 3, 1), None),
+    ("Data Engineer at Gojek", None, None),
+])
+def test_date_ranges(entry, start, end):
+    parsed = parse_experience_entry(entry)
+    assert (parsed["company"], parsed["start_date"], parsed["end_date"]) == ("Gojek", start, end)
+
+
+def test_normalize_title_strips_seniority_but_keeps_single_word():
+    assert normalize_title("Senior Sr. Software Engineer") == "software engineer"
+    assert normalize_title("Intern") == "intern"
+    assert normalize_title(None) == ""
+
+
+def test_empty_entry():
+    assert parse_experience_entry("")["title"] is None
+
+
+def test_escape_like():
+    assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
@@ -0,0 +1,58 @@
+# tests/test_http_cache.py
+from datetime import datetime
+
+from flask import Flask
+
+from app.services.http_cache import conditional_response, make_etag
+
+UPDATED_AT = datetime(2024, 5, 1, 8, 30, 15, 123456)
+
+
+def _respond(headers):
+    app = Flask(__name__)
+    built = []
+
+    def build():
+        built.append(True)
+        return {"data": []}
+
+    with app.test_request_context(headers=headers):
+        response = conditional_response(make_etag("job-1", 7), UPDATED_AT, build)
+    return response, built
+
+
+def test_make_etag_depends_on_every_part():
+    assert make_etag("job-1", 7, None) == make_etag("job-1", 7, None)
+    assert make_etag("job-1", 7) != make_etag("job-1", 8)
+    assert make_etag("job-1", 7, "cursor-a") != make_etag("job-1", 7, "cursor-b")
+
+
+def test_first_request_gets_full_response_with_validators():
+    response, built = _respond({})
+    assert response.status_code == 200 and built
+    assert response.get_etag()[0] == make_etag("job-1", 7)
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.headers["Last-Modified"] == "Wed, 01 May 2024 08:30:15 GMT"
+
+
+def test_matching_etag_skips_build():
+    response, built = _respond({"If-None-Match": f'"{make_etag("job-1", 7)}"'})
+    assert response.status_code == 304 and not built
+
+
+def test_weak_etag_from_compressed_response_still_matches():
+    response, built = _respond({"If-None-Match": f'W/"{make_etag("job-1", 7)}"'})
+    assert response.status_code == 304 and not built
+
+
+def test_stale_etag_wins_over_if_modified_since():
+    response, built = _respond({
+        "If-None-Match": '"stale"',
+        "If-Modified-Since": "Wed, 01 May 2024 08:30:15 GMT",
+    })
+    assert response.status_code == 200 and built
+
+
+def test_if_modified_since_with_second_precision():
+    assert _respond({"If-Modified-Since": "Wed, 01 May 2024 08:30:15 GMT"})[0].status_code == 304
+    assert _respond({"If-Modified-Since": "Wed, 01 May 2024 08:30:14 GMT"})[0].status_code == 200
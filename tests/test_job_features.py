@@ -0,0 +1,75 @@
+# tests/test_job_features.py
+import pytest
+
+from app.extensions import db
+from app.models import Job, Skill, SkillAlias
+from app.services import job_features
+from app.services.job_features import FEATURES_VERSION, education_rank, get_job_features, is_fresh, job_text
+from app.services.skill_dictionary import SKILL_DICTIONARY
+
+
+@pytest.fixture(autouse=True)
+def fake_keywords(monkeypatch):
+    calls = []
+
+    def extract(text):
+        calls.append(text)
+        return ["pipeline"]
+
+    monkeypatch.setattr(job_features, "extract_jd_keywords", extract)
+    return calls
+
+
+@pytest.mark.parametrize("text, rank", [
+    ("Minimal S1 Informatika", 2),
+    ("Master degree", 3),
+    ("Diploma (D3)", 1),
+    ("SMA/SMK", 0),
+    (None, 0),
+])
+def test_education_rank(text, rank):
+    assert education_rank(text) == rank
+
+
+def test_job_text_includes_requirements():
+    job = Job(job_description="Build pipelines", requirements_json={"a": "Python", "b": None})
+    assert job_text(job) == "Build pipelines\nPython"
+    assert job_text(Job(job_description=None, requirements_json=["SQL"])) == "\nSQL"
+
+
+def test_features_are_computed_once_until_the_jd_changes(make_job, fake_keywords):
+    job = make_job(
+        job_title="Data Engineer", job_description="Experience with Python and SQL",
+        degree_requirements="S1 Teknik Informatika", requirements_json=["Familiar with Airflow"],
+    )
+    features = get_job_features(job)
+
+    assert features["version"] == FEATURES_VERSION
+    assert features["education_level"] == 2 and features["education_label"] == "S1"
+    assert {"Python", "SQL", "Airflow"} <= set(features["skills"])
+    assert db.session.get(Job, job.id).jd_features == features
+
+    get_job_features(job)
+    assert len(fake_keywords) == 1
+
+    job.job_description = "Experience with Kafka"
+    assert not is_fresh(job)
+    get_job_features(job)
+    assert len(fake_keywords) == 2
+
+
+def test_features_are_recomputed_when_the_skill_vocabulary_changes(make_job, fake_keywords):
+    job = make_job(job_title="Analytics Engineer", job_description="Modelling with DataBuildTool")
+    assert get_job_features(job)["skills"] == []
+
+    skill = Skill(skill_name="dbt", normalized_key="dbt")
+    db.session.add(skill)
+    db.session.flush()
+    db.session.add(SkillAlias(alias_key="databuildtool", skill_id=skill.id))
+    db.session.commit()
+    # Skill baru lewat dictionary (tanpa alias) ikut meng-invalidate cache vocabulary
+    SKILL_DICTIONARY.get_or_create("Team Player")
+
+    assert not is_fresh(job)
+    assert get_job_features(job)["skills"] == ["dbt"]
+    assert len(fake_keywords) == 2
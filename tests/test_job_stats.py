@@ -0,0 +1,36 @@
+# tests/test_job_stats.py
+import app.databases as databases
+from app.extensions import db
+from app.models import Candidate
+
+
+def test_job_list_stats_from_one_grouped_query(make_job):
+    busy = make_job(job_title="Data Engineer")
+    empty = make_job(job_title="Designer")
+    for i, (status, score) in enumerate([("passed_filter", 80), ("passed_filter", 61), ("rejected", None), ("processing", None)]):
+        db.session.add(Candidate(id=f"c{i}", job_id=busy.id, status=status, match_score=score))
+    db.session.commit()
+
+    stats = {job["id"]: job["stats"] for job in databases.get_all_jobs(include_stats=True)}
+
+    assert stats[busy.id] == {
+        "total_candidates": 4, "passed": 2, "rejected": 1, "pass_rate": 50.0,
+        "avg_match_score": 70.5, "max_match_score": 80.0,
+    }
+    assert stats[empty.id] == {
+        "total_candidates": 0, "passed": 0, "rejected": 0, "pass_rate": 0.0,
+        "avg_match_score": None, "max_match_score": None,
+    }
+    assert "stats" not in databases.get_all_jobs()[0]
+
+
+def test_job_list_cache_is_cleared_when_a_candidate_changes(make_job):
+    job = make_job()
+    assert databases.get_all_jobs(include_stats=True)[0]["stats"]["total_candidates"] == 0
+
+    db.session.add(Candidate(id="c1", job_id=job.id, status="passed_filter", match_score=50))
+    db.session.commit()
+    assert databases.get_all_jobs(include_stats=True)[0]["stats"]["total_candidates"] == 0
+
+    databases.update_candidate_status("c1", "passed_filter")
+    assert databases.get_all_jobs(include_stats=True)[0]["stats"]["total_candidates"] == 1
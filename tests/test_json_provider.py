@@ -0,0 +1,70 @@
+# tests/test_json_provider.py
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from app.json_provider import FastJSONProvider, iter_json_array, iter_ndjson, stream_json_array
+
+ROWS = [{"id": i, "score": Decimal("80.50"), "uploaded_at": datetime(2024, 5, 1)} for i in range(5)]
+
+
+@pytest.fixture
+def json_app():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    return app
+
+
+def _stream(app, rows, **kwargs):
+    with app.test_request_context():
+        return json.loads(b"".join(stream_json_array(rows, **kwargs).response))
+
+
+def test_provider_serializes_decimal_and_datetime(json_app):
+    with json_app.app_context():
+        assert json.loads(json_app.json.dumps({"score": Decimal("1.5"), "at": datetime(2024, 1, 2)})) == {
+            "score": 1.5, "at": "2024-01-02T00:00:00",
+        }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 64 * 1024])
+def test_chunked_array_is_valid_json(chunk_size):
+    body = b"".join(iter_json_array(iter(ROWS), chunk_size=chunk_size))
+    assert [row["id"] for row in json.loads(body)] == [0, 1, 2, 3, 4]
+    assert b"".join(iter_json_array([])) == b"[]"
+
+
+def test_ndjson_one_object_per_line():
+    lines = b"".join(iter_ndjson(ROWS, chunk_size=10)).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [0, 1, 2, 3, 4]
+
+
+def test_envelope(json_app):
+    body = _stream(json_app, iter(ROWS), envelope={"status": "success"})
+    assert body["status"] == "success"
+    assert len(body["data"]) == 5
+    assert _stream(json_app, [], envelope={}) == {"data": []}
+    assert len(_stream(json_app, ROWS)) == 5
+
+
+def test_error_before_first_row_is_raised_to_the_caller():
+    def failing():
+        raise RuntimeError("query failed")
+        yield
+
+    with pytest.raises(RuntimeError):
+        stream_json_array(failing(), envelope={"status": "success"})
+
+
+def test_error_mid_stream_closes_envelope_with_error_status(json_app):
+    def failing():
+        yield ROWS[0]
+        raise RuntimeError("connection lost")
+
+    body = _stream(json_app, failing(), envelope={"status": "success"})
+    assert body["status"] == "error"
+    assert body["message"] == "connection lost"
+    assert [row["id"] for row in body["data"]] == [0]
@@ -0,0 +1,47 @@
+# tests/test_leaderboard.py
+from app.extensions import db
+from app.models import Candidate, JobLeaderboardEntry
+from app.services.leaderboard import JobLeaderboard, LeaderboardRegistry
+
+
+def test_ranking_ties_and_updates():
+    board = JobLeaderboard([("b", 80), ("a", 80), ("c", 95), ("d", None)])
+    assert board.top(3) == [("c", 95.0), ("a", 80.0), ("b", 80.0)]
+    assert board.rank_of("d") == 4
+    assert board.percentile_of("c") == 100.0
+    assert board.percentile_of("d") == 0.0
+
+    board.upsert("d", 99)
+    assert board.rank_of("d") == 1
+    board.remove("c")
+    assert board.rank_of("c") is None
+    assert len(board) == 3
+
+
+def test_single_candidate_percentile():
+    assert JobLeaderboard([("a", 10)]).percentile_of("a") == 100.0
+
+
+def test_registry_keeps_snapshot_in_sync(make_job):
+    job = make_job()
+    for candidate_id, score in (("c1", 70), ("c2", 60), ("c3", 50)):
+        db.session.add(Candidate(id=candidate_id, job_id=job.id, status="passed_filter", match_score=score))
+    db.session.commit()
+
+    registry = LeaderboardRegistry(top_n=2)
+    registry.reload(job.id)
+    assert [e.candidate_id for e in JobLeaderboardEntry.query.order_by(JobLeaderboardEntry.rank)] == ["c1", "c2"]
+
+    # Kandidat baru masuk top-N -> snapshot ditulis ulang
+    db.session.add(Candidate(id="c4", job_id=job.id, status="passed_filter", match_score=90))
+    db.session.commit()
+    registry.on_candidate_saved(job.id, "c4", "passed_filter", 90)
+    assert registry.top_k(job.id, 2) == [("c4", 90.0), ("c1", 70.0)]
+
+    # Registry baru (proses lain) melayani top-K dari snapshot DB tanpa load penuh
+    fresh = LeaderboardRegistry(top_n=2)
+    assert fresh.top_k(job.id, 2) == [("c4", 90.0), ("c1", 70.0)]
+    assert not fresh.is_loaded(job.id)
+
+    registry.on_candidate_saved(job.id, "c4", "rejected", None)
+    assert fresh.top_k(job.id, 2) == [("c1", 70.0), ("c2", 60.0)]
@@ -0,0 +1,121 @@
+# tests/test_llm_budget.py
+import threading
+import time
+
+from app.services.llm_budget import MIN_SAMPLES, LatencyBudget
+
+
+def _valid(result):
+    return bool(result and result.get("ok"))
+
+
+def _fallback():
+    return {"ok": True, "source": "local"}
+
+
+def _calls(*behaviours):
+    """call() palsu: percobaan ke-i menjalankan behaviours[i] (return dict / raise / sleep)."""
+    attempts = []
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            index = len(attempts)
+            attempts.append(index)
+        return behaviours[min(index, len(behaviours) - 1)]()
+    return call, attempts
+
+
+def test_valid_result_before_deadline():
+    budget = LatencyBudget("test", deadline=2.0, default_hedge_delay=1.0)
+    call, attempts = _calls(lambda: {"ok": True, "source": "llm"})
+
+    result, info = budget.run(call, _valid, _fallback)
+
+    assert result["source"] == "llm"
+    assert info["provisional"] is False and info["hedged"] is False
+    assert attempts == [0]
+    assert budget.stats()["samples"] == 1
+
+
+def test_fast_failure_is_hedged_then_falls_back_without_waiting_for_the_deadline():
+    budget = LatencyBudget("test", deadline=5.0, default_hedge_delay=4.0)
+
+    def fail():
+        raise RuntimeError("quota")
+    call, attempts = _calls(fail)
+
+    started = time.monotonic()
+    result, info = budget.run(call, _valid, _fallback)
+
+    assert time.monotonic() - started < 1.0
+    assert result["source"] == "local"
+    assert (info["provisional"], info["hedged"]) == (False, True)
+    assert attempts == [0, 1]
+
+
+def test_invalid_first_result_uses_the_hedge():
+    budget = LatencyBudget("test", deadline=2.0, default_hedge_delay=1.0)
+    call, attempts = _calls(lambda: {"error": "bad json"}, lambda: {"ok": True, "source": "llm"})
+
+    result, info = budget.run(call, _valid, _fallback)
+    assert result["source"] == "llm" and info["hedged"] is True
+    assert attempts == [0, 1]
+
+
+def test_slow_request_is_hedged_after_the_hedge_delay():
+    budget = LatencyBudget("test", deadline=2.0, default_hedge_delay=0.05)
+
+    def slow():
+        time.sleep(0.5)
+        return {"ok": True, "source": "slow"}
+    call, attempts = _calls(slow, lambda: {"ok": True, "source": "hedge"})
+
+    result, info = budget.run(call, _valid, _fallback)
+    assert result["source"] == "hedge" and attempts == [0, 1]
+    assert info["hedged"] is True and info["provisional"] is False
+    assert budget.stats()["hedged"] == 1
+
+
+def test_deadline_returns_provisional_fallback_and_delivers_the_late_result_once():
+    budget = LatencyBudget("test", deadline=0.2, default_hedge_delay=0.05)
+    release = threading.Event()
+
+    def blocked():
+        release.wait(5)
+        return {"ok": True, "source": "llm"}
+    call, attempts = _calls(blocked)
+    late = []
+    delivered = threading.Event()
+
+    def on_late(result):
+        late.append(result)
+        delivered.set()
+
+    result, info = budget.run(call, _valid, _fallback, on_late_result=on_late)
+
+    assert result["source"] == "local"
+    assert info["provisional"] is True and info["hedged"] is True
+    assert late == [] and attempts == [0, 1]
+
+    release.set()
+    assert delivered.wait(5)
+    time.sleep(0.1)  # request hedge juga selesai -> tidak boleh dikirim lagi
+    assert late == [{"ok": True, "source": "llm"}]
+    stats = budget.stats()
+    assert (stats["provisional"], stats["late_results"]) == (1, 1)
+
+
+def test_hedge_delay_uses_p95_once_there_are_enough_samples():
+    budget = LatencyBudget("test", deadline=10.0, default_hedge_delay=3.0)
+    assert budget.p95() is None and budget.hedge_delay() == 3.0
+
+    for i in range(MIN_SAMPLES):
+        budget.record(1.0 if i < MIN_SAMPLES - 1 else 20.0)
+    assert budget.p95() == 20.0
+    # Hedge tetap harus sempat selesai sebelum deadline
+    assert budget.hedge_delay() == 7.5
+
+    for _ in range(MIN_SAMPLES * 2):
+        budget.record(0.8)
+    assert budget.hedge_delay() == 1.0
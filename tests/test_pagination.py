@@ -0,0 +1,56 @@
+# tests/test_pagination.py
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+import app.databases as databases
+from app.extensions import db
+from app.models import Candidate
+from app.services.pagination import decode_cursor, encode_cursor, page_size
+from config import Config
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor({"match_score": Decimal("87.50"), "uploaded_at": datetime(2024, 5, 1, 8, 30), "id": "c-1"})
+    assert "=" not in cursor
+    assert decode_cursor(cursor, required_keys=("match_score", "id")) == {
+        "match_score": "87.50", "uploaded_at": "2024-05-01T08:30:00", "id": "c-1",
+    }
+
+
+def test_cursor_keeps_null_sort_key():
+    assert decode_cursor(encode_cursor({"match_score": None, "id": "c-9"})) == {"match_score": None, "id": "c-9"}
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", encode_cursor({"id": "c-1"}), "WzEsMl0"])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, required_keys=("match_score", "id"))
+
+
+def test_page_size():
+    assert page_size(None) == Config.DEFAULT_PAGE_SIZE
+    assert page_size("0") == 1
+    assert page_size(str(Config.MAX_PAGE_SIZE + 1)) == Config.MAX_PAGE_SIZE
+    with pytest.raises(ValueError):
+        page_size("abc")
+
+
+def test_keyset_pages_cover_ties_and_nulls_exactly_once(make_job):
+    job = make_job()
+    scores = [90, 80, 80, 80, None, 70, None]
+    for i, score in enumerate(scores):
+        db.session.add(Candidate(id=f"c{i}", job_id=job.id, status="passed_filter", match_score=score))
+    db.session.commit()
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = databases.get_candidates_page_for_job(job.id, limit=2, cursor=cursor)
+        seen.extend(row["id"] for row in page)
+        if not cursor:
+            break
+
+    expected = [c["id"] for c in databases.get_all_candidates_for_job(job.id)]
+    assert seen == expected
+    assert len(set(seen)) == len(scores)
@@ -0,0 +1,54 @@
+# tests/test_ranked_candidates.py
+from decimal import Decimal
+
+import pytest
+
+import app.databases as databases
+from app.extensions import db
+from app.models import Candidate, CandidateSkill
+from app.services.skill_dictionary import SKILL_DICTIONARY
+
+
+@pytest.fixture
+def ranked_job(make_job):
+    job = make_job()
+    rows = [
+        ("c1", "passed_filter", 90, Decimal("3.80"), 5, ["Python", "SQL"]),
+        ("c2", "passed_filter", 80, Decimal("3.10"), 2, ["ReactJS"]),
+        ("c3", "passed_filter", 70, None, None, ["SQL"]),
+        ("c4", "rejected", 95, Decimal("3.90"), 8, ["Python", "SQL"]),
+    ]
+    for candidate_id, status, score, gpa, experience, skills in rows:
+        db.session.add(Candidate(
+            id=candidate_id, job_id=job.id, status=status, match_score=score, gpa=gpa, total_experience=experience,
+        ))
+        db.session.flush()
+        for name in skills:
+            db.session.add(CandidateSkill(candidate_id=candidate_id, skill_id=SKILL_DICTIONARY.get_or_create(name)))
+    db.session.commit()
+    return job
+
+
+def _ids(job, filters):
+    return [c["id"] for c in databases.get_all_candidates_for_job(job.id, filters)]
+
+
+def test_only_passed_candidates_ordered_by_score(ranked_job):
+    assert _ids(ranked_job, None) == ["c1", "c2", "c3"]
+
+
+def test_range_filters(ranked_job):
+    assert _ids(ranked_job, {"min_gpa": "3.5"}) == ["c1"]
+    assert _ids(ranked_job, {"total_experience": "2"}) == ["c1", "c2"]
+
+
+def test_skills_require_all_and_resolve_aliases(ranked_job):
+    assert _ids(ranked_job, {"skills": "sql"}) == ["c1", "c3"]
+    assert _ids(ranked_job, {"skills": "SQL, python"}) == ["c1"]
+    assert _ids(ranked_job, {"skills": "react"}) == ["c2"]
+    assert _ids(ranked_job, {"skills": "Cobol"}) == []
+
+
+def test_invalid_filter_value_raises_value_error(ranked_job):
+    with pytest.raises(ValueError):
+        databases.get_all_candidates_for_job(ranked_job.id, {"min_gpa": "tinggi"})
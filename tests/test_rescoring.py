@@ -0,0 +1,134 @@
+# tests/test_rescoring.py
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from app.extensions import db
+from app.models import Candidate
+from app.services import job_features, rescoring
+from app.services.rescoring import apply_filters, get_progress, start_rescore
+from config import Config
+
+
+@pytest.fixture(autouse=True)
+def fake_keywords(monkeypatch):
+    monkeypatch.setattr(job_features, "extract_jd_keywords", lambda text: [])
+
+
+def _add(job, candidate_id, status="passed_filter", gpa=None, experience=None, education=None,
+         ratio=None, reason=None):
+    db.session.add(Candidate(
+        id=candidate_id, job_id=job.id, status=status, gpa=gpa, total_experience=experience,
+        education=education, skill_match_ratio=ratio, rejection_reason=reason, match_score=50,
+        scoring_stage="local" if status == "passed_filter" else None,
+    ))
+
+
+def _state(candidate_id):
+    candidate = db.session.get(Candidate, candidate_id)
+    return candidate.status, candidate.rejection_reason
+
+
+def test_filter_case_checks_in_upload_order(make_job):
+    job = make_job(min_gpa=Decimal("3.00"), min_experience=2, degree_requirements="S1")
+    _add(job, "ok", gpa=Decimal("3.50"), experience=3, education="S1 Informatika")
+    _add(job, "low-gpa", gpa=Decimal("2.80"), experience=0, education="SMA")
+    _add(job, "no-gpa", gpa=None, experience=5, education="S2 Statistika")
+    _add(job, "junior", gpa=Decimal("3.20"), experience=1, education="S1 Informatika")
+    _add(job, "diploma", gpa=Decimal("3.20"), experience=4, education="D3 Akuntansi")
+    _add(job, "unknown-edu", gpa=Decimal("3.20"), experience=4, education=None)
+    db.session.commit()
+
+    newly_rejected, newly_passed = apply_filters(job)
+    db.session.expire_all()
+
+    assert (newly_rejected, newly_passed) == (5, [])
+    assert _state("ok") == ("passed_filter", None)
+    assert _state("low-gpa") == ("rejected", "GPA below minimum requirement (3.00)")
+    assert _state("no-gpa") == ("rejected", "GPA below minimum requirement (3.00)")
+    assert _state("junior") == ("rejected", "Experience below minimum requirement (2 years)")
+    assert _state("diploma") == ("rejected", "Education below minimum requirement (S1)")
+    assert _state("unknown-edu") == ("rejected", "Education below minimum requirement (S1)")
+    assert db.session.get(Candidate, "junior").match_score is None
+
+
+def test_relaxed_filter_reopens_only_automatic_rejections(make_job):
+    job = make_job(min_gpa=Decimal("3.50"))
+    _add(job, "auto", status="rejected", gpa=Decimal("3.20"), reason="GPA below minimum requirement (3.50)")
+    _add(job, "manual", status="rejected", gpa=Decimal("3.90"), reason="Not a culture fit")
+    _add(job, "still-low", status="rejected", gpa=Decimal("2.10"), reason="GPA below minimum requirement (3.50)")
+    db.session.commit()
+
+    job.min_gpa = Decimal("3.00")
+    db.session.commit()
+    newly_rejected, newly_passed = apply_filters(job)
+    db.session.expire_all()
+
+    assert (newly_rejected, newly_passed) == (0, ["auto"])
+    assert _state("auto") == ("passed_filter", None)
+    assert _state("manual") == ("rejected", "Not a culture fit")
+    # Masih ditolak, tapi alasan ikut batas yang baru
+    assert _state("still-low") == ("rejected", "GPA below minimum requirement (3.00)")
+
+
+def test_no_filters_reopens_every_automatic_rejection(make_job):
+    job = make_job()
+    _add(job, "auto", status="rejected", reason="Experience below minimum requirement (3 years)")
+    db.session.commit()
+    assert apply_filters(job) == (0, ["auto"])
+
+
+def test_skill_match_ratio_filter(make_job, monkeypatch):
+    monkeypatch.setattr(Config, "MIN_SKILL_MATCH_RATIO", 50.0)
+    job = make_job(job_description="Python, SQL and Airflow")
+    _add(job, "match", ratio=Decimal("66.67"))
+    _add(job, "weak", ratio=Decimal("33.33"))
+    db.session.commit()
+
+    apply_filters(job)
+    db.session.expire_all()
+    assert _state("match") == ("passed_filter", None)
+    assert _state("weak") == ("rejected", "Skill match below minimum requirement (50.0%)")
+
+
+def _wait_until_done(job_id):
+    deadline = time.monotonic() + 5
+    while get_progress(job_id)["state"] != "done" and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_edit_during_a_run_queues_one_merged_follow_up(app, monkeypatch):
+    release = threading.Event()
+    runs = []
+
+    def fake_rescore(job_id, jd_changed=True):
+        runs.append(jd_changed)
+        release.wait(5)
+
+    monkeypatch.setattr(rescoring, "rescore_job", fake_rescore)
+    monkeypatch.setattr(rescoring, "_progress", {})
+    monkeypatch.setattr(rescoring, "_follow_ups", {})
+
+    started, progress = start_rescore("job-1", jd_changed=False)
+    assert started and progress["state"] == "queued"
+
+    # Tanpa queue_if_running: ditolak, tidak ada follow-up
+    assert start_rescore("job-1", jd_changed=True)[0] is False
+    assert get_progress("job-1")["follow_up_queued"] is False
+
+    started, progress = start_rescore("job-1", jd_changed=False, queue_if_running=True)
+    assert not started and progress["follow_up_queued"]
+    start_rescore("job-1", jd_changed=True, queue_if_running=True)
+    start_rescore("job-1", jd_changed=False, queue_if_running=True)
+    release.set()
+
+    _wait_until_done("job-1")
+
+    # Satu run awal + satu follow-up gabungan dengan jd_changed di-OR
+    assert runs == [False, True]
+    progress = get_progress("job-1")
+    assert progress["state"] == "done" and progress["jd_changed"] is True and not progress["follow_up_queued"]
+    assert start_rescore("job-1", jd_changed=False)[0] is True
+    _wait_until_done("job-1")
@@ -0,0 +1,73 @@
+# tests/test_rubric_scorer.py
+import pytest
+
+from app.services.rubric_scorer import (
+    RELEVANCE_WEIGHT, _experience_years, _quality, score_cv_locally,
+)
+from app.services.term_stats import text_similarity
+
+CV = """Rina Putri
+rina@example.com
+
+Work Experience
+Data Engineer at Tokopedia (2021 - 2024)
+- Built Airflow pipelines that reduced report latency by 40%
+- Responsible for Python ETL jobs
+
+Skills
+Python, SQL, Tableau
+
+Education
+S1 Informatika, GPA: 3,65
+"""
+JD = "We need a Data Engineer with 3 years of experience in Airflow, Python, SQL and Kafka. S1 informatika."
+
+
+def _levels(result):
+    return {s["skill"]: s["level"] for s in result["ai_analysis"]["skills_analysis"]}
+
+
+def test_proof_levels_follow_the_cv_section():
+    result = score_cv_locally(CV, JD, "Data Engineer", skills=["Airflow", "Python", "SQL", "Kafka"])
+    assert _levels(result) == {
+        "Airflow": "Strong Evidence",
+        "Python": "Standard Context",
+        "SQL": "Listed Only",
+        "Kafka": "Missing",
+    }
+    relevance = result["ai_analysis"]["rubric_scores"]["relevance_score"]
+    assert relevance == pytest.approx(RELEVANCE_WEIGHT * (10 + 7.5 + 5 + 0) / 40)
+
+
+def test_mandatory_checks_and_output_shape():
+    result = score_cv_locally(CV, JD, "Data Engineer", skills=["Airflow"])
+    checks = result["ai_analysis"]["mandatory_checks"]
+    assert checks["gpa"] == {"value": "3.65", "status": "PASS"}
+    assert checks["major"]["status"] == "PASS"
+    assert checks["experience_years"] == {"value": "3", "status": "PASS"}
+    assert set(result) == {"lulus", "skor_akhir", "ai_analysis", "job_info"}
+    assert 0 <= result["skor_akhir"] <= 100
+
+
+def test_missing_experience_caps_the_score():
+    result = score_cv_locally(CV, "Senior role, 8 years experience with Airflow", "Senior Data Engineer", skills=["Airflow"])
+    assert result["ai_analysis"]["mandatory_checks"]["experience_years"]["status"] == "FAIL"
+    assert result["skor_akhir"] <= 30.0
+
+
+def test_without_known_skills_relevance_falls_back_to_text_similarity():
+    result = score_cv_locally(CV, JD, "Data Engineer", skills=[])
+    expected = RELEVANCE_WEIGHT * min(1.0, text_similarity(CV, JD) / 50)
+    assert result["ai_analysis"]["rubric_scores"]["relevance_score"] == pytest.approx(expected, abs=0.01)
+
+
+def test_experience_years_merges_overlapping_ranges():
+    assert _experience_years("2018 - 2020\n2019 - 2021\n2023 - present", 2025) == 5
+    assert _experience_years("1990 - 2099", 2025) == 0
+
+
+def test_quality():
+    assert _quality([]) == (0.0, 0.0, 0.0)
+    score, verb_ratio, metric_ratio = _quality(["led migration saving 20 hours per week", "helped the team"])
+    assert (verb_ratio, metric_ratio) == (0.25, 0.5)
+    assert score == pytest.approx(20 * (0.5 * 0.5 + 0.5 * 1.0))
@@ -0,0 +1,29 @@
+# tests/test_save_candidate.py
+import app.databases as databases
+from app.extensions import db
+from app.models import Candidate
+
+
+def _broken(*args, **kwargs):
+    raise RuntimeError("hook down")
+
+
+def test_failing_hook_does_not_fail_the_save(make_job, monkeypatch):
+    job = make_job()
+    monkeypatch.setattr(databases.LEADERBOARDS, "on_candidate_saved", _broken)
+    monkeypatch.setattr(databases.CANDIDATE_INDEX, "add_candidate", _broken)
+
+    candidate_id = databases.save_candidate(job.id, {"name": "Budi", "status": "passed_filter", "skills": []})
+
+    assert candidate_id is not None
+    assert db.session.get(Candidate, candidate_id).name == "Budi"
+
+
+def test_db_error_rolls_back_and_returns_none(make_job, monkeypatch):
+    job = make_job()
+    monkeypatch.setattr(db.session, "flush", _broken)
+
+    assert databases.save_candidate(job.id, {"name": "Budi", "skills": []}) is None
+
+    monkeypatch.undo()
+    assert Candidate.query.count() == 0
@@ -0,0 +1,31 @@
+# tests/test_search_endpoint.py
+import pytest
+
+from app.json_provider import FastJSONProvider
+from app.routes import hr_routes
+
+
+@pytest.fixture
+def client(app, monkeypatch):
+    app.json = FastJSONProvider(app)
+    app.register_blueprint(hr_routes.hr_bp)
+    results = [{"id": f"c{i}", "name": f"Candidate {i}"} for i in range(3)]
+    monkeypatch.setattr(hr_routes, "search_candidates", lambda keyword, filters: results)
+    monkeypatch.setattr(hr_routes, "search_candidates_with_facets", lambda keyword, filters: (results, {"status": {"passed_filter": 3}}))
+    return app.test_client()
+
+
+def test_search_results_are_streamed_in_the_usual_envelope(client):
+    response = client.get("/api/hr/candidates/search?q=python")
+
+    assert response.is_streamed
+    assert response.get_json() == {
+        "status": "success",
+        "message": "3 candidate found with the keyword 'python'",
+        "data": [{"id": "c0", "name": "Candidate 0"}, {"id": "c1", "name": "Candidate 1"}, {"id": "c2", "name": "Candidate 2"}],
+    }
+
+
+def test_search_with_facets(client):
+    body = client.get("/api/hr/candidates/search?q=python&facets=true").get_json()
+    assert len(body["data"]) == 3 and body["facets"] == {"status": {"passed_filter": 3}}
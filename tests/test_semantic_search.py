@@ -0,0 +1,66 @@
+# tests/test_semantic_search.py
+import json
+
+from app.extensions import db
+from app.models import Candidate, CandidateSkill, Skill
+from app.services.semantic_search import CandidateVectorIndex, candidate_document
+
+PROFILES = {
+    "c-data": (["Data Engineer at Tokopedia (2020 - 2023)"], ["Apache Spark", "Airflow"], "S1 Teknik Informatika"),
+    "c-finance": (["Accountant at Bank Mandiri (2019 - 2022)"], ["Excel", "Tax Reporting"], "S1 Akuntansi"),
+    "c-design": (["UI Designer at Gojek (2021 - 2024)"], ["Figma", "Prototyping"], "D3 Desain Grafis"),
+}
+
+
+def _seed(job):
+    for candidate_id, (experience, skills, education) in PROFILES.items():
+        db.session.add(Candidate(
+            id=candidate_id, job_id=job.id, name=candidate_id,
+            experience=json.dumps(experience), education=education,
+        ))
+        for name in skills:
+            skill = Skill(skill_name=name, normalized_key=name.lower())
+            db.session.add(skill)
+            db.session.flush()
+            db.session.add(CandidateSkill(candidate_id=candidate_id, skill_id=skill.id))
+    db.session.commit()
+
+
+def test_candidate_document_accepts_json_and_plain_experience():
+    assert candidate_document('["A at B"]', ["SQL"], "S1") == "A at B\nSQL\nS1"
+    assert candidate_document("not json", None, None) == "not json"
+
+
+def test_build_and_search(make_job):
+    job = make_job()
+    _seed(job)
+    index = CandidateVectorIndex()
+    index.build()
+
+    hits = index.search("spark airflow data pipelines", k=2)
+    assert hits[0][0] == "c-data"
+    assert index.search("figma", job_id="other-job") == []
+
+
+def test_stale_index_schedules_build_instead_of_building_inline(make_job, monkeypatch):
+    job = make_job()
+    _seed(job)
+    index = CandidateVectorIndex()
+    scheduled = []
+    monkeypatch.setattr(index, "schedule_build", lambda: scheduled.append(True))
+
+    assert index.search("spark") == []
+    assert scheduled == [True]
+
+
+def test_adds_during_build_are_replayed_after_swap(make_job):
+    job = make_job()
+    _seed(job)
+    index = CandidateVectorIndex()
+    index._building = True
+    # Belum ada vectorizer -> hanya diantrekan, diterapkan saat _build() swap index baru
+    index.add_candidate("c-late", job.id, '["Data Engineer at Traveloka"]', ["Apache Spark"], None)
+    index._build()
+
+    assert "c-late" in index._row_of
+    assert "c-late" in [candidate_id for candidate_id, _ in index.search("spark data engineer", k=5)]
@@ -0,0 +1,63 @@
+# tests/test_skill_dictionary.py
+import pytest
+
+from app.extensions import db
+from app.models import Skill, SkillAlias
+from app.services.skill_dictionary import SkillDictionary, display_name, skill_key
+
+
+@pytest.mark.parametrize("name, key", [
+    ("Node.js", "nodejs"),
+    ("NodeJS", "nodejs"),
+    ("node js", "nodejs"),
+    ("C++", "c++"),
+    ("C#", "c#"),
+    ("ReactJS", "react"),
+    ("Golang", "go"),
+    ("K8s", "kubernetes"),
+    ("Microsoft Excel", "excel"),
+    ("Google Cloud", "googlecloudplatform"),
+    ("REST", "restapi"),
+    ("", ""),
+    (None, ""),
+])
+def test_skill_key(name, key):
+    assert skill_key(name) == key
+
+
+def test_display_name_keeps_original_casing():
+    assert display_name("  machine   learning ") == "Machine Learning"
+    assert display_name("SQL") == "SQL"
+    assert display_name("Node.js") == "Node.js"
+
+
+def test_get_or_create_merges_spelling_variants(app):
+    dictionary = SkillDictionary()
+    first = dictionary.get_or_create("Node.js")
+    assert dictionary.get_or_create("nodejs") == first
+    assert dictionary.get_or_create("Node") == first
+    assert Skill.query.count() == 1
+    assert Skill.query.one().skill_name == "Node.js"
+    assert dictionary.get_or_create("   ") is None
+
+
+def test_resolve_uses_alias_table_and_sees_rows_added_after_load(app):
+    dictionary = SkillDictionary()
+    dictionary.load()
+
+    skill = Skill(skill_name="Power BI", normalized_key="powerbi")
+    db.session.add(skill)
+    db.session.flush()
+    db.session.add(SkillAlias(alias_key="pbi", skill_id=skill.id))
+    db.session.commit()
+
+    assert dictionary.resolve("Power-BI") == skill.id
+    assert dictionary.resolve("PBI") == skill.id
+    assert dictionary.resolve("Tableau") is None
+
+
+def test_match_ids_falls_back_to_prefix(app):
+    dictionary = SkillDictionary()
+    ids = {dictionary.get_or_create(name) for name in ("PostgreSQL", "Postman", "Python")}
+    assert set(dictionary.match_ids("post")) == ids - {dictionary.resolve("Python")}
+    assert dictionary.match_ids("psql") == [dictionary.resolve("PostgreSQL")]
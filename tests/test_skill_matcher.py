@@ -0,0 +1,94 @@
+# tests/test_skill_matcher.py
+from decimal import Decimal
+
+import pytest
+
+from app.extensions import db
+from app.models import Candidate, CandidateDocument, Skill, SkillAlias
+from app.services import job_features
+from app.services.rescoring import refresh_skill_ratios
+from app.services.skill_dictionary import SKILL_DICTIONARY
+from app.services.skill_matcher import (
+    AhoCorasick, JobSkillMatcherRegistry, SkillMatcher, invalidate_vocabulary, match_job_skills,
+    pattern_variants, skill_match_ratio, skills_in_text,
+)
+
+
+def test_aho_corasick_reports_overlapping_and_suffix_matches():
+    automaton = AhoCorasick({"he": "HE", "she": "SHE", "hers": "HERS", "his": "HIS"})
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, "SHE"), (2, 4, "HE"), (2, 6, "HERS")]
+    assert list(AhoCorasick({}).iter_matches("anything")) == []
+
+
+def test_pattern_variants():
+    assert pattern_variants("Node.js") >= {"node.js", "nodejs", "node js"}
+    assert "power-bi" in pattern_variants("Power BI")
+    assert pattern_variants("R") == set()
+
+
+def test_matches_only_on_word_boundaries():
+    matcher = SkillMatcher({"Java": ["Java"], "SQL": ["SQL"], "C++": ["C++"]})
+    assert matcher.matched("JavaScript, NoSQL and MySQLdb") == []
+    assert matcher.matched("Java (Spring), SQL; C++.") == ["Java", "SQL", "C++"]
+
+
+def test_longest_match_wins_and_offsets_are_reported():
+    matcher = SkillMatcher({"Data Analysis": ["Data Analysis"], "Analysis": ["Analysis"], "Node.js": ["Node.js", "nodejs"]})
+    text = "Data analysis with NodeJS; root cause analysis; node js"
+    assert matcher.find(text) == {"Data Analysis": [0], "Node.js": [19, 48], "Analysis": [38]}
+
+
+def test_skill_match_ratio():
+    assert skill_match_ratio(["SQL", "Python"], ["SQL", "Python", "Airflow"]) == 66.67
+    assert skill_match_ratio(["SQL", "SQL"], ["SQL"]) == 100.0
+    assert skill_match_ratio(["SQL"], []) is None
+
+
+def test_registry_recompiles_only_when_job_skills_change():
+    registry = JobSkillMatcherRegistry(max_jobs=1)
+    first = registry.get("job-1", ["SQL"])
+    assert registry.get("job-1", ["SQL"]) is first
+    assert registry.get("job-1", ["SQL", "Python"]) is not first
+    registry.get("job-2", ["SQL"])
+    assert list(registry._matchers) == ["job-2"]
+
+
+def test_vocabulary_includes_db_skills_and_aliases_but_not_ambiguous_terms(app):
+    skill = Skill(skill_name="dbt", normalized_key="dbt")
+    db.session.add(skill)
+    db.session.flush()
+    db.session.add(SkillAlias(alias_key="databuildtool", skill_id=skill.id))
+    db.session.commit()
+    invalidate_vocabulary()
+
+    found = skills_in_text("Modelling with DataBuildTool and Postgres, golang services")
+    assert [name.lower() for name in found] == ["dbt", "postgresql"]
+    assert skills_in_text("Let's go and rest, then express ideas") == []
+
+
+def test_vocabulary_ignores_parsed_skills_without_aliases(app):
+    for name in ("Developer", "Leadership", "Team Player"):
+        SKILL_DICTIONARY.get_or_create(name)
+    invalidate_vocabulary()
+
+    assert skills_in_text("Senior Developer with Leadership, a Team Player who knows SQL") == ["SQL"]
+
+
+def test_match_job_skills_accepts_aliases(app):
+    matched, ratio = match_job_skills("job-1", ["PostgreSQL", "Kubernetes"], "Ran postgres on k8s clusters")
+    assert matched == ["PostgreSQL"]
+    assert ratio == 50.0
+
+
+def test_refresh_skill_ratios_updates_changed_rows_only(make_job, monkeypatch):
+    monkeypatch.setattr(job_features, "extract_jd_keywords", lambda text: [])
+    job = make_job(job_description="Python, SQL and Airflow")
+    texts = {"full": ("Python SQL Airflow", None), "half": ("Python only", Decimal("33.33")), "none": ("Figma", Decimal("10"))}
+    for candidate_id, (text, ratio) in texts.items():
+        db.session.add(Candidate(id=candidate_id, job_id=job.id, status="passed_filter", skill_match_ratio=ratio))
+        db.session.add(CandidateDocument(candidate_id=candidate_id, job_id=job.id, text=text))
+    db.session.commit()
+
+    assert refresh_skill_ratios(job) == 2
+    db.session.expire_all()
+    assert {c.id: float(c.skill_match_ratio) for c in Candidate.query} == {"full": 100.0, "half": 33.33, "none": 0.0}
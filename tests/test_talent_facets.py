@@ -0,0 +1,63 @@
+# tests/test_talent_facets.py
+from decimal import Decimal
+
+import pytest
+
+from app.extensions import db
+from app.models import Candidate, CandidateSkill, Skill
+from app.services.talent_facets import (
+    EXPERIENCE_BUCKETS, GPA_BUCKETS, UNKNOWN, _bucket, education_level, facets_in_memory, facets_sql,
+)
+
+ROWS = [
+    # id, status, education, gpa, total_experience, skills
+    ("c1", "passed_filter", "S1 Teknik Informatika", Decimal("3.75"), 4, ["SQL", "Python"]),
+    ("c2", "passed_filter", "Master of Data Science", Decimal("3.20"), 0, ["SQL"]),
+    ("c3", "rejected", "Diploma Akuntansi", Decimal("2.40"), 12, []),
+    ("c4", "rejected", None, None, None, ["Excel"]),
+    ("c5", "processing", "SMA Negeri 1", Decimal("3.00"), 1, ["SQL", "Excel"]),
+]
+
+
+@pytest.mark.parametrize("education, level", [
+    ("S2 Magister Manajemen", "S2"),
+    ("Bachelor of Science", "S1"),
+    ("PhD in Physics", "S3"),
+    ("D3 Diploma", "D3"),
+    ("SMA", "Other"),
+    (None, UNKNOWN),
+])
+def test_education_level(education, level):
+    assert education_level(education) == level
+
+
+def test_bucket_bounds():
+    assert _bucket(2.5, GPA_BUCKETS) == "2.50 - 2.99"
+    assert _bucket(Decimal("3.49"), GPA_BUCKETS) == "3.00 - 3.49"
+    assert _bucket(10, EXPERIENCE_BUCKETS) == "10+ tahun"
+    assert _bucket(None, EXPERIENCE_BUCKETS) == UNKNOWN
+
+
+def test_sql_facets_match_in_memory_facets(make_job):
+    job = make_job()
+    skills = {}
+    for candidate_id, status, education, gpa, experience, names in ROWS:
+        db.session.add(Candidate(
+            id=candidate_id, job_id=job.id, status=status, education=education, gpa=gpa, total_experience=experience,
+        ))
+        for name in names:
+            if name not in skills:
+                skills[name] = Skill(skill_name=name, normalized_key=name.lower())
+                db.session.add(skills[name])
+                db.session.flush()
+            db.session.add(CandidateSkill(candidate_id=candidate_id, skill_id=skills[name].id))
+    db.session.commit()
+
+    in_memory = facets_in_memory([
+        {"id": cid, "status": status, "university": education, "gpa": gpa, "total_experience": exp, "skills": names}
+        for cid, status, education, gpa, exp, names in ROWS
+    ])
+    in_sql = facets_sql([row[0] for row in ROWS])
+
+    assert in_sql == in_memory
+    assert in_memory["skills"][0] == {"value": "SQL", "count": 3}
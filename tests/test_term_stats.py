@@ -0,0 +1,99 @@
+# tests/test_term_stats.py
+import math
+from decimal import Decimal
+
+import pytest
+
+from app.extensions import db
+from app.models import Candidate, CandidateDocument, JobTerm, JobTermStats
+from app.services.leaderboard import LEADERBOARDS
+from app.services.term_stats import (
+    TermStatsStore, cosine_score, idf, term_counts, text_hash, text_similarity,
+)
+
+JD = "Data engineer with Python, SQL and Airflow pipelines"
+CVS = {
+    "c-local": "Python SQL Airflow data pipelines engineer",
+    "c-llm": "Python data engineer",
+    "c-rejected": "Graphic designer Figma",
+}
+
+
+def test_idf_matches_sklearn_smoothing():
+    assert idf(0, 0) == 1.0
+    assert idf(9, 4) == pytest.approx(math.log(10 / 5) + 1)
+
+
+def test_cosine_score():
+    job = term_counts(JD)
+    assert cosine_score(job, job, 5, {}) == 100.0
+    assert cosine_score(term_counts("figma sketch"), job, 5, {}) == 0.0
+    assert cosine_score({}, job, 5, {}) == 0.0
+    # Term yang muncul di semua dokumen berbobot lebih kecil -> skor turun
+    cv = {"python": 1, "figma": 1}
+    rare_python = cosine_score(cv, {"python": 1}, 10, {"python": 1, "figma": 9})
+    common_python = cosine_score(cv, {"python": 1}, 10, {"python": 9, "figma": 1})
+    assert rare_python > common_python
+
+
+def test_text_similarity_uses_plain_term_frequency():
+    assert text_similarity(JD, JD) == 100.0
+    assert text_similarity("", JD) == 0.0
+    assert text_similarity("python sql", "python sql excel") == pytest.approx(round(2 / math.sqrt(6) * 100, 2))
+
+
+def test_drift():
+    store = TermStatsStore()
+    stats = JobTermStats(doc_count=10, idf_snapshot={"python": idf(10, 5), "sql": idf(10, 5)})
+    job_terms = {"python": 1, "sql": 1}
+
+    assert store._drift(stats, job_terms, {"python": 5, "sql": 5}) == 0.0
+    assert store._drift(stats, {}, {}) == 0.0
+    assert store._drift(JobTermStats(doc_count=1, idf_snapshot={}), job_terms, {}) == float("inf")
+    # Term JD baru (tidak ada di snapshot) dihitung sebagai perubahan 100%
+    assert store._drift(stats, {"python": 1, "kafka": 1}, {"python": 5}) == pytest.approx(0.5)
+
+    shifted = store._drift(stats, job_terms, {"python": 1, "sql": 5})
+    expected = abs(idf(10, 1) - idf(10, 5)) / idf(10, 5) / 2
+    assert shifted == pytest.approx(expected)
+
+
+def test_renormalize_refreshes_local_match_scores_only(make_job, monkeypatch):
+    job = make_job(job_description=JD)
+    # Statistik dengan hash JD lama -> renormalize me-rebuild document frequency dari dokumen tersimpan
+    db.session.add(JobTermStats(job_id=job.id, doc_count=1, job_text_hash=text_hash("JD lama"), idf_snapshot={}))
+    db.session.add(JobTerm(job_id=job.id, term="lama", doc_frequency=1))
+    stages = {"c-local": ("passed_filter", "local"), "c-llm": ("passed_filter", "llm"), "c-rejected": ("rejected", None)}
+    for candidate_id, text in CVS.items():
+        status, stage = stages[candidate_id]
+        db.session.add(Candidate(id=candidate_id, job_id=job.id, status=status, scoring_stage=stage, match_score=Decimal("1.00")))
+        db.session.add(CandidateDocument(
+            candidate_id=candidate_id, job_id=job.id, text=text, text_hash=text_hash(text),
+            term_counts=term_counts(text), local_score=Decimal("1.00"),
+        ))
+    db.session.commit()
+    reloaded = []
+    monkeypatch.setattr(LEADERBOARDS, "reload", reloaded.append)
+
+    assert TermStatsStore().renormalize(job.id) == 3
+
+    frequencies = {"python": 3, "data": 3, "engineer": 3, "sql": 2, "airflow": 2, "pipelines": 2}
+    assert dict(db.session.query(JobTerm.term, JobTerm.doc_frequency).filter(
+        JobTerm.term.in_(list(frequencies)))) == frequencies
+    stats = db.session.get(JobTermStats, job.id)
+    assert stats.doc_count == 4
+    assert stats.idf_snapshot["python"] == pytest.approx(idf(4, 3))
+
+    expected = cosine_score(term_counts(CVS["c-local"]), term_counts(JD), 4, dict(
+        db.session.query(JobTerm.term, JobTerm.doc_frequency).filter(JobTerm.job_id == job.id).all()
+    ))
+    local = db.session.get(Candidate, "c-local")
+    assert float(local.match_score) == pytest.approx(expected, abs=0.01)
+    assert float(db.session.get(CandidateDocument, "c-local").local_score) == pytest.approx(expected, abs=0.01)
+    # Skor LLM dan kandidat tanpa stage tidak ditimpa
+    assert db.session.get(Candidate, "c-llm").match_score == Decimal("1.00")
+    assert db.session.get(Candidate, "c-rejected").match_score == Decimal("1.00")
+    assert reloaded == [job.id]
+    db.session.refresh(job)
+    assert job.candidates_version == 1
+    assert TermStatsStore().drift(job.id) == 0.0
@@ -0,0 +1,62 @@
+# tests/test_tfidf_scorer.py
+import random
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.services.term_stats import cosine_score, idf, term_counts
+from app.services.tfidf_scorer import JobTfidfScorer
+
+VOCABULARY = ["python", "sql", "spark", "airflow", "dashboard", "excel", "stakeholder", "kafka", "docker", "tableau"]
+
+
+@pytest.fixture
+def corpus():
+    random.seed(7)
+    job = " ".join(random.choice(VOCABULARY[:6]) for _ in range(40))
+    cvs = [" ".join(random.choice(VOCABULARY) for _ in range(random.randint(0, 60))) for _ in range(30)]
+    return job, cvs
+
+
+def _stats(documents):
+    frequencies = {}
+    for counts in documents:
+        for term in counts:
+            frequencies[term] = frequencies.get(term, 0) + 1
+    return len(documents), frequencies
+
+
+def test_matches_cosine_score_per_pair(corpus):
+    job, cvs = corpus
+    job_counts, cv_counts = term_counts(job), [term_counts(cv) for cv in cvs]
+    doc_count, frequencies = _stats([job_counts] + cv_counts)
+
+    scorer = JobTfidfScorer(job_counts, lambda term: idf(doc_count, frequencies.get(term, 0)))
+
+    expected = [cosine_score(counts, job_counts, doc_count, frequencies) for counts in cv_counts]
+    assert scorer.score_many(cv_counts).tolist() == pytest.approx(expected, abs=0.01)
+    assert scorer.score(cv_counts[0]) == pytest.approx(expected[0], abs=0.01)
+
+
+def test_matches_sklearn_fitted_on_the_whole_corpus(corpus):
+    job, cvs = corpus
+    job_counts, cv_counts = term_counts(job), [term_counts(cv) for cv in cvs]
+    doc_count, frequencies = _stats([job_counts] + cv_counts)
+
+    matrix = TfidfVectorizer(stop_words="english").fit_transform([job] + cvs)
+    expected = np.round(cosine_similarity(matrix[1:], matrix[0:1]).ravel() * 100, 2)
+
+    scorer = JobTfidfScorer(job_counts, lambda term: idf(doc_count, frequencies.get(term, 0)))
+    assert scorer.score_many(cv_counts) == pytest.approx(expected, abs=0.01)
+
+
+def test_empty_job_description_and_empty_cvs_score_zero():
+    assert JobTfidfScorer({}, lambda term: 1.0).score_many([{"python": 1}, {}]).tolist() == [0.0, 0.0]
+    assert JobTfidfScorer({"python": 1}, lambda term: 1.0).score_many([{}, None]).tolist() == [0.0, 0.0]
+    assert JobTfidfScorer({"python": 1}, lambda term: 1.0).score_many([]).tolist() == []
+
+
+def test_identical_document_scores_100():
+    assert JobTfidfScorer({"python": 2, "sql": 1}, lambda term: 1.5).score({"python": 2, "sql": 1}) == 100.0